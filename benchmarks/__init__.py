@@ -0,0 +1 @@
+"""Benchmarks de desempenho dos caminhos de preço, pedido e clientes."""
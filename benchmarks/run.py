@@ -0,0 +1,336 @@
+"""Suíte de benchmarks com baseline armazenado.
+
+Mede o custo por operação (ns/op) dos caminhos principais em vários
+tamanhos de dados e compara com `baseline.json`; qualquer caso mais lento
+que o baseline além da sua tolerância faz o comando falhar.
+
+Cada medida é a mediana de várias execuções (no mínimo `--rodadas`), e
+casos dominados por E/S têm tolerância própria (`TOLERANCIAS`). A origem
+de cada linha do baseline (host, execuções, data) fica em
+`baseline.origem.json`, ao lado do baseline.
+
+Uso (a partir da raiz do repositório):
+    python -m benchmarks.run                       # compara com o baseline
+    python -m benchmarks.run --tamanhos 1,10000    # apenas alguns tamanhos
+    python -m benchmarks.run --salvar              # grava um novo baseline
+    python -m benchmarks.run --rodadas 9           # mais execuções por medida
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.calculadora import PrecoCalculadora
+from src.models.clientes import ClienteRepositorio, Clientes, EscritorClientes
+from src.models.clientes_sqlite import ClienteRepositorioSQLite
+from src.services.pedido import processar_pedido
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+TAMANHOS = (1, 10_000, 1_000_000)
+LIMITE = 0.20
+RODADAS = 5
+
+# Casos que gravam em disco variam mais entre execuções que os de CPU;
+# a tolerância de um caso nunca é menor que `--limite`
+TOLERANCIAS: Dict[str, float] = {
+    "clientes.cadastrar": 0.50,
+    "clientes.cadastrar_lote": 0.50,
+    "clientes.salvar": 0.50,
+    "clientes.salvar_escritor": 0.50,
+    "clientes.sqlite_salvar_lote": 0.50,
+}
+
+PRODUTOS = ("diesel", "gasolina", "etanol", "lubrificante")
+CUPONS = (None, "MEGA10", "NOVO5", "LUB2")
+
+
+def gerar_pedidos(n: int) -> List[dict]:
+    """Pedidos determinísticos para os benchmarks."""
+    rnd = random.Random(42)
+    return [
+        {
+            "cliente": f"C{i}",
+            "produto": rnd.choice(PRODUTOS),
+            "qtd": rnd.randint(1, 2000),
+            "cupom": rnd.choice(CUPONS),
+        }
+        for i in range(n)
+    ]
+
+
+def gerar_clientes(n: int) -> List[dict]:
+    """Clientes determinísticos para os benchmarks."""
+    return [
+        {"nome": f"Cliente {i}", "email": f"cliente{i}@frota.com", "cnpj": 10_000 + i}
+        for i in range(n)
+    ]
+
+
+# Cada caso recebe o tamanho e um diretório temporário e devolve a função
+# medida; o preparo (geração de dados) fica fora da medição.
+
+def caso_calcular_preco(n: int, tmp: str) -> Callable[[], None]:
+    pedidos = [(p["produto"], p["qtd"]) for p in gerar_pedidos(n)]
+
+    def rodar():
+        for produto, qtd in pedidos:
+            PrecoCalculadora(produto, qtd).calcular_preco()
+    return rodar
+
+
+def caso_calcular_desconto(n: int, tmp: str) -> Callable[[], None]:
+    calculos = [
+        (PrecoCalculadora(p["produto"], p["qtd"]), p["cupom"]) for p in gerar_pedidos(n)
+    ]
+
+    def rodar():
+        for calc, cupom in calculos:
+            calc.calcular_desconto(cupom, 1000.0)
+    return rodar
+
+
+def caso_processar_pedido(n: int, tmp: str) -> Callable[[], None]:
+    pedidos = gerar_pedidos(n)
+
+    def rodar():
+        for p in pedidos:
+            processar_pedido(p)
+    return rodar
+
+
+def caso_cadastrar(n: int, tmp: str) -> Callable[[], None]:
+    clientes = [Clientes(c["email"], c["nome"], c["cnpj"]) for c in gerar_clientes(n)]
+
+    def rodar():
+        # `cadastrar` grava em clientes.txt no diretório corrente
+        anterior = os.getcwd()
+        os.chdir(tmp)
+        try:
+            for c in clientes:
+                c.cadastrar()
+        finally:
+            os.chdir(anterior)
+    return rodar
+
+
+def caso_cadastrar_lote(n: int, tmp: str) -> Callable[[], None]:
+    registros = gerar_clientes(n)
+
+    def rodar():
+        anterior = os.getcwd()
+        os.chdir(tmp)
+        try:
+            Clientes.cadastrar_lote(registros)
+        finally:
+            os.chdir(anterior)
+    return rodar
+
+
+def caso_salvar(n: int, tmp: str) -> Callable[[], None]:
+    clientes = gerar_clientes(n)
+    path = os.path.join(tmp, "salvar.txt")
+
+    def rodar():
+        for c in clientes:
+            ClienteRepositorio.salvar(c, path)
+    return rodar
+
+
+def caso_salvar_escritor(n: int, tmp: str) -> Callable[[], None]:
+    clientes = gerar_clientes(n)
+    path = os.path.join(tmp, "salvar_escritor.txt")
+
+    def rodar():
+        with EscritorClientes(path):
+            for c in clientes:
+                ClienteRepositorio.salvar(c, path)
+    return rodar
+
+
+def caso_carregar(n: int, tmp: str) -> Callable[[], None]:
+    path = os.path.join(tmp, "carregar.txt")
+    for c in gerar_clientes(n):
+        ClienteRepositorio.salvar(c, path)
+
+    def rodar():
+        ClienteRepositorio.carregar(path)
+    return rodar
+
+
+def caso_buscar(n: int, tmp: str) -> Callable[[], None]:
+    clientes = gerar_clientes(n)
+    path = os.path.join(tmp, "buscar.txt")
+    with EscritorClientes(path):
+        for c in clientes:
+            ClienteRepositorio.salvar(c, path)
+    cnpjs = [c["cnpj"] for c in clientes]
+    random.Random(42).shuffle(cnpjs)
+    ClienteRepositorio.buscar(cnpjs[0], path)  # cria o índice
+
+    def rodar():
+        for cnpj in cnpjs:
+            ClienteRepositorio.buscar(cnpj, path)
+    return rodar
+
+
+def caso_sqlite_salvar_lote(n: int, tmp: str) -> Callable[[], None]:
+    clientes = gerar_clientes(n)
+    repositorio = ClienteRepositorioSQLite(os.path.join(tmp, "salvar_lote.db"))
+
+    def rodar():
+        repositorio.salvar_lote(clientes)
+    return rodar
+
+
+def caso_sqlite_buscar(n: int, tmp: str) -> Callable[[], None]:
+    clientes = gerar_clientes(n)
+    repositorio = ClienteRepositorioSQLite(os.path.join(tmp, "buscar.db"))
+    repositorio.salvar_lote(clientes)
+    cnpjs = [c["cnpj"] for c in clientes]
+    random.Random(42).shuffle(cnpjs)
+
+    def rodar():
+        for cnpj in cnpjs:
+            repositorio.buscar(cnpj)
+    return rodar
+
+
+CASOS: Dict[str, Callable[[int, str], Callable[[], None]]] = {
+    "calculadora.calcular_preco": caso_calcular_preco,
+    "calculadora.calcular_desconto": caso_calcular_desconto,
+    "pedido.processar_pedido": caso_processar_pedido,
+    "clientes.cadastrar": caso_cadastrar,
+    "clientes.cadastrar_lote": caso_cadastrar_lote,
+    "clientes.salvar": caso_salvar,
+    "clientes.salvar_escritor": caso_salvar_escritor,
+    "clientes.carregar": caso_carregar,
+    "clientes.buscar": caso_buscar,
+    "clientes.sqlite_salvar_lote": caso_sqlite_salvar_lote,
+    "clientes.sqlite_buscar": caso_sqlite_buscar,
+}
+
+
+def medir(caso: str, n: int, rodadas: int = RODADAS) -> float:
+    """Mediana do tempo por operação (ns/op) entre pelo menos `rodadas` execuções."""
+    repeticoes = max(rodadas, min(200, 20_000 // n))
+    tempos = []
+    with tempfile.TemporaryDirectory() as tmp:
+        rodar = CASOS[caso](n, tmp)
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            rodar()
+            tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos) / n * 1e9
+
+
+def tolerancia(caso: str, limite: float = LIMITE) -> float:
+    """Regressão tolerada para o caso: a dele, se houver, ou `limite`."""
+    return max(limite, TOLERANCIAS.get(caso, 0.0))
+
+
+def comparar(
+    baseline: Dict[str, Dict[str, float]],
+    atual: Dict[str, Dict[str, float]],
+    limite: float = LIMITE,
+) -> List[Tuple[str, str, float, float]]:
+    """Casos (caso, tamanho, baseline, atual) mais lentos que a tolerância do caso."""
+    regressoes = []
+    for caso, tamanhos in atual.items():
+        maximo = 1 + tolerancia(caso, limite)
+        for tamanho, ns in tamanhos.items():
+            referencia = baseline.get(caso, {}).get(tamanho)
+            if referencia is not None and ns > referencia * maximo:
+                regressoes.append((caso, tamanho, referencia, ns))
+    return regressoes
+
+
+def caminho_origem(baseline: str) -> str:
+    """Arquivo com a origem das medidas, ao lado do baseline."""
+    return os.path.splitext(baseline)[0] + ".origem.json"
+
+
+def origem(rodadas: int) -> Dict[str, object]:
+    """Onde e como as medidas foram feitas."""
+    return {
+        "host": platform.node(),
+        "plataforma": platform.platform(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "rodadas": rodadas,
+        "data": time.strftime("%Y-%m-%d"),
+    }
+
+
+def _ler_json(path: str) -> Dict[str, Dict[str, object]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _gravar_json(path: str, dados: Dict[str, Dict[str, object]]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dados, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+
+
+def main(argv=None) -> int:
+    """Executa a suíte; retorna 1 se houver regressão."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tamanhos", default=",".join(map(str, TAMANHOS)))
+    parser.add_argument("--casos", default=",".join(CASOS))
+    parser.add_argument("--limite", type=float, default=LIMITE,
+                        help="regressão tolerada nos casos sem tolerância própria (0.20 = 20%%)")
+    parser.add_argument("--rodadas", type=int, default=RODADAS,
+                        help="execuções mínimas por medida (vale a mediana)")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--salvar", action="store_true",
+                        help="grava os resultados como novo baseline")
+    args = parser.parse_args(argv)
+
+    tamanhos = [int(t) for t in args.tamanhos.split(",")]
+    atual: Dict[str, Dict[str, float]] = {}
+    for caso in args.casos.split(","):
+        for n in tamanhos:
+            ns = medir(caso, n, args.rodadas)
+            atual.setdefault(caso, {})[str(n)] = round(ns, 1)
+            print(f"{caso:32} {n:>10} {ns:>12.1f} ns/op")
+
+    baseline = _ler_json(args.baseline)
+    origens = _ler_json(caminho_origem(args.baseline))
+
+    if args.salvar:
+        medicao = origem(args.rodadas)
+        for caso, resultados in atual.items():
+            baseline.setdefault(caso, {}).update(resultados)
+            origens.setdefault(caso, {}).update({tamanho: medicao for tamanho in resultados})
+        _gravar_json(args.baseline, baseline)
+        _gravar_json(caminho_origem(args.baseline), origens)
+        print("baseline salvo em", args.baseline)
+        return 0
+
+    host = platform.node()
+    outros = sorted({
+        o["host"] for caso in atual for tamanho, o in origens.get(caso, {}).items()
+        if tamanho in atual[caso] and o.get("host") != host
+    })
+    if outros:
+        print(f"AVISO: baseline medido em {', '.join(outros)}, não em {host}")
+
+    regressoes = comparar(baseline, atual, args.limite)
+    for caso, tamanho, referencia, ns in regressoes:
+        print(f"REGRESSÃO {caso} n={tamanho}: {referencia:.1f} -> {ns:.1f} ns/op")
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,14 @@
 """Main Module"""
 
+import argparse
+import logging
+
 from models.clientes import Clientes
+from services.agregacao import Agregador
+from services.estagios import PipelineEstagios, formatar_estatisticas
+from services.fluxo import processar_arquivo
 from services.pedido import processar_pedido
+from services.registro import configurar_log, encerrar_log, obter_logger, registrar
 
 pedidos = [
     {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
@@ -16,10 +23,53 @@ clientes = [
 ]
 
 
-def main():
+def _argumentos(argv=None):
+    """Argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description="Processamento PetroBahia")
+    parser.add_argument("--entrada", help="arquivo de pedidos (.jsonl ou .csv) para processar em fluxo")
+    parser.add_argument("--saida", default="resultados.jsonl", help="arquivo de resultados (.jsonl ou .csv)")
+    parser.add_argument("--workers", type=int, default=0, help="processos para precificar em paralelo (0 = sem pool)")
+    parser.add_argument("--tamanho-lote", type=int, default=10_000, help="pedidos por lote enviado a cada processo")
+    parser.add_argument("--estagios", action="store_true", help="leitura, precificação e escrita em threads com filas limitadas")
+    parser.add_argument("--tamanho-fila", type=int, default=64, help="blocos máximos em cada fila do modo em estágios")
+    parser.add_argument("--compacto", action="store_true", help="lê os pedidos como registros compactos (Pedido)")
+    parser.add_argument("--log-nivel", default="WARNING", help="nível do log JSON (DEBUG, INFO, WARNING...)")
+    parser.add_argument("--log-arquivo", help="arquivo do log JSON (padrão: stderr)")
+    parser.add_argument("--log-amostragem", type=float, default=1.0, help="fração de eventos abaixo de WARNING mantida")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Function main"""
+    args = _argumentos(argv)
+    configurar_log(args.log_nivel.upper(), args.log_arquivo, amostragem=args.log_amostragem)
+    try:
+        _processar(args)
+    finally:
+        encerrar_log()
+
+
+def _processar(args):
+    """Processamento da demonstração ou de um arquivo de pedidos."""
     print("==== Início processamento PetroBahia ====")
 
+    agregador = Agregador()
+
+    if args.entrada:
+        estagios = PipelineEstagios(tamanho_fila=args.tamanho_fila) if args.estagios else None
+        quantidade, _ = processar_arquivo(
+            args.entrada, args.saida, workers=args.workers,
+            tamanho_lote=args.tamanho_lote, agregador=agregador, compacto=args.compacto,
+            estagios=estagios,
+        )
+        print("pedidos processados:", quantidade, "-- resultados em", args.saida)
+        if estagios is not None:
+            for linha in formatar_estatisticas(estagios.resumo()):
+                print(" ", linha)
+        _imprimir_totais(agregador)
+        print("==== Fim processamento PetroBahia ====")
+        return
+
     for c in clientes:
         ok = c.cadastrar()
         if ok:
@@ -27,16 +77,24 @@ def main():
         else:
             print(f"cliente com problema: {c.nome}")
 
-    valores = []
+    log = obter_logger("main")
 
     for p in pedidos:
         v = processar_pedido(p)
-        valores.append(v)
-        print("pedido:", p, "-- valor final:", v)
+        agregador.adicionar(p, v)
+        if log.isEnabledFor(logging.INFO):
+            registrar(log, logging.INFO, "pedido", valor_final=v, **p)
 
-    print("TOTAL =", sum(valores))
+    _imprimir_totais(agregador)
     print("==== Fim processamento PetroBahia ====")
 
 
+def _imprimir_totais(agregador):
+    """Total geral e totais por produto."""
+    for produto, resumo in sorted(agregador.por("produto").items(), key=lambda item: str(item[0])):
+        print(f"  {produto}: {resumo['quantidade']} pedidos, total {resumo['total']:.2f}, média {resumo['media']:.2f}")
+    print("TOTAL =", agregador.total)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,87 @@
+"""Arredondamento Module
+
+Políticas de arredondamento do valor final de um pedido. Cada estratégia
+de preço declara a sua (`PrecoStrategy.arredondamento`), e a mesma
+política atende o cálculo escalar, o vetorizado e o modo em centavos.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.models.centavos import arredondar_para
+
+
+class Arredondamento:
+    """Política base: mantém o valor como está."""
+
+    __slots__ = ()
+
+    def aplicar(self, valor: float) -> float:
+        """Arredonda um valor em reais."""
+        return valor
+
+    def aplicar_lote(self, valores: np.ndarray) -> np.ndarray:
+        """Versão vetorizada de `aplicar`, idêntica ao caminho escalar."""
+        return valores
+
+    def aplicar_centavos(self, centavos):
+        """Arredonda um valor em centavos inteiros (escalar ou array)."""
+        return centavos
+
+
+class ArredondarReais(Arredondamento):
+    """Reais inteiros, com empate para o par (`round(valor, 0)`)."""
+
+    __slots__ = ()
+
+    def aplicar(self, valor: float) -> float:
+        return round(valor, 0)
+
+    def aplicar_lote(self, valores: np.ndarray) -> np.ndarray:
+        return np.round(valores, 0)
+
+    def aplicar_centavos(self, centavos):
+        return arredondar_para(centavos, 100)
+
+
+class ArredondarCentavos(Arredondamento):
+    """Centavos, com empate para o par (`round(valor, 2)`)."""
+
+    __slots__ = ()
+
+    def aplicar(self, valor: float) -> float:
+        return round(valor, 2)
+
+    def aplicar_lote(self, valores: np.ndarray) -> np.ndarray:
+        """Equivalente vetorizado e exato de `round(valor, 2)`.
+
+        `np.round` multiplica por 100 antes de arredondar, o que pode
+        divergir de `round` do Python perto de empates; esses casos são
+        refeitos no caminho escalar.
+        """
+        resultado = np.round(valores, 2)
+        escalado = valores * 100
+        distancia = np.abs(escalado - np.floor(escalado) - 0.5)
+        ambiguos = np.flatnonzero(distancia <= 1e-9 * np.maximum(np.abs(escalado), 1.0))
+        for i in ambiguos:
+            resultado[i] = round(float(valores[i]), 2)
+        return resultado
+
+
+class TruncarCentavos(Arredondamento):
+    """Centavos, descartando as frações de centavo."""
+
+    __slots__ = ()
+
+    def aplicar(self, valor: float) -> float:
+        return float(int(valor * 100) / 100.0)
+
+    def aplicar_lote(self, valores: np.ndarray) -> np.ndarray:
+        return np.trunc(valores * 100) / 100.0
+
+
+# Instâncias compartilhadas (as políticas não guardam estado)
+REAIS = ArredondarReais()
+CENTAVOS = ArredondarCentavos()
+TRUNCAR_CENTAVOS = TruncarCentavos()
@@ -5,102 +5,394 @@ e pode ser estendida sem modificar código existente.
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, Type, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Sequence, Type, Optional, Tuple
 
-BASES = {
+import numpy as np
+
+from src.models.arredondamento import CENTAVOS, REAIS, TRUNCAR_CENTAVOS, Arredondamento
+from src.models.centavos import para_centavos
+from src.models.cupons import buscar_cupom, versao_cupons
+from src.models.faixas import DEDUCAO, TabelaFaixas
+from src.models.tabela_precos import TabelaPrecos, _criar_bases, tabela_precos
+
+
+BASES = _criar_bases({
     "diesel": 3.99,
     "gasolina": 5.19,
     "etanol": 3.59,
     "lubrificante": 25.0,
-}
+})
 
 
 class PrecoStrategy(ABC):
-    """Interface para estratégias de cálculo de preço."""
+    """Interface para estratégias de cálculo de preço.
+
+    Estratégias não guardam estado: uma única instância de cada uma é
+    compartilhada por todas as calculadoras (flyweight).
+    """
+
+    __slots__ = ()
+
+    # Produto usado para cupons com escopo por produto
+    produto: Optional[str] = None
+
+    # Arredondamento do valor final do pedido (após o desconto)
+    arredondamento: Arredondamento = TRUNCAR_CENTAVOS
+
+    # Se um `aplicar_desconto` sobrescrito também aceita arrays NumPy; sem
+    # isso, as versões em lote o chamam item a item
+    desconto_vetorizado: bool = False
 
     @abstractmethod
     def calcular_preco(self, quantidade: int) -> float:
         """Calcula o preço com base na quantidade."""
 
     def aplicar_desconto(self, preco: float, cupom: Optional[str]) -> float:
-        """Descontos globais aplicáveis a vários produtos.
+        """Aplica o cupom consultando a tabela de cupons ativa.
 
         Estratégias específicas podem sobrescrever para regras próprias.
         """
-        if not cupom:
+        desconto = buscar_cupom(cupom, self.produto)
+        if desconto is None:
             return preco
+        return desconto.aplicar(preco)
+
+    def calcular_preco_tabela(self, quantidade: int, tabela: TabelaPrecos) -> float:
+        """Calcula o preço usando uma tabela de preços fixada.
 
-        if cupom == "MEGA10":
-            return preco - (preco * 0.10)
+        Estratégias que não dependem de preços base ignoram a tabela.
+        """
+        return self.calcular_preco(quantidade)
 
-        if cupom == "NOVO5":
-            return preco - (preco * 0.05)
+    def calcular_preco_lote(
+        self, quantidades: np.ndarray, tabela: Optional[TabelaPrecos] = None
+    ) -> np.ndarray:
+        """Versão vetorizada de `calcular_preco`.
 
-        return preco
+        A implementação padrão recorre ao cálculo escalar item a item;
+        estratégias concretas sobrescrevem com operações NumPy.
+        """
+        calcular = _metodo_efetivo(self, "calcular_preco_tabela")
+        return np.fromiter(
+            (calcular(int(q), tabela) for q in quantidades),
+            dtype=np.float64,
+            count=len(quantidades),
+        )
+
+    def aplicar_desconto_lote(self, precos: np.ndarray, cupons: np.ndarray) -> np.ndarray:
+        """Versão vetorizada de `aplicar_desconto`.
+
+        Os descontos são expressões aritméticas sobre o preço, então cada
+        cupom distinto é aplicado de uma vez sobre o sub-array de preços.
+        Um `aplicar_desconto` sobrescrito é chamado item a item, a menos
+        que a estratégia declare `desconto_vetorizado`.
+        """
+        return _por_cupom(_desconto_por_grupo(self, "aplicar_desconto_lote"), precos, cupons)
 
+    def aplicar_desconto_lote_codigos(
+        self, precos: np.ndarray, codigos: np.ndarray, cupons: Sequence[Optional[str]]
+    ) -> np.ndarray:
+        """Como `aplicar_desconto_lote`, com os cupons codificados por dicionário.
 
-class DieselStrategy(PrecoStrategy):
-    """Estratégia de preço para Diesel."""
+        `codigos` são índices em `cupons`; cada cupom distinto é resolvido
+        uma única vez. Quem sobrescreve `aplicar_desconto_lote` deve
+        sobrescrever este também.
+        """
+        return _por_codigo(_desconto_por_grupo(self, "aplicar_desconto_lote_codigos"), precos, codigos, cupons)
 
-    def calcular_preco(self, quantidade: int) -> float:
-        """Calcula o preço do diesel com base na quantidade."""
-        if quantidade > 1000:
-            return BASES["diesel"] * quantidade * 0.9
-        if quantidade > 500:
-            return BASES["diesel"] * quantidade * 0.95
-        return BASES["diesel"] * quantidade
+    def calcular_preco_centavos(self, quantidade: int, tabela: TabelaPrecos) -> int:
+        """Calcula o preço em centavos inteiros (modo exato).
 
+        A implementação padrão converte o preço em ponto flutuante;
+        estratégias concretas sobrescrevem com aritmética inteira.
+        """
+        return para_centavos(_metodo_efetivo(self, "calcular_preco_tabela")(quantidade, tabela))
 
-class GasolinaStrategy(PrecoStrategy):
-    """Estratégia de preço para Gasolina."""
+    def aplicar_desconto_centavos(self, centavos: int, cupom: Optional[str]) -> int:
+        """Aplica o cupom sobre um valor em centavos (escalar ou array).
 
-    def calcular_preco(self, quantidade: int) -> float:
-        """Calcula o preço da gasolina com base na quantidade."""
-        if quantidade > 200:
-            return (BASES["gasolina"] * quantidade) - 100
-        return BASES["gasolina"] * quantidade
+        Se a estratégia sobrescreve `aplicar_desconto` mas não este método,
+        o desconto passa por ele (convertido de e para centavos), para que
+        os modos em reais e em centavos deem o mesmo resultado.
+        """
+        if _desconto_sobrescrito(type(self), "aplicar_desconto_centavos"):
+            if isinstance(centavos, np.ndarray):
+                return _desconto_centavos_por_grupo(self)(centavos, cupom)
+            return para_centavos(self.aplicar_desconto(centavos / 100, cupom))
+        desconto = buscar_cupom(cupom, self.produto)
+        if desconto is None:
+            return centavos
+        return desconto.aplicar_centavos(centavos)
+
+    def calcular_preco_lote_centavos(
+        self, quantidades: np.ndarray, tabela: TabelaPrecos
+    ) -> np.ndarray:
+        """Versão vetorizada de `calcular_preco_centavos` (arrays `int64`)."""
+        calcular = _metodo_efetivo(self, "calcular_preco_centavos")
+        return np.fromiter(
+            (calcular(int(q), tabela) for q in quantidades),
+            dtype=np.int64,
+            count=len(quantidades),
+        )
+
+    def aplicar_desconto_lote_centavos(
+        self, centavos: np.ndarray, cupons: np.ndarray
+    ) -> np.ndarray:
+        """Versão vetorizada de `aplicar_desconto_centavos`."""
+        return _por_cupom(_desconto_centavos_por_grupo(self), centavos, cupons)
+
+    def aplicar_desconto_lote_codigos_centavos(
+        self, centavos: np.ndarray, codigos: np.ndarray, cupons: Sequence[Optional[str]]
+    ) -> np.ndarray:
+        """Versão em centavos de `aplicar_desconto_lote_codigos`."""
+        return _por_codigo(_desconto_centavos_por_grupo(self), centavos, codigos, cupons)
+
+
+class FaixasStrategy(PrecoStrategy):
+    """Estratégia baseada em preço base x quantidade e faixas de volume.
+
+    Subclasses apenas declaram `produto` (chave em `BASES`) e `faixas`; a
+    mesma tabela atende o cálculo escalar e o vetorizado.
+    """
 
+    __slots__ = ()
 
-class EtanolStrategy(PrecoStrategy):
-    """Estratégia de preço para Etanol."""
+    faixas = TabelaFaixas()
 
     def calcular_preco(self, quantidade: int) -> float:
-        """Calcula o preço do etanol com base na quantidade."""
-        preco = BASES["etanol"] * quantidade
-        if quantidade > 80:
-            preco = preco * 0.97
-        return preco
+        """Calcula o preço aplicando a faixa da quantidade."""
+        return self.calcular_preco_tabela(quantidade, tabela_precos())
 
+    def calcular_preco_tabela(self, quantidade: int, tabela: TabelaPrecos) -> float:
+        """Calcula o preço com o preço base da tabela informada."""
+        return self.faixas.aplicar(tabela[self.produto] * quantidade, quantidade)
 
-class LubrificanteStrategy(PrecoStrategy):
-    """Estratégia de preço para Lubrificante."""
+    def calcular_preco_lote(
+        self, quantidades: np.ndarray, tabela: Optional[TabelaPrecos] = None
+    ) -> np.ndarray:
+        """Calcula o preço para um array de quantidades."""
+        if tabela is None:
+            tabela = tabela_precos()
+        return self.faixas.aplicar_lote(tabela[self.produto] * quantidades, quantidades)
 
-    def calcular_preco(self, quantidade: int) -> float:
-        """Calcula o preço do lubrificante com base na quantidade."""
-        return BASES["lubrificante"] * quantidade
+    def calcular_preco_centavos(self, quantidade: int, tabela: TabelaPrecos) -> int:
+        """Calcula o preço em centavos com aritmética inteira."""
+        return self.faixas.aplicar_centavos(tabela.centavos[self.produto] * quantidade, quantidade)
 
-    def aplicar_desconto(self, preco: float, cupom: Optional[str]) -> float:
-        """Desconto específico para lubrificantes."""
-        if cupom == "LUB2":
-            return preco - 2
-        return super().aplicar_desconto(preco, cupom)
+    def calcular_preco_lote_centavos(
+        self, quantidades: np.ndarray, tabela: TabelaPrecos
+    ) -> np.ndarray:
+        """Calcula o preço em centavos para um array `int64` de quantidades."""
+        return self.faixas.aplicar_lote_centavos(
+            tabela.centavos[self.produto] * quantidades, quantidades
+        )
+
+
+class DieselStrategy(FaixasStrategy):
+    """Estratégia de preço para Diesel: 5% acima de 500 e 10% acima de 1000."""
+
+    __slots__ = ()
+    produto = "diesel"
+    faixas = TabelaFaixas([(500, 0.95), (1000, 0.9)])
+    arredondamento = REAIS
+
+
+class GasolinaStrategy(FaixasStrategy):
+    """Estratégia de preço para Gasolina: 100 de abatimento acima de 200."""
+
+    __slots__ = ()
+    produto = "gasolina"
+    faixas = TabelaFaixas([(200, 100)], tipo=DEDUCAO)
+    arredondamento = CENTAVOS
+
+
+class EtanolStrategy(FaixasStrategy):
+    """Estratégia de preço para Etanol: 3% acima de 80."""
+
+    __slots__ = ()
+    produto = "etanol"
+    faixas = TabelaFaixas([(80, 0.97)])
+
+
+class LubrificanteStrategy(FaixasStrategy):
+    """Estratégia de preço para Lubrificante (sem faixas)."""
+
+    __slots__ = ()
+    produto = "lubrificante"
 
 
 # Registry para permitir extensão sem alterar código interno
 STRATEGY_REGISTRY: Dict[str, Type[PrecoStrategy]] = {}
 
+# Pedido compilado: (quantidade, cupom[, tabela]) -> valor final
+PipelinePedido = Callable[..., float]
+
+# Tabela de despacho pré-computada: produto -> (instância compartilhada,
+# calcular_preco_tabela, aplicar_desconto e calcular_preco_centavos ligados,
+# pedido compilado). Reconstruída apenas em `register_strategy` e trocada
+# por inteiro (leitores não veem estados intermediários).
+Despacho = Tuple[
+    PrecoStrategy,
+    Callable[[int, TabelaPrecos], float],
+    Callable[[float, Optional[str]], float],
+    Callable[[int, TabelaPrecos], int],
+    PipelinePedido,
+]
+_DESPACHO: Dict[str, Despacho] = {}
+_versao_registry = 0
+
+# Chamado com (produto, quantidade) quando um pedido calcula preço negativo
+_alerta_negativo: Optional[Callable[[str, int], None]] = None
+
+
+def _sem_pedido(quantidade: int, cupom: Optional[str], tabela: Optional[TabelaPrecos] = None) -> float:
+    """Pedido de produto sem estratégia registrada."""
+    return 0.0
+
+
+_SEM_DESPACHO = (None, None, None, None, _sem_pedido)
+
+
+def _nivel_definicao(cls: type, metodo: str) -> int:
+    """Posição, no MRO, da classe que define `metodo`."""
+    return next(i for i, c in enumerate(cls.__mro__) if metodo in c.__dict__)
+
+
+def _metodo_efetivo(strategy: PrecoStrategy, metodo: str) -> Callable:
+    """Escolhe a variante de cálculo de preço (`metodo`) a usar.
+
+    Subclasses que sobrescrevem apenas `calcular_preco` (sem conhecer a
+    variante) continuam sendo chamadas por ele, via implementação padrão
+    de `PrecoStrategy`.
+    """
+    cls = type(strategy)
+    if _nivel_definicao(cls, "calcular_preco") < _nivel_definicao(cls, metodo):
+        return getattr(PrecoStrategy, metodo).__get__(strategy)
+    return getattr(strategy, metodo)
+
+
+def _desconto_por_grupo(strategy: PrecoStrategy, variante: str) -> Callable[[np.ndarray, str], np.ndarray]:
+    """`aplicar_desconto` para um sub-array de preços com o mesmo cupom.
+
+    Se a estratégia sobrescreve `aplicar_desconto` abaixo da classe que
+    define a `variante` em lote e não declara `desconto_vetorizado`, o
+    desconto escalar é aplicado item a item (como `calcular_preco_lote`
+    faz com `calcular_preco`).
+    """
+    if strategy.desconto_vetorizado or not _desconto_sobrescrito(type(strategy), variante):
+        return strategy.aplicar_desconto
+    return _item_a_item(strategy.aplicar_desconto)
+
+
+def _desconto_centavos_por_grupo(strategy: PrecoStrategy) -> Callable[[np.ndarray, str], np.ndarray]:
+    """`aplicar_desconto_centavos` para um sub-array de centavos com o mesmo cupom.
+
+    Com `aplicar_desconto` sobrescrito (e `aplicar_desconto_centavos` não),
+    o desconto em reais é aplicado e o resultado convertido para centavos.
+    """
+    if not _desconto_sobrescrito(type(strategy), "aplicar_desconto_centavos"):
+        return strategy.aplicar_desconto_centavos
+    aplicar = strategy.aplicar_desconto
+    if not strategy.desconto_vetorizado:
+        return _item_a_item(lambda centavos, cupom: para_centavos(aplicar(centavos / 100, cupom)))
+
+    def grupo(centavos: np.ndarray, cupom: str) -> np.ndarray:
+        reais = np.asarray(aplicar(centavos / 100, cupom), dtype=np.float64)
+        return np.fromiter((para_centavos(v) for v in reais.tolist()), dtype=np.int64, count=len(reais))
+    return grupo
+
+
+@lru_cache(maxsize=None)
+def _desconto_sobrescrito(cls: type, variante: str) -> bool:
+    """Se `aplicar_desconto` foi sobrescrito abaixo da classe que define `variante`."""
+    return _nivel_definicao(cls, "aplicar_desconto") < _nivel_definicao(cls, variante)
+
+
+def _item_a_item(aplicar: Callable[[float, Optional[str]], float]) -> Callable[[np.ndarray, str], np.ndarray]:
+    """Aplica um desconto escalar a cada elemento, com `None` para "sem cupom"."""
+    def grupo(valores: np.ndarray, cupom: str) -> np.ndarray:
+        cupom = cupom or None
+        return np.fromiter((aplicar(v, cupom) for v in valores.tolist()), dtype=valores.dtype, count=len(valores))
+    return grupo
+
+
+def _reconstruir_despacho() -> None:
+    """Reconstrói a tabela de despacho a partir do registry."""
+    global _DESPACHO, _versao_registry
+    novo: Dict[str, Despacho] = {}
+    for nome, cls in STRATEGY_REGISTRY.items():
+        atual = _DESPACHO.get(nome)
+        strategy = atual[0] if atual and type(atual[0]) is cls else cls()
+        novo[nome] = (
+            strategy,
+            _metodo_efetivo(strategy, "calcular_preco_tabela"),
+            strategy.aplicar_desconto,
+            _metodo_efetivo(strategy, "calcular_preco_centavos"),
+            compilar_pedido(nome, strategy),
+        )
+    _DESPACHO = novo
+    _versao_registry += 1
+
+
+def compilar_pedido(nome: str, strategy: PrecoStrategy) -> PipelinePedido:
+    """Compila preço -> limite em zero -> desconto -> arredondamento em uma função.
+
+    Os métodos da estratégia são resolvidos uma única vez; a função
+    devolvida usa a tabela de preços vigente (ou a informada).
+    """
+    calcular = _metodo_efetivo(strategy, "calcular_preco_tabela")
+    descontar = strategy.aplicar_desconto
+    arredondar = strategy.arredondamento.aplicar
+
+    def pedido(quantidade: int, cupom: Optional[str], tabela: Optional[TabelaPrecos] = None) -> float:
+        preco = calcular(quantidade, tabela if tabela is not None else tabela_precos())
+        if preco < 0:
+            if _alerta_negativo is not None:
+                _alerta_negativo(nome, quantidade)
+            preco = 0
+        return arredondar(descontar(preco, cupom))
+
+    return pedido
+
+
+def pipeline_pedido(tipo: str) -> PipelinePedido:
+    """Pedido compilado do produto (devolve 0.0 para produtos sem estratégia)."""
+    return _DESPACHO.get(tipo, _SEM_DESPACHO)[4]
+
+
+def definir_alerta_negativo(alerta: Optional[Callable[[str, int], None]]) -> None:
+    """Define quem é avisado, com (produto, quantidade), de preços negativos."""
+    global _alerta_negativo
+    _alerta_negativo = alerta
+
 
 def register_strategy(nome: str, cls: Type[PrecoStrategy]) -> None:
     """Registra uma nova estratégia de preço."""
     STRATEGY_REGISTRY[nome] = cls
+    _reconstruir_despacho()
+
+
+def unregister_strategy(nome: str) -> Optional[Type[PrecoStrategy]]:
+    """Remove uma estratégia do registry e do despacho; retorna a classe removida."""
+    cls = STRATEGY_REGISTRY.pop(nome, None)
+    if cls is not None:
+        _reconstruir_despacho()
+    return cls
 
 
 def get_strategy(tipo: str) -> Optional[PrecoStrategy]:
-    """Obtém a estratégia de preço registrada para um tipo de produto."""
-    cls = STRATEGY_REGISTRY.get(tipo)
-    if cls:
-        return cls()
-    return None
+    """Obtém a instância compartilhada da estratégia de um tipo de produto."""
+    return _DESPACHO.get(tipo, _SEM_DESPACHO)[0]
+
+
+def versao_precos() -> Tuple[int, int, int]:
+    """Identifica o estado de preços vigente.
+
+    Muda sempre que `BASES`, o registry de estratégias ou a tabela de
+    cupons são alterados.
+    """
+    return (tabela_precos().versao, _versao_registry, versao_cupons())
 
 
 # Registrar estratégias padrão
@@ -116,21 +408,196 @@ class PrecoCalculadora:
     Mantém compatibilidade com a API anterior (`calcular_preco`,
     `calcular_desconto`) enquanto permite extensão via registro de
     novas estratégias (OCP).
+
+    A tabela de preços vigente é fixada na construção: alterações em
+    `BASES` durante o cálculo não afetam este pedido, e `versao` informa
+    qual versão foi usada.
     """
 
-    def __init__(self, tipo: str, quantidade: int):
+    def __init__(self, tipo: str, quantidade: int, tabela: Optional[TabelaPrecos] = None):
         self.tipo = tipo
         self.quantidade = quantidade
-        self._strategy = get_strategy(tipo)
+        self.tabela = tabela if tabela is not None else tabela_precos()
+        (
+            self._strategy, self._calcular, self._descontar, self._calcular_centavos, _
+        ) = _DESPACHO.get(tipo, _SEM_DESPACHO)
 
     def calcular_preco(self) -> float:
         """Calcula o preço usando a estratégia selecionada."""
-        if not self._strategy:
+        if not self._calcular:
             return 0.0
-        return self._strategy.calcular_preco(self.quantidade)
+        return self._calcular(self.quantidade, self.tabela)
 
     def calcular_desconto(self, cupom: Optional[str], preco: float) -> float:
         """Calcula o desconto usando a estratégia selecionada."""
-        if not self._strategy:
+        if not self._descontar:
             return preco
-        return self._strategy.aplicar_desconto(preco, cupom)
+        return self._descontar(preco, cupom)
+
+    def calcular_preco_centavos(self) -> int:
+        """Calcula o preço em centavos inteiros (modo exato)."""
+        if not self._calcular_centavos:
+            return 0
+        return self._calcular_centavos(self.quantidade, self.tabela)
+
+    def calcular_desconto_centavos(self, cupom: Optional[str], centavos: int) -> int:
+        """Aplica o desconto sobre um valor em centavos (modo exato)."""
+        if not self._strategy:
+            return centavos
+        return self._strategy.aplicar_desconto_centavos(centavos, cupom)
+
+    def arredondar(self, preco: float) -> float:
+        """Arredonda o valor final pela política da estratégia."""
+        if not self._strategy:
+            return TRUNCAR_CENTAVOS.aplicar(preco)
+        return self._strategy.arredondamento.aplicar(preco)
+
+    def arredondar_centavos(self, centavos: int) -> int:
+        """Arredonda o valor final em centavos pela política da estratégia."""
+        if not self._strategy:
+            return centavos
+        return self._strategy.arredondamento.aplicar_centavos(centavos)
+
+    @property
+    def versao(self) -> int:
+        """Versão da tabela de preços usada por esta calculadora."""
+        return self.tabela.versao
+
+    @staticmethod
+    def calcular_lote(
+        tipos: Iterable[str],
+        quantidades: Iterable[int],
+        cupons: Optional[Iterable[Optional[str]]] = None,
+        limitar_negativos: bool = False,
+        tabela: Optional[TabelaPrecos] = None,
+        centavos: bool = False,
+        arredondar: bool = False,
+    ) -> np.ndarray:
+        """Calcula preço e desconto de vários pedidos de uma só vez.
+
+        Equivale a chamar `calcular_preco` seguido de `calcular_desconto`
+        para cada pedido, mas agrupa os pedidos por produto e avalia
+        faixas e cupons com NumPy. Com `limitar_negativos`, preços
+        negativos viram zero antes do desconto (como em `processar_pedido`).
+        Todo o lote usa uma única versão da tabela de preços (`tabela` ou
+        a vigente no início do cálculo). Com `centavos`, o cálculo é exato
+        e o resultado é um array `int64` de centavos. Com `arredondar`, o
+        valor final passa pelo arredondamento de cada estratégia.
+        """
+        if tabela is None:
+            tabela = tabela_precos()
+        tipos_arr = _como_array_texto(tipos)
+        qtds = np.asarray(quantidades, dtype=np.int64)
+        if cupons is None:
+            cupons_arr = np.full(len(qtds), "", dtype=str)
+        else:
+            cupons_arr = _como_array_texto(cupons)
+
+        if centavos:
+            precos = np.zeros(len(qtds), dtype=np.int64)
+            calcular, descontar = "calcular_preco_lote_centavos", "aplicar_desconto_lote_centavos"
+        else:
+            precos = np.zeros(len(qtds), dtype=np.float64)
+            calcular, descontar = "calcular_preco_lote", "aplicar_desconto_lote"
+
+        for tipo in np.unique(tipos_arr):
+            strategy = get_strategy(str(tipo))
+            if not strategy:
+                continue
+            mascara = tipos_arr == tipo
+            parcial = _metodo_efetivo(strategy, calcular)(qtds[mascara], tabela)
+            if limitar_negativos:
+                parcial = np.maximum(parcial, 0)
+            parcial = getattr(strategy, descontar)(parcial, cupons_arr[mascara])
+            if arredondar:
+                politica = strategy.arredondamento
+                parcial = politica.aplicar_centavos(parcial) if centavos else politica.aplicar_lote(parcial)
+            precos[mascara] = parcial
+        return precos
+
+    @staticmethod
+    def calcular_lote_codigos(
+        codigos_produtos: np.ndarray,
+        produtos: Sequence[Optional[str]],
+        quantidades: Iterable[int],
+        codigos_cupons: Optional[np.ndarray] = None,
+        cupons: Sequence[Optional[str]] = (None,),
+        limitar_negativos: bool = False,
+        tabela: Optional[TabelaPrecos] = None,
+        centavos: bool = False,
+        arredondar: bool = False,
+    ) -> np.ndarray:
+        """`calcular_lote` com produtos e cupons codificados por dicionário.
+
+        `codigos_produtos` e `codigos_cupons` são arrays inteiros de índices
+        em `produtos` e `cupons` (como nas colunas de um lote `.pbcol`). Os
+        pedidos são agrupados pelo código e cada produto e cupom distinto é
+        resolvido uma única vez, sem montar arrays de texto por pedido.
+        Sem `codigos_cupons`, nenhum pedido tem cupom.
+        """
+        if tabela is None:
+            tabela = tabela_precos()
+        qtds = np.asarray(quantidades, dtype=np.int64)
+        codigos_produtos = np.asarray(codigos_produtos)
+        if codigos_cupons is None:
+            codigos_cupons = np.zeros(len(qtds), dtype=np.intp)
+            cupons = (None,)
+        else:
+            codigos_cupons = np.asarray(codigos_cupons)
+
+        if centavos:
+            precos = np.zeros(len(qtds), dtype=np.int64)
+            calcular, descontar = "calcular_preco_lote_centavos", "aplicar_desconto_lote_codigos_centavos"
+        else:
+            precos = np.zeros(len(qtds), dtype=np.float64)
+            calcular, descontar = "calcular_preco_lote", "aplicar_desconto_lote_codigos"
+
+        presentes = np.flatnonzero(np.bincount(codigos_produtos, minlength=len(produtos)))
+        for codigo in presentes:
+            strategy = get_strategy(produtos[codigo]) if produtos[codigo] else None
+            if not strategy:
+                continue
+            mascara = codigos_produtos == codigo
+            parcial = _metodo_efetivo(strategy, calcular)(qtds[mascara], tabela)
+            if limitar_negativos:
+                parcial = np.maximum(parcial, 0)
+            parcial = getattr(strategy, descontar)(parcial, codigos_cupons[mascara], cupons)
+            if arredondar:
+                politica = strategy.arredondamento
+                parcial = politica.aplicar_centavos(parcial) if centavos else politica.aplicar_lote(parcial)
+            precos[mascara] = parcial
+        return precos
+
+
+def _por_cupom(aplicar: Callable, valores: np.ndarray, cupons: np.ndarray) -> np.ndarray:
+    """Aplica `aplicar(sub_array, cupom)` a cada grupo de cupom distinto."""
+    resultado = valores.copy()
+    for cupom in np.unique(cupons):
+        mascara = cupons == cupom
+        resultado[mascara] = aplicar(valores[mascara], str(cupom))
+    return resultado
+
+
+def _por_codigo(
+    aplicar: Callable, valores: np.ndarray, codigos: np.ndarray, dicionario: Sequence[Optional[str]]
+) -> np.ndarray:
+    """Como `_por_cupom`, agrupando pelo código `int` de cada cupom no dicionário."""
+    presentes = np.flatnonzero(np.bincount(codigos, minlength=len(dicionario)))
+    if len(presentes) == 1:
+        cupom = dicionario[presentes[0]]
+        return aplicar(valores, "" if cupom is None else cupom)
+    resultado = valores.copy()
+    for codigo in presentes:
+        cupom = dicionario[codigo]
+        mascara = codigos == codigo
+        resultado[mascara] = aplicar(valores[mascara], "" if cupom is None else cupom)
+    return resultado
+
+
+def _como_array_texto(valores: Iterable[Optional[str]]) -> np.ndarray:
+    """Converte valores (com possíveis `None`) em um array de strings."""
+    if isinstance(valores, np.ndarray) and valores.dtype.kind == "U":
+        return valores
+    arr = np.array(valores if isinstance(valores, np.ndarray) else list(valores), dtype=object)
+    arr[arr == None] = ""  # noqa: E711 - comparação elemento a elemento
+    return arr.astype(str)
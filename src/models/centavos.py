@@ -0,0 +1,55 @@
+"""Centavos Module
+
+Aritmética exata em centavos inteiros. Preços, faixas e descontos são
+convertidos para frações exatas e aplicados com arredondamento bancário
+(metade para o par) em cada etapa, como faz a contabilidade. As funções
+aceitam tanto `int` quanto arrays NumPy `int64`.
+"""
+
+from __future__ import annotations
+
+from decimal import ROUND_HALF_EVEN, Decimal
+from fractions import Fraction
+from functools import lru_cache
+from typing import Tuple
+
+
+def para_centavos(valor: float) -> int:
+    """Converte um valor em reais para centavos (pelo decimal exibido)."""
+    return int((Decimal(repr(valor)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+
+
+def para_reais(centavos):
+    """Converte centavos (int ou array) para reais."""
+    return centavos / 100
+
+
+@lru_cache(maxsize=None)
+def fracao(valor: float) -> Tuple[int, int]:
+    """Fração exata (numerador, denominador) do decimal exibido de `valor`."""
+    f = Fraction(repr(valor))
+    return f.numerator, f.denominator
+
+
+def dividir_arredondando(numerador, denominador):
+    """Divisão inteira com arredondamento metade para o par.
+
+    `denominador` deve ser positivo; funciona com `int` e arrays NumPy.
+    """
+    quociente = numerador // denominador
+    dobro_resto = 2 * (numerador - quociente * denominador)
+    return quociente + (
+        (dobro_resto > denominador)
+        | ((dobro_resto == denominador) & (quociente % 2 == 1))
+    )
+
+
+def multiplicar(centavos, valor: float):
+    """Multiplica centavos por um fator decimal, arredondando ao centavo."""
+    numerador, denominador = fracao(valor)
+    return dividir_arredondando(centavos * numerador, denominador)
+
+
+def arredondar_para(centavos, passo: int):
+    """Arredonda centavos para o múltiplo de `passo` mais próximo."""
+    return dividir_arredondando(centavos, passo) * passo
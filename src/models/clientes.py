@@ -2,14 +2,50 @@
 
 Refatorado para aplicar SRP: validação e persistência foram extraídas
 para classes dedicadas (`ValidadorCliente`, `ClienteRepositorio`).
+
+Para cadastros em massa, `EscritorClientes` mantém o arquivo aberto e
+grava os clientes em lotes; enquanto ele estiver aberto,
+`ClienteRepositorio.salvar` (e portanto `Clientes.cadastrar`) para o
+mesmo arquivo passa por ele em vez de abrir o arquivo a cada cliente.
+
+Formato do arquivo: uma linha de cabeçalho com formato e versão
+(`{"formato":"clientes","versao":1}`) seguida de um cliente por linha em
+JSON. Arquivos no formato antigo (`str(dict)` por linha, lidos com
+`literal_eval`) são convertidos uma única vez por `migrar_clientes`,
+chamada automaticamente na primeira leitura ou ao abrir um escritor.
+
+`ClienteRepositorio.buscar(cnpj)` consulta um índice em disco
+(`<arquivo>.idx`, pares cnpj/posição em `int64` ordenados por cnpj) por
+busca binária no arquivo mapeado e lê só a linha do cliente em uma visão
+mapeada em memória dos dados. O índice é criado na primeira busca,
+mantido por `salvar` e pelo escritor enquanto existir e pode ser refeito
+a partir dos dados com `reindexar_clientes`.
+
+`definir_repositorio` troca o arquivo por outro repositório (por exemplo
+`ClienteRepositorioSQLite`, em `models/clientes_sqlite.py`) sem alterar
+`Clientes`.
 """
 
+import json
+import mmap
+import os
 import re
-from typing import Any, Dict
+import struct
+import threading
+import time
+from itertools import accumulate, chain, islice
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from ast import literal_eval
 
 # REG Para validação do Email
 REG_EMAIL = "^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$"
+_EMAIL = re.compile(REG_EMAIL)
+
+# Motivos de rejeição em `Clientes.cadastrar_lote`
+MOTIVO_EMAIL = "email inválido"
+MOTIVO_CNPJ = "cnpj inválido"
+MOTIVO_REGISTRO = "registro inválido"
 
 
 class ValidadorCliente:
@@ -18,7 +54,7 @@ class ValidadorCliente:
     @staticmethod
     def validar_email(email: str) -> bool:
         """Valida o email do cliente."""
-        return bool(re.match(REG_EMAIL, email))
+        return bool(_EMAIL.match(email))
 
     @staticmethod
     def validar_cnpj(cnpj: Any) -> bool:
@@ -32,28 +68,687 @@ class ValidadorCliente:
             return False
 
 
+# Formato do arquivo de clientes
+FORMATO_CLIENTES = "clientes"
+VERSAO_CLIENTES = 1
+CABECALHO_CLIENTES = json.dumps(
+    {"formato": FORMATO_CLIENTES, "versao": VERSAO_CLIENTES}, separators=(",", ":")
+) + "\n"
+TAMANHO_BLOCO_LEITURA = 10_000
+
+# Índice cnpj -> posição: cabeçalho (`CLIDX002`, quantidade de pares
+# ordenados, fim dos dados que eles cobrem), os pares `<q` (cnpj, posição)
+# ordenados por cnpj e, depois deles, os pares acrescentados desde a
+# última compactação, na ordem de gravação
+SUFIXO_INDICE = ".idx"
+MAGICA_INDICE = b"CLIDX002"
+CABECALHO_INDICE = struct.Struct("<8sqq")
+TAMANHO_CABECALHO_INDICE = CABECALHO_INDICE.size
+TAMANHO_REGISTRO_INDICE = 16
+LIMITE_RECENTES = 65_536
+_PAR = struct.Struct("<qq")
+
+_codificar = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _linha_cliente(cliente: Dict[str, Any]) -> str:
+    """Linha JSON de um cliente."""
+    return _codificar(cliente) + "\n"
+
+
+def _versao_arquivo(linha: str) -> Optional[int]:
+    """Versão indicada pela primeira linha do arquivo (None se for o formato antigo)."""
+    if not linha.startswith('{"'):
+        return None
+    try:
+        cabecalho = json.loads(linha)
+    except ValueError:
+        return None
+    if cabecalho.get("formato") != FORMATO_CLIENTES:
+        return None
+    versao = cabecalho.get("versao")
+    if versao != VERSAO_CLIENTES:
+        raise ValueError(f"versão {versao!r} do arquivo de clientes não suportada")
+    return versao
+
+
+def _ler_legado(linha: str) -> Dict[str, Any]:
+    """Cliente de uma linha do formato antigo.
+
+    Linhas JSON acrescentadas a um arquivo antigo também são aceitas.
+    """
+    if linha.startswith('{"'):
+        return json.loads(linha)
+    return literal_eval(linha)
+
+
+def ler_clientes(path: str = "clientes.txt", tamanho_bloco: int = TAMANHO_BLOCO_LEITURA) -> Iterator[Dict[str, Any]]:
+    """Lê os clientes do arquivo em fluxo, sem carregar o arquivo inteiro.
+
+    As linhas são decodificadas em blocos de `tamanho_bloco` (uma única
+    chamada a `json.loads` por bloco). Arquivos no formato antigo são lidos
+    linha a linha, sem conversão.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        primeira = f.readline()
+        if not primeira:
+            return
+        if _versao_arquivo(primeira) is None:
+            for linha in chain((primeira,), f):
+                linha = linha.strip()
+                if linha:
+                    yield _ler_legado(linha)
+            return
+        while True:
+            bloco = [linha for linha in islice(f, tamanho_bloco) if not linha.isspace()]
+            if not bloco:
+                return
+            yield from json.loads("[" + ",".join(bloco) + "]")
+
+
+def migrar_clientes(path: str = "clientes.txt") -> bool:
+    """Converte um arquivo no formato antigo para o atual.
+
+    A conversão é feita em um arquivo temporário e trocada atomicamente.
+    Retorna False se o arquivo não existe ou já está no formato atual.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            primeira = f.readline()
+    except FileNotFoundError:
+        return False
+    if not primeira or _versao_arquivo(primeira) is not None:
+        return False
+    temporario = f"{path}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as destino:
+        destino.write(CABECALHO_CLIENTES)
+        for cliente in ler_clientes(path):
+            destino.write(_linha_cliente(cliente))
+    os.replace(temporario, path)
+    _descartar_indice(path)
+    return True
+
+
+def _chave(cnpj: Any) -> Optional[int]:
+    """CNPJ como chave do índice (None se não couber em `int64`)."""
+    try:
+        chave = int(cnpj)
+    except (TypeError, ValueError):
+        return None
+    return chave if -(2**63) <= chave < 2**63 else None
+
+
+def _gravar_indice(path: str, pares: List[int], novo: bool = False) -> None:
+    """Acrescenta pares (cnpj, posição), achatados, ao índice do arquivo.
+
+    Só grava se o índice já existir. Com `novo` (arquivo de dados recém
+    criado), o índice é substituído em vez de acrescentado.
+    """
+    indice = path + SUFIXO_INDICE
+    if not pares or not os.path.exists(indice):
+        return
+    dados = struct.pack(f"<{len(pares)}q", *pares)
+    if novo:
+        temporario = f"{indice}.{os.getpid()}.tmp"
+        with open(temporario, "wb") as f:
+            f.write(CABECALHO_INDICE.pack(MAGICA_INDICE, 0, 0) + dados)
+        os.replace(temporario, indice)
+        return
+    with open(indice, "ab") as f:
+        f.write(dados)
+
+
+def _gravar_ordenado(path_indice: str, posicoes: Dict[int, int], fim: int) -> None:
+    """Substitui o índice por `posicoes` ordenadas por cnpj, cobrindo os dados até `fim`."""
+    pares = sorted(posicoes.items())
+    temporario = f"{path_indice}.{os.getpid()}.tmp"
+    with open(temporario, "wb") as f:
+        f.write(CABECALHO_INDICE.pack(MAGICA_INDICE, len(pares), fim))
+        for k in range(0, len(pares), TAMANHO_BLOCO_LEITURA):
+            bloco = list(chain.from_iterable(pares[k:k + TAMANHO_BLOCO_LEITURA]))
+            f.write(struct.pack(f"<{len(bloco)}q", *bloco))
+    os.replace(temporario, path_indice)
+
+
+class _Chaves:
+    """CNPJs da parte ordenada do índice, lidos do mapeamento sob demanda (para `bisect`)."""
+
+    def __init__(self, mapa: Optional[mmap.mmap], quantidade: int) -> None:
+        self.mapa = mapa
+        self.quantidade = quantidade
+
+    def __len__(self) -> int:
+        return self.quantidade
+
+    def __getitem__(self, i: int) -> int:
+        return _PAR.unpack_from(self.mapa, TAMANHO_CABECALHO_INDICE + i * TAMANHO_REGISTRO_INDICE)[0]
+
+
+class IndiceClientes:
+    """Índice cnpj -> posição de um arquivo de clientes.
+
+    A parte ordenada de `<path>.idx` é mapeada em memória e consultada
+    por busca binária, sem ser carregada: abrir o índice custa só a
+    leitura do cabeçalho, e as páginas ficam no cache do sistema,
+    compartilhadas entre processos. Os pares acrescentados depois da
+    última compactação (por `salvar`, pelo escritor ou por linhas
+    gravadas sem o índice) ficam em `recentes`; quando passam de
+    `LIMITE_RECENTES`, o índice é regravado todo ordenado. A compactação
+    e a reconstrução montam os pares em memória enquanto gravam o
+    arquivo novo.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.path_indice = path + SUFIXO_INDICE
+        self.recentes: Dict[int, int] = {}
+        self._ordenados = 0
+        self._chaves = _Chaves(None, 0)
+        self._mapa_indice: Optional[mmap.mmap] = None
+        self._inode: Optional[int] = None
+        self._lidos = 0
+        self._fim = 0
+        self._mapa: Optional[mmap.mmap] = None
+        self._inode_dados: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._ordenados + len(self.recentes)
+
+    def buscar(self, cnpj: Any) -> Optional[Dict[str, Any]]:
+        """Cliente com o CNPJ (None se não houver)."""
+        chave = _chave(cnpj)
+        if chave is None:
+            return None
+        with self._lock:
+            self._atualizar()
+            try:
+                cliente = self._ler(chave)
+                valido = cliente is None or _chave(cliente.get("cnpj")) == chave
+            except (ValueError, SyntaxError):
+                valido = False
+            if not valido:
+                # Índice não corresponde aos dados: refaz e tenta de novo
+                self._reconstruir()
+                cliente = self._ler(chave)
+            return cliente
+
+    def reconstruir(self) -> int:
+        """Refaz o índice a partir do arquivo de dados; retorna quantos CNPJs indexou."""
+        with self._lock:
+            self._reconstruir()
+            return len(self)
+
+    def fechar(self) -> None:
+        """Libera os mapeamentos do índice e do arquivo de dados."""
+        self._fechar_indice()
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+
+    def _fechar_indice(self) -> None:
+        if self._mapa_indice is not None:
+            self._mapa_indice.close()
+            self._mapa_indice = None
+
+    def _posicao(self, chave: int) -> Optional[int]:
+        """Posição da linha do CNPJ: primeiro nos recentes, depois na parte ordenada."""
+        posicao = self.recentes.get(chave)
+        if posicao is None and self._ordenados:
+            i = bisect_left(self._chaves, chave)
+            if i < self._ordenados:
+                cnpj, posicao = _PAR.unpack_from(
+                    self._mapa_indice, TAMANHO_CABECALHO_INDICE + i * TAMANHO_REGISTRO_INDICE
+                )
+                if cnpj != chave:
+                    posicao = None
+        return posicao
+
+    def _ler(self, chave: int) -> Optional[Dict[str, Any]]:
+        """Decodifica a linha indexada para a chave."""
+        posicao = self._posicao(chave)
+        if posicao is None:
+            return None
+        if self._mapa is None or not 0 <= posicao < len(self._mapa):
+            raise ValueError("posição fora do arquivo de clientes")
+        fim = self._mapa.find(b"\n", posicao)
+        linha = self._mapa[posicao:fim if fim >= 0 else len(self._mapa)]
+        return _ler_legado(linha.decode("utf-8").strip())
+
+    def _mapear(self) -> Tuple[int, bool]:
+        """Mapeia o arquivo de dados (de novo, se cresceu ou foi trocado).
+
+        Retorna o tamanho e se o arquivo foi trocado desde o último mapeamento.
+        """
+        estado = os.stat(self.path)
+        trocado = self._inode_dados is not None and estado.st_ino != self._inode_dados
+        if trocado or (estado.st_size and (self._mapa is None or len(self._mapa) < estado.st_size)):
+            if self._mapa is not None:
+                self._mapa.close()
+                self._mapa = None
+            self._inode_dados = estado.st_ino
+            if estado.st_size:
+                with open(self.path, "rb") as f:
+                    self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return estado.st_size, trocado
+
+    def _abrir_indice(self, estado: os.stat_result) -> bool:
+        """Lê o cabeçalho do índice e mapeia a parte ordenada; False se for inválido."""
+        self._fechar_indice()
+        self.recentes = {}
+        self._ordenados = 0
+        self._chaves = _Chaves(None, 0)
+        self._inode = estado.st_ino
+        with open(self.path_indice, "rb") as f:
+            cabecalho = f.read(TAMANHO_CABECALHO_INDICE)
+            if len(cabecalho) < TAMANHO_CABECALHO_INDICE:
+                return False
+            magica, ordenados, fim = CABECALHO_INDICE.unpack(cabecalho)
+            inicio_recentes = TAMANHO_CABECALHO_INDICE + ordenados * TAMANHO_REGISTRO_INDICE
+            if magica != MAGICA_INDICE or ordenados < 0 or estado.st_size < inicio_recentes:
+                return False
+            if ordenados:
+                self._mapa_indice = mmap.mmap(f.fileno(), inicio_recentes, access=mmap.ACCESS_READ)
+        self._ordenados = ordenados
+        self._chaves = _Chaves(self._mapa_indice, ordenados)
+        self._lidos = inicio_recentes
+        self._fim = fim
+        return True
+
+    def _compactar(self, posicoes: Dict[int, int], fim: int) -> None:
+        """Regrava o índice com `posicoes` todas ordenadas e passa a usá-lo."""
+        self._fechar_indice()
+        _gravar_ordenado(self.path_indice, posicoes, fim)
+        self._abrir_indice(os.stat(self.path_indice))
+
+    def _reconstruir(self) -> None:
+        """Indexa o arquivo de dados inteiro em um índice novo."""
+        tamanho = self._mapear()[0]
+        posicoes, fim = self._indexar(0, tamanho)
+        self._compactar(posicoes, fim)
+
+    def _atualizar(self) -> None:
+        """Lê os pares novos do índice, indexa linhas que ficaram de fora e compacta."""
+        try:
+            estado = os.stat(self.path_indice)
+        except FileNotFoundError:
+            self._reconstruir()
+            return
+        indice_trocado = estado.st_ino != self._inode or estado.st_size < self._lidos
+        if indice_trocado and not self._abrir_indice(estado):
+            self._reconstruir()
+            return
+        tamanho, dados_trocados = self._mapear()
+        if (dados_trocados and not indice_trocado) or self._fim > tamanho:
+            # Dados reescritos sem atualizar o índice
+            self._reconstruir()
+            return
+        novos = (estado.st_size - self._lidos) // TAMANHO_REGISTRO_INDICE * TAMANHO_REGISTRO_INDICE
+        if novos:
+            with open(self.path_indice, "rb") as f:
+                f.seek(self._lidos)
+                pares = struct.unpack(f"<{novos // 8}q", f.read(novos))
+            self._lidos += novos
+            self.recentes.update(zip(pares[0::2], pares[1::2]))
+            ultima = max(pares[1::2])
+            if ultima >= tamanho:
+                self._reconstruir()
+                return
+            fim = self._mapa.find(b"\n", ultima)
+            self._fim = max(self._fim, fim + 1 if fim >= 0 else tamanho)
+        if tamanho > self._fim:
+            self._completar(tamanho)
+        if len(self.recentes) >= LIMITE_RECENTES:
+            posicoes: Dict[int, int] = {}
+            if self._ordenados:
+                posicoes.update(_PAR.iter_unpack(self._mapa_indice[TAMANHO_CABECALHO_INDICE:]))
+            posicoes.update(self.recentes)
+            self._compactar(posicoes, self._fim)
+
+    def _completar(self, tamanho: int) -> None:
+        """Indexa as linhas completas de `_fim` até `tamanho` e as acrescenta ao índice."""
+        posicoes, self._fim = self._indexar(self._fim, tamanho)
+        if posicoes:
+            self.recentes.update(posicoes)
+            pares = list(chain.from_iterable(posicoes.items()))
+            with open(self.path_indice, "ab") as f:
+                f.write(struct.pack(f"<{len(pares)}q", *pares))
+            self._lidos += len(pares) * 8
+
+    def _indexar(self, inicio: int, tamanho: int) -> Tuple[Dict[int, int], int]:
+        """Posições das linhas completas entre `inicio` e `tamanho`; retorna (posições, fim).
+
+        Para um CNPJ repetido fica a última posição, como em `carregar`.
+        """
+        if not tamanho:
+            return {}, inicio
+        limite = self._mapa.rfind(b"\n", inicio, tamanho) + 1
+        if limite <= inicio:
+            return {}, inicio
+        linhas = self._mapa[inicio:limite - 1].split(b"\n")
+        inicios = list(accumulate((len(linha) + 1 for linha in linhas), initial=inicio))
+        if inicio == 0 and _versao_arquivo(linhas[0].decode("utf-8")) is not None:
+            linhas[0] = b""
+        registros = [(i, linha) for i, linha in zip(inicios, linhas) if linha and not linha.isspace()]
+
+        posicoes: Dict[int, int] = {}
+        for k in range(0, len(registros), TAMANHO_BLOCO_LEITURA):
+            bloco = registros[k:k + TAMANHO_BLOCO_LEITURA]
+            try:
+                clientes = json.loads(b"[" + b",".join(linha for _, linha in bloco) + b"]")
+            except ValueError:
+                # Linhas no formato antigo
+                clientes = [_ler_legado(linha.decode("utf-8").strip()) for _, linha in bloco]
+            for (posicao, _), cliente in zip(bloco, clientes):
+                chave = _chave(cliente.get("cnpj"))
+                if chave is not None:
+                    posicoes[chave] = posicao
+        return posicoes, limite
+
+
+# Índices em uso, por caminho absoluto do arquivo de dados
+_indices: Dict[str, IndiceClientes] = {}
+
+
+def _descartar_indice(path: str) -> None:
+    """Remove o índice de um arquivo cujos dados foram reescritos."""
+    indice = _indices.pop(os.path.abspath(path), None)
+    if indice is not None:
+        indice.fechar()
+    try:
+        os.remove(path + SUFIXO_INDICE)
+    except FileNotFoundError:
+        pass
+
+
+def reindexar_clientes(path: str = "clientes.txt") -> int:
+    """Refaz o índice de CNPJs do arquivo; retorna quantos clientes indexou."""
+    _descartar_indice(path)
+    indice = _indices[os.path.abspath(path)] = IndiceClientes(path)
+    return indice.reconstruir()
+
+
+# Políticas de fsync do EscritorClientes
+FSYNC_NUNCA = "nunca"  # o sistema operacional decide quando gravar no disco
+FSYNC_LOTE = "lote"  # fsync a cada lote descarregado
+FSYNC_FECHAR = "fechar"  # fsync apenas ao fechar o escritor
+POLITICAS_FSYNC = (FSYNC_NUNCA, FSYNC_LOTE, FSYNC_FECHAR)
+
+# Escritores abertos, por caminho absoluto do arquivo
+_escritores: Dict[str, "EscritorClientes"] = {}
+
+# Repositório alternativo (ex.: ClienteRepositorioSQLite); None usa o arquivo
+_repositorio: Optional[Any] = None
+
+
+def definir_repositorio(repositorio: Optional[Any]) -> None:
+    """Define onde `ClienteRepositorio` (e `Clientes`) guarda os clientes.
+
+    O repositório precisa ter `salvar(cliente)`, `carregar()` e
+    `buscar(cnpj)`; o `path` passado a `ClienteRepositorio` é ignorado.
+    `None` volta ao arquivo de texto.
+    """
+    global _repositorio
+    _repositorio = repositorio
+
+
 class ClienteRepositorio:
-    """Responsável por persistir clientes (atualmente em arquivo)."""
+    """Responsável por persistir clientes (em arquivo ou no repositório
+    escolhido com `definir_repositorio`)."""
 
     @staticmethod
     def salvar(cliente: Dict[str, Any], path: str = "clientes.txt") -> None:
-        """Salva o cliente em um arquivo."""
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(str(cliente) + "\n")
+        """Salva o cliente em um arquivo.
+
+        Se houver um `EscritorClientes` aberto para o arquivo, o cliente
+        entra no lote dele.
+        """
+        if _repositorio is not None:
+            _repositorio.salvar(cliente)
+            return
+        escritor = _escritores and _escritores.get(os.path.abspath(path))
+        if escritor:
+            escritor.salvar(cliente)
+            return
+        with open(path, "ab") as f:
+            posicao = f.tell()
+            if not posicao:
+                f.write(CABECALHO_CLIENTES.encode("utf-8"))
+            f.write(_linha_cliente(cliente).encode("utf-8"))
+        chave = _chave(cliente.get("cnpj"))
+        if chave is not None:
+            _gravar_indice(path, [chave, posicao or len(CABECALHO_CLIENTES)], novo=not posicao)
 
     @staticmethod
     def carregar(path: str = "clientes.txt") -> Dict[int, Dict[str, Any]]:
-        """Carrega os clientes de um arquivo."""
+        """Carrega os clientes de um arquivo.
+
+        Um arquivo no formato antigo é migrado antes da leitura.
+        """
+        if _repositorio is not None:
+            return _repositorio.carregar()
+        escritor = _escritores.get(os.path.abspath(path))
+        if escritor is not None:
+            escritor.flush()
         clientes = {}
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                for linha in f:
-                    cliente = literal_eval(linha.strip())
-                    clientes[cliente["cnpj"]] = cliente
+            migrar_clientes(path)
+            for cliente in ler_clientes(path):
+                clientes[cliente["cnpj"]] = cliente
         except FileNotFoundError:
             pass
         return clientes
 
+    @staticmethod
+    def buscar(cnpj: Any, path: str = "clientes.txt") -> Optional[Dict[str, Any]]:
+        """Busca um cliente pelo CNPJ sem carregar o arquivo.
+
+        Usa o índice `<path>.idx` (criado na primeira busca) e lê apenas a
+        linha do cliente. Retorna None se o arquivo ou o cliente não existem.
+        """
+        if _repositorio is not None:
+            return _repositorio.buscar(cnpj)
+        chave = os.path.abspath(path)
+        escritor = _escritores.get(chave)
+        if escritor is not None:
+            escritor.flush()
+        indice = _indices.get(chave)
+        if indice is None:
+            if not os.path.exists(path):
+                return None
+            indice = _indices[chave] = IndiceClientes(path)
+        try:
+            return indice.buscar(cnpj)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def salvar_lote(clientes: Iterable[Dict[str, Any]], path: str = "clientes.txt") -> int:
+        """Salva vários clientes com uma única gravação; retorna quantos.
+
+        No repositório definido com `definir_repositorio`, usa o
+        `salvar_lote` dele (uma transação) quando existir.
+        """
+        if _repositorio is not None:
+            if hasattr(_repositorio, "salvar_lote"):
+                return _repositorio.salvar_lote(clientes)
+            quantidade = 0
+            for cliente in clientes:
+                _repositorio.salvar(cliente)
+                quantidade += 1
+            return quantidade
+        escritor = _escritores.get(os.path.abspath(path))
+        if escritor is not None:
+            quantidade = 0
+            for cliente in clientes:
+                escritor.salvar(cliente)
+                quantidade += 1
+            return quantidade
+
+        clientes = list(clientes)
+        linhas = [_linha_cliente(c).encode("utf-8") for c in clientes]
+        if not linhas:
+            return 0
+        with open(path, "ab") as f:
+            inicio = f.tell()
+            cabecalho = b"" if inicio else CABECALHO_CLIENTES.encode("utf-8")
+            f.write(cabecalho + b"".join(linhas))
+        if os.path.exists(path + SUFIXO_INDICE):
+            pares: List[int] = []
+            posicao = inicio + len(cabecalho)
+            for cliente, linha in zip(clientes, linhas):
+                chave = _chave(cliente.get("cnpj"))
+                if chave is not None:
+                    pares += (chave, posicao)
+                posicao += len(linha)
+            _gravar_indice(path, pares, novo=not inicio)
+        return len(linhas)
+
+
+class EscritorClientes:
+    """Gravação em lote (group commit) de clientes em um arquivo.
+
+    Os registros ficam em memória e são gravados de uma vez quando o lote
+    chega a `tamanho_lote` ou quando o mais antigo espera mais de
+    `intervalo` segundos (verificado a cada gravação e por uma thread de
+    fundo). `fsync` escolhe quando forçar a gravação no disco
+    (`FSYNC_NUNCA`, `FSYNC_LOTE` ou `FSYNC_FECHAR`).
+
+    Uso:
+        with EscritorClientes("clientes.txt") as escritor:
+            for c in novos:
+                c.cadastrar()  # passa pelo escritor
+    """
+
+    def __init__(
+        self,
+        path: str = "clientes.txt",
+        tamanho_lote: int = 1000,
+        intervalo: Optional[float] = 1.0,
+        fsync: str = FSYNC_FECHAR,
+    ) -> None:
+        if fsync not in POLITICAS_FSYNC:
+            raise ValueError(f"política de fsync inválida: {fsync!r}")
+        self.path = os.path.abspath(path)
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+        self.fsync = fsync
+        self.lotes = 0
+        migrar_clientes(self.path)
+        self._arquivo = open(self.path, "ab")
+        self._posicao = self._arquivo.tell()
+        self._novo = not self._posicao
+        if self._novo:
+            self._arquivo.write(CABECALHO_CLIENTES.encode("utf-8"))
+            self._posicao = len(CABECALHO_CLIENTES)
+        self._pendentes: List[bytes] = []
+        self._indice: List[int] = []
+        self._primeiro = 0.0
+        self._lock = threading.Lock()
+        self._fechado = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if intervalo:
+            self._thread = threading.Thread(target=self._descarregar_periodicamente, daemon=True)
+            self._thread.start()
+        _escritores[self.path] = self
+
+    def salvar(self, cliente: Dict[str, Any]) -> None:
+        """Adiciona o cliente ao lote, descarregando se necessário."""
+        with self._lock:
+            if self._fechado.is_set():
+                raise ValueError("escritor de clientes fechado")
+            if not self._pendentes:
+                self._primeiro = time.monotonic()
+            linha = _linha_cliente(cliente).encode("utf-8")
+            chave = _chave(cliente.get("cnpj"))
+            if chave is not None:
+                self._indice += (chave, self._posicao)
+            self._posicao += len(linha)
+            self._pendentes.append(linha)
+            if len(self._pendentes) >= self.tamanho_lote or self._expirado():
+                self._descarregar()
+
+    def flush(self) -> None:
+        """Grava imediatamente os clientes pendentes."""
+        with self._lock:
+            self._descarregar()
+
+    def fechar(self) -> None:
+        """Descarrega, aplica o fsync final e fecha o arquivo."""
+        with self._lock:
+            if self._fechado.is_set():
+                return
+            self._fechado.set()
+            self._descarregar()
+            if self.fsync == FSYNC_FECHAR:
+                os.fsync(self._arquivo.fileno())
+            self._arquivo.close()
+        if _escritores.get(self.path) is self:
+            del _escritores[self.path]
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "EscritorClientes":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+    @property
+    def pendentes(self) -> int:
+        """Clientes aguardando gravação."""
+        return len(self._pendentes)
+
+    def _expirado(self) -> bool:
+        """Se o cliente mais antigo do lote já esperou `intervalo` segundos."""
+        return bool(self.intervalo) and time.monotonic() - self._primeiro >= self.intervalo
+
+    def _descarregar(self) -> None:
+        """Grava o lote pendente (chamado com o lock adquirido)."""
+        if not self._pendentes:
+            return
+        self._arquivo.write(b"".join(self._pendentes))
+        self._arquivo.flush()
+        if self.fsync == FSYNC_LOTE:
+            os.fsync(self._arquivo.fileno())
+        _gravar_indice(self.path, self._indice, novo=self._novo)
+        self._novo = False
+        self._pendentes = []
+        self._indice = []
+        self.lotes += 1
+
+    def _descarregar_periodicamente(self) -> None:
+        """Thread de fundo: descarrega lotes que esperaram demais."""
+        while not self._fechado.wait(self.intervalo):
+            with self._lock:
+                if self._pendentes and self._expirado() and not self._fechado.is_set():
+                    self._descarregar()
+
+
+class RelatorioCadastro(NamedTuple):
+    """Resultado de `Clientes.cadastrar_lote`.
+
+    Só os recusados são listados, como (posição na entrada, motivo), em
+    ordem de posição.
+    """
+
+    total: int
+    aceitos: int
+    rejeitados: List[Tuple[int, str]]
+
+    def aceito(self, posicao: int) -> bool:
+        """Se o registro da posição foi aceito."""
+        i = bisect_left(self.rejeitados, (posicao,))
+        recusado = i < len(self.rejeitados) and self.rejeitados[i][0] == posicao
+        return 0 <= posicao < self.total and not recusado
+
+    def motivo(self, posicao: int) -> Optional[str]:
+        """Motivo da recusa do registro da posição (None se foi aceito)."""
+        i = bisect_left(self.rejeitados, (posicao,))
+        if i < len(self.rejeitados) and self.rejeitados[i][0] == posicao:
+            return self.rejeitados[i][1]
+        return None
+
 
 class Clientes:
     """
@@ -80,6 +775,40 @@ class Clientes:
 
         return True
 
+    @classmethod
+    def cadastrar_lote(cls, registros: Iterable[Any]) -> RelatorioCadastro:
+        """Valida e grava vários clientes de uma vez.
+
+        `registros` são dicts com "nome", "email" e "cnpj" ou instâncias de
+        `Clientes`. As regras são as de `cadastrar`; os aceitos são gravados
+        juntos, com `ClienteRepositorio.salvar_lote` (uma gravação ou uma
+        transação).
+        """
+        validar_email = _EMAIL.match
+        validar_cnpj = ValidadorCliente.validar_cnpj
+        aceitos: List[Dict[str, Any]] = []
+        rejeitados: List[Tuple[int, str]] = []
+        total = 0
+        for total, registro in enumerate(registros, 1):
+            if isinstance(registro, cls):
+                nome, email, cnpj = registro.nome, registro.email, registro.cnpj
+            else:
+                try:
+                    nome, email, cnpj = registro.get("nome"), registro["email"], registro["cnpj"]
+                except (AttributeError, KeyError, TypeError):
+                    rejeitados.append((total - 1, MOTIVO_REGISTRO))
+                    continue
+            if not isinstance(email, str) or not validar_email(email):
+                rejeitados.append((total - 1, MOTIVO_EMAIL))
+            elif not validar_cnpj(cnpj):
+                rejeitados.append((total - 1, MOTIVO_CNPJ))
+            else:
+                aceitos.append({"nome": nome, "email": email, "cnpj": cnpj})
+
+        if aceitos:
+            ClienteRepositorio.salvar_lote(aceitos)
+        return RelatorioCadastro(total, len(aceitos), rejeitados)
+
     def enviar_email(self) -> None:
         """Função para enviar o email para o usuário. Pode ser implementada futuramente."""
         print("enviando email de boas vindas para", self.email)
@@ -0,0 +1,138 @@
+"""Clientes SQLite Module
+
+Repositório de clientes em SQLite (`sqlite3` da biblioteca padrão), com a
+mesma interface de `ClienteRepositorio` (`salvar`, `carregar`, `buscar`).
+O banco usa WAL, então leituras não bloqueiam a escrita; o CNPJ tem
+índice único e um cliente regravado substitui o anterior, como no
+arquivo. Cada cliente é guardado inteiro em JSON, junto das colunas
+consultadas.
+
+As conexões ficam em um pool pequeno compartilhado entre threads, e as
+consultas usam SQL fixo, reaproveitando os comandos já preparados no
+cache de cada conexão.
+
+Para que `Clientes.cadastrar` grave no banco:
+    definir_repositorio(ClienteRepositorioSQLite("clientes.db"))
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+ESQUEMA = (
+    "CREATE TABLE IF NOT EXISTS clientes ("
+    " cnpj INTEGER NOT NULL, nome TEXT, email TEXT, dados TEXT NOT NULL)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS clientes_cnpj ON clientes (cnpj)",
+)
+INSERIR = "INSERT OR REPLACE INTO clientes (cnpj, nome, email, dados) VALUES (?, ?, ?, ?)"
+BUSCAR = "SELECT dados FROM clientes WHERE cnpj = ?"
+LISTAR = "SELECT dados FROM clientes ORDER BY rowid"
+
+_codificar = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _cnpj(cnpj: Any) -> Any:
+    """CNPJ como inteiro quando possível ("123" e 123 são o mesmo cliente)."""
+    try:
+        return int(cnpj)
+    except (TypeError, ValueError):
+        return cnpj
+
+
+def _linha(cliente: Dict[str, Any]) -> tuple:
+    """Parâmetros de `INSERIR` para um cliente."""
+    return (_cnpj(cliente.get("cnpj")), cliente.get("nome"), cliente.get("email"), _codificar(cliente))
+
+
+class ClienteRepositorioSQLite:
+    """Clientes em um banco SQLite em `path`.
+
+    `tamanho_pool` limita as conexões abertas; uma thread que pede
+    conexão com o pool esgotado espera alguém devolver uma.
+    """
+
+    def __init__(self, path: str = "clientes.db", tamanho_pool: int = 4) -> None:
+        self.path = path
+        self.tamanho_pool = tamanho_pool
+        self._livres: queue.LifoQueue = queue.LifoQueue()
+        self._abertas: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        with self._conexao() as conexao:
+            conexao.execute("PRAGMA journal_mode=WAL")
+            for comando in ESQUEMA:
+                conexao.execute(comando)
+            conexao.commit()
+
+    def salvar(self, cliente: Dict[str, Any], path: Optional[str] = None) -> None:
+        """Salva (ou substitui, pelo CNPJ) um cliente."""
+        with self._conexao() as conexao, conexao:
+            conexao.execute(INSERIR, _linha(cliente))
+
+    def salvar_lote(self, clientes: Iterable[Dict[str, Any]], path: Optional[str] = None) -> int:
+        """Salva vários clientes em uma única transação; retorna quantos."""
+        linhas = [_linha(c) for c in clientes]
+        with self._conexao() as conexao, conexao:
+            conexao.executemany(INSERIR, linhas)
+        return len(linhas)
+
+    def carregar(self, path: Optional[str] = None) -> Dict[Any, Dict[str, Any]]:
+        """Todos os clientes, por CNPJ (mesmo formato do repositório em arquivo)."""
+        clientes = {}
+        for cliente in self.clientes():
+            clientes[cliente["cnpj"]] = cliente
+        return clientes
+
+    def clientes(self) -> Iterator[Dict[str, Any]]:
+        """Percorre os clientes em ordem de gravação, sem montar o dict inteiro."""
+        with self._conexao() as conexao:
+            for (dados,) in conexao.execute(LISTAR):
+                yield json.loads(dados)
+
+    def buscar(self, cnpj: Any, path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Cliente com o CNPJ (None se não houver)."""
+        with self._conexao() as conexao:
+            linha = conexao.execute(BUSCAR, (_cnpj(cnpj),)).fetchone()
+        return json.loads(linha[0]) if linha else None
+
+    def __len__(self) -> int:
+        with self._conexao() as conexao:
+            return conexao.execute("SELECT COUNT(*) FROM clientes").fetchone()[0]
+
+    def fechar(self) -> None:
+        """Fecha todas as conexões do pool."""
+        with self._lock:
+            abertas, self._abertas = self._abertas, []
+            self._livres = queue.LifoQueue()
+        for conexao in abertas:
+            conexao.close()
+
+    def __enter__(self) -> "ClienteRepositorioSQLite":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+    @contextmanager
+    def _conexao(self) -> Iterator[sqlite3.Connection]:
+        """Empresta uma conexão do pool, abrindo outra se ainda couber."""
+        livres = self._livres
+        try:
+            conexao = livres.get_nowait()
+        except queue.Empty:
+            conexao = None
+            with self._lock:
+                if len(self._abertas) < self.tamanho_pool:
+                    conexao = sqlite3.connect(self.path, check_same_thread=False)
+                    conexao.execute("PRAGMA synchronous=NORMAL")
+                    self._abertas.append(conexao)
+            if conexao is None:
+                conexao = livres.get()
+        try:
+            yield conexao
+        finally:
+            livres.put(conexao)
@@ -0,0 +1,165 @@
+"""Cupons Module
+
+Tabela de cupons de desconto orientada a dados. Os cupons ficam indexados
+por (código, produto), então a consulta é O(1) independente do tamanho do
+catálogo, e a tabela pode ser carregada de um arquivo JSON e recarregada
+sem reiniciar o processo.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from src.models.centavos import multiplicar, para_centavos
+
+PERCENTUAL = "percentual"
+FIXO = "fixo"
+TIPOS_CUPOM = (PERCENTUAL, FIXO)
+
+
+class Cupom(NamedTuple):
+    """Cupom de desconto.
+
+    `produtos` vazio significa que o cupom vale para qualquer produto.
+    """
+
+    codigo: str
+    tipo: str
+    valor: float
+    produtos: Tuple[str, ...] = ()
+
+    def aplicar(self, preco):
+        """Aplica o desconto ao preço (escalar ou array NumPy)."""
+        if self.tipo == PERCENTUAL:
+            return preco - (preco * self.valor)
+        return preco - self.valor
+
+    def aplicar_centavos(self, centavos):
+        """Aplica o desconto em centavos inteiros (escalar ou array `int64`)."""
+        if self.tipo == PERCENTUAL:
+            return centavos - multiplicar(centavos, self.valor)
+        return centavos - para_centavos(self.valor)
+
+
+# Cupons historicamente fixos no código
+CUPONS_PADRAO = (
+    Cupom("MEGA10", PERCENTUAL, 0.10),
+    Cupom("NOVO5", PERCENTUAL, 0.05),
+    Cupom("LUB2", FIXO, 2, ("lubrificante",)),
+)
+
+
+class TabelaCupons:
+    """Índice imutável de cupons por (código, produto)."""
+
+    def __init__(self, cupons: Iterable[Cupom]) -> None:
+        indice: Dict[Tuple[str, Optional[str]], Cupom] = {}
+        for cupom in cupons:
+            if cupom.tipo not in TIPOS_CUPOM:
+                raise ValueError(f"tipo de cupom inválido: {cupom.tipo!r}")
+            for produto in cupom.produtos or (None,):
+                indice[(cupom.codigo, produto)] = cupom
+        self._indice = indice
+
+    def buscar(self, codigo: Optional[str], produto: Optional[str] = None) -> Optional[Cupom]:
+        """Busca o cupom; regras específicas do produto têm precedência."""
+        if not codigo:
+            return None
+        indice = self._indice
+        return indice.get((codigo, produto)) or indice.get((codigo, None))
+
+    def codigos(self, produto: Optional[str] = None) -> Tuple[str, ...]:
+        """Códigos de cupom válidos para o produto (ou globais)."""
+        return tuple(sorted({c for c, p in self._indice if p is None or p == produto}))
+
+    @classmethod
+    def carregar(cls, path: str) -> "TabelaCupons":
+        """Carrega a tabela de um arquivo JSON (lista de cupons)."""
+        with open(path, "r", encoding="utf-8") as f:
+            registros = json.load(f)
+        return cls(_cupom_de_registro(r) for r in registros)
+
+
+def _cupom_de_registro(registro: Dict) -> Cupom:
+    """Converte um registro JSON em `Cupom`."""
+    return Cupom(
+        codigo=registro["codigo"],
+        tipo=registro.get("tipo", PERCENTUAL),
+        valor=registro["valor"],
+        produtos=tuple(registro.get("produtos") or ()),
+    )
+
+
+class MonitorCupons:
+    """Recarrega a tabela ativa quando o arquivo de cupons muda.
+
+    A verificação (um `stat`) acontece no máximo uma vez a cada
+    `intervalo` segundos, dentro das próprias consultas.
+    """
+
+    def __init__(self, path: str, intervalo: float = 1.0) -> None:
+        self.path = path
+        self.intervalo = intervalo
+        self._mtime: Optional[int] = None
+        self._proxima = 0.0
+
+    def verificar(self) -> bool:
+        """Recarrega a tabela se o arquivo mudou. Retorna True se recarregou."""
+        agora = time.monotonic()
+        if agora < self._proxima:
+            return False
+        self._proxima = agora + self.intervalo
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self._mtime:
+                return False
+            tabela = TabelaCupons.carregar(self.path)
+        except (OSError, ValueError, KeyError):
+            # Arquivo ausente ou sendo escrito: mantém a tabela atual
+            return False
+        self._mtime = mtime
+        ativar_tabela_cupons(tabela)
+        return True
+
+
+_tabela = TabelaCupons(CUPONS_PADRAO)
+_monitor: Optional[MonitorCupons] = None
+_versao = 0
+
+
+def tabela_cupons() -> TabelaCupons:
+    """Retorna a tabela de cupons ativa."""
+    return _tabela
+
+
+def ativar_tabela_cupons(tabela: TabelaCupons) -> None:
+    """Substitui a tabela ativa (troca atômica de referência)."""
+    global _tabela, _versao
+    _tabela = tabela
+    _versao += 1
+
+
+def versao_cupons() -> int:
+    """Versão da tabela ativa; verifica o arquivo monitorado antes."""
+    if _monitor is not None:
+        _monitor.verificar()
+    return _versao
+
+
+def monitorar_cupons(path: Optional[str], intervalo: float = 1.0) -> None:
+    """Passa a recarregar os cupons de `path`; `None` desativa o monitor."""
+    global _monitor
+    _monitor = MonitorCupons(path, intervalo) if path else None
+    if _monitor:
+        _monitor.verificar()
+
+
+def buscar_cupom(codigo: Optional[str], produto: Optional[str] = None) -> Optional[Cupom]:
+    """Busca um cupom na tabela ativa."""
+    if _monitor is not None:
+        _monitor.verificar()
+    return _tabela.buscar(codigo, produto)
+
@@ -0,0 +1,86 @@
+"""Faixas Module
+
+Motor genérico de faixas de quantidade. Cada produto declara pontos de
+quebra ordenados e o valor aplicado acima de cada um (multiplicador ou
+dedução fixa); a faixa é encontrada por busca binária, então o custo é
+O(log n) no número de faixas, tanto no caminho escalar quanto no lote.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Iterable, Tuple
+
+import numpy as np
+
+from src.models.centavos import dividir_arredondando, fracao, para_centavos
+
+MULTIPLICADOR = "multiplicador"
+DEDUCAO = "deducao"
+
+
+class TabelaFaixas:
+    """Tabela de faixas: `valor` vale para quantidades acima de `limite`.
+
+    Exemplo: `TabelaFaixas([(500, 0.95), (1000, 0.9)])` aplica 5% acima de
+    500 unidades e 10% acima de 1000.
+    """
+
+    __slots__ = (
+        "tipo", "limites", "valores", "_limites_np", "_valores_np",
+        "_fracoes", "_numeradores", "_denominadores",
+    )
+
+    def __init__(self, faixas: Iterable[Tuple[int, float]] = (), tipo: str = MULTIPLICADOR) -> None:
+        if tipo not in (MULTIPLICADOR, DEDUCAO):
+            raise ValueError(f"tipo de faixa inválido: {tipo!r}")
+        ordenadas = sorted(faixas)
+        self.tipo = tipo
+        self.limites = tuple(limite for limite, _ in ordenadas)
+        self.valores = tuple(valor for _, valor in ordenadas)
+        # Posição 0 é o elemento neutro (abaixo do primeiro limite)
+        neutro = 1.0 if tipo == MULTIPLICADOR else 0.0
+        self._limites_np = np.asarray(self.limites, dtype=np.int64)
+        self._valores_np = np.asarray((neutro,) + self.valores, dtype=np.float64)
+        # Forma exata para o modo em centavos: multiplicadores viram frações
+        # e deduções viram centavos (numerador / 1)
+        if tipo == MULTIPLICADOR:
+            fracoes = [(1, 1)] + [fracao(v) for v in self.valores]
+        else:
+            fracoes = [(0, 1)] + [(para_centavos(v), 1) for v in self.valores]
+        self._fracoes = tuple(fracoes)
+        self._numeradores = np.asarray([n for n, _ in fracoes], dtype=np.int64)
+        self._denominadores = np.asarray([d for _, d in fracoes], dtype=np.int64)
+
+    def aplicar(self, preco: float, quantidade: int) -> float:
+        """Aplica ao preço bruto o valor da faixa da quantidade."""
+        i = bisect_left(self.limites, quantidade)
+        if i == 0:
+            return preco
+        if self.tipo == MULTIPLICADOR:
+            return preco * self.valores[i - 1]
+        return preco - self.valores[i - 1]
+
+    def aplicar_lote(self, precos: np.ndarray, quantidades: np.ndarray) -> np.ndarray:
+        """Versão vetorizada de `aplicar`."""
+        valores = self._valores_np[np.searchsorted(self._limites_np, quantidades, side="left")]
+        if self.tipo == MULTIPLICADOR:
+            return precos * valores
+        return precos - valores
+
+    def aplicar_centavos(self, centavos: int, quantidade: int) -> int:
+        """Versão exata de `aplicar`, em centavos inteiros."""
+        i = bisect_left(self.limites, quantidade)
+        if i == 0:
+            return centavos
+        numerador, denominador = self._fracoes[i]
+        if self.tipo == MULTIPLICADOR:
+            return dividir_arredondando(centavos * numerador, denominador)
+        return centavos - numerador
+
+    def aplicar_lote_centavos(self, centavos: np.ndarray, quantidades: np.ndarray) -> np.ndarray:
+        """Versão vetorizada de `aplicar_centavos` sobre arrays `int64`."""
+        i = np.searchsorted(self._limites_np, quantidades, side="left")
+        if self.tipo == MULTIPLICADOR:
+            return dividir_arredondando(centavos * self._numeradores[i], self._denominadores[i])
+        return centavos - self._numeradores[i]
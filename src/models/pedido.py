@@ -0,0 +1,60 @@
+"""Pedido Module
+
+Registro compacto de pedido. `Pedido` é uma tupla nomeada (sem `__dict__`
+por instância) e os textos de produto e cupom são internados, então
+milhões de pedidos compartilham as mesmas strings. Os construtores
+`de_csv`, `de_json` e `de_dict` seguem a mesma conversão dos leitores de
+dicts, e `get` mantém a leitura compatível com o código que usa dicts.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, Mapping, NamedTuple, Optional, Sequence, Union
+
+CAMPOS = ("cliente", "produto", "qtd", "cupom")
+
+
+def _internar(texto: Optional[str]) -> Optional[str]:
+    """Interna o texto (valores vazios viram `None`)."""
+    return sys.intern(texto) if texto else None
+
+
+class Pedido(NamedTuple):
+    """Pedido de combustível: (cliente, produto, qtd, cupom)."""
+
+    cliente: Optional[str]
+    produto: Optional[str]
+    qtd: int
+    cupom: Optional[str] = None
+
+    def get(self, campo: str, padrao: Any = None) -> Any:
+        """Leitura por nome de campo, como em um dict."""
+        return getattr(self, campo, padrao) if campo in CAMPOS else padrao
+
+    @classmethod
+    def criar(cls, cliente: Optional[str], produto: Optional[str], qtd: int, cupom: Optional[str] = None) -> "Pedido":
+        """Cria o pedido internando produto e cupom."""
+        return cls(cliente, _internar(produto), qtd, _internar(cupom))
+
+    @classmethod
+    def de_csv(cls, linha: Sequence[str]) -> "Pedido":
+        """Pedido de uma linha CSV já separada, na ordem de `CAMPOS`."""
+        cliente, produto, qtd, cupom = linha
+        return cls(cliente or None, _internar(produto), int(qtd or 0), _internar(cupom))
+
+    @classmethod
+    def de_dict(cls, dados: Mapping[str, Any]) -> "Pedido":
+        """Pedido a partir de um dict (campos ausentes viram `None`)."""
+        return cls(
+            dados.get("cliente"),
+            _internar(dados.get("produto")),
+            dados.get("qtd"),
+            _internar(dados.get("cupom")),
+        )
+
+    @classmethod
+    def de_json(cls, linha: Union[str, bytes]) -> "Pedido":
+        """Pedido a partir de uma linha JSON."""
+        return cls.de_dict(json.loads(linha))
@@ -0,0 +1,139 @@
+"""Tabela de Preços Module
+
+Livro de preços base versionado e imutável. Cada alteração publica uma
+nova `TabelaPrecos` (cópia na escrita) e troca a referência ativa de uma
+só vez; leitores apenas pegam a referência vigente, sem lock, e nunca
+veem preços de versões diferentes misturados no mesmo pedido.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Mapping
+
+from src.models.centavos import para_centavos
+
+
+class TabelaPrecos(dict):
+    """Snapshot imutável de preços base com número de versão.
+
+    É um `dict` para manter a leitura tão barata quanto a de `BASES`; os
+    métodos de escrita foram bloqueados.
+    """
+
+    def __init__(self, precos: Mapping[str, float], versao: int = 0) -> None:
+        super().__init__(precos)
+        self.versao = versao
+        # Preços base em centavos inteiros, para o modo exato
+        self.centavos = {produto: para_centavos(preco) for produto, preco in self.items()}
+
+    def _imutavel(self, *args, **kwargs):
+        raise TypeError("TabelaPrecos é imutável; altere BASES")
+
+    __setitem__ = __delitem__ = __ior__ = _imutavel
+    update = pop = popitem = setdefault = clear = _imutavel
+
+    def __reduce__(self):
+        return (TabelaPrecos, (dict(self), self.versao))
+
+
+_lock = threading.RLock()
+_ativa = TabelaPrecos({})
+
+
+def tabela_precos() -> TabelaPrecos:
+    """Retorna a tabela de preços vigente."""
+    return _ativa
+
+
+def _publicar(precos: Mapping[str, float]) -> None:
+    """Publica uma nova versão contendo exatamente `precos`."""
+    global _ativa
+    with _lock:
+        _ativa = TabelaPrecos(precos, _ativa.versao + 1)
+
+
+class TabelaBases(dict):
+    """Fachada mutável e compatível com o antigo `BASES`.
+
+    Na tabela ativa (criada por `_criar_bases`), cada escrita publica um
+    novo snapshot com o conteúdo completo do dicionário; `update`, `|=` e
+    `substituir` publicam várias alterações como uma única versão. Outras
+    instâncias se comportam como um `dict` comum e não afetam os preços
+    vigentes.
+    """
+
+    _publica = False
+
+    @property
+    def versao(self) -> int:
+        """Versão do snapshot vigente."""
+        return _ativa.versao
+
+    def _publicar_se_ativa(self) -> None:
+        if self._publica:
+            _publicar(self)
+
+    def __setitem__(self, chave, valor):
+        with _lock:
+            super().__setitem__(chave, valor)
+            self._publicar_se_ativa()
+
+    def __delitem__(self, chave):
+        with _lock:
+            super().__delitem__(chave)
+            self._publicar_se_ativa()
+
+    def update(self, *args, **kwargs):
+        with _lock:
+            super().update(*args, **kwargs)
+            self._publicar_se_ativa()
+
+    def __ior__(self, outro):
+        self.update(outro)
+        return self
+
+    def pop(self, *args):
+        with _lock:
+            valor = super().pop(*args)
+            self._publicar_se_ativa()
+            return valor
+
+    def popitem(self):
+        with _lock:
+            item = super().popitem()
+            self._publicar_se_ativa()
+            return item
+
+    def setdefault(self, chave, valor=None):
+        with _lock:
+            valor = super().setdefault(chave, valor)
+            self._publicar_se_ativa()
+            return valor
+
+    def clear(self):
+        with _lock:
+            super().clear()
+            self._publicar_se_ativa()
+
+    def __reduce__(self):
+        # Cópias (ex.: enviadas a outros processos) não publicam preços
+        return (TabelaBases, (dict(self),))
+
+    def substituir(self, precos: Mapping[str, float]) -> TabelaPrecos:
+        """Troca todos os preços de uma vez e retorna o novo snapshot."""
+        with _lock:
+            super().clear()
+            super().update(precos)
+            if not self._publica:
+                return TabelaPrecos(self)
+            _publicar(self)
+            return _ativa
+
+
+def _criar_bases(precos: Mapping[str, float]) -> TabelaBases:
+    """Cria a tabela de preços ativa (o `BASES` do módulo de calculadora)."""
+    bases = TabelaBases(precos)
+    bases._publica = True
+    _publicar(bases)
+    return bases
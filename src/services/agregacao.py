@@ -0,0 +1,138 @@
+"""
+Module Agregacao.py
+
+Totais, contagens e médias de pedidos por cliente, produto e cupom,
+calculados em fluxo. A memória depende só do número de chaves distintas,
+não do número de pedidos. As somas são compensadas (Neumaier), então o
+total de milhões de valores não acumula erro de arredondamento, e
+agregados parciais (de workers ou arquivos diferentes) podem ser
+mesclados sem perder essa precisão.
+"""
+
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+DIMENSOES = ("cliente", "produto", "cupom")
+
+
+class Soma:
+    """Soma compensada de Neumaier (Kahan-Babuška)."""
+
+    __slots__ = ("soma", "compensacao")
+
+    def __init__(self) -> None:
+        self.soma = 0.0
+        self.compensacao = 0.0
+
+    def adicionar(self, valor: float) -> None:
+        """Soma `valor`, guardando a parte perdida no arredondamento."""
+        t = self.soma + valor
+        if abs(self.soma) >= abs(valor):
+            self.compensacao += (self.soma - t) + valor
+        else:
+            self.compensacao += (valor - t) + self.soma
+        self.soma = t
+
+    def mesclar(self, outra: "Soma") -> None:
+        """Incorpora outra soma parcial."""
+        self.adicionar(outra.soma)
+        self.compensacao += outra.compensacao
+
+    @property
+    def valor(self) -> float:
+        """Soma com a compensação aplicada."""
+        return self.soma + self.compensacao
+
+
+class Grupo:
+    """Total e quantidade de pedidos de uma chave."""
+
+    __slots__ = ("total", "quantidade")
+
+    def __init__(self) -> None:
+        self.total = Soma()
+        self.quantidade = 0
+
+    def adicionar(self, valor: float) -> None:
+        """Conta um pedido de valor `valor`."""
+        self.total.adicionar(valor)
+        self.quantidade += 1
+
+    def mesclar(self, outro: "Grupo") -> None:
+        """Incorpora outro grupo parcial da mesma chave."""
+        self.total.mesclar(outro.total)
+        self.quantidade += outro.quantidade
+
+    @property
+    def media(self) -> float:
+        """Valor médio por pedido."""
+        return self.total.valor / self.quantidade if self.quantidade else 0.0
+
+    def resumo(self) -> Dict[str, float]:
+        """Total, quantidade e média."""
+        return {"total": self.total.valor, "quantidade": self.quantidade, "media": self.media}
+
+
+class Agregador:
+    """Agrega (pedido, valor) por cliente, produto e cupom.
+
+    `dimensoes` escolhe os campos agrupados; o total geral é sempre
+    mantido. Pedidos sem cupom ficam na chave `None`.
+    """
+
+    def __init__(self, dimensoes: Iterable[str] = DIMENSOES) -> None:
+        self.dimensoes = tuple(dimensoes)
+        self.geral = Grupo()
+        self.grupos: Dict[str, Dict[Optional[str], Grupo]] = {d: {} for d in self.dimensoes}
+
+    def adicionar(self, pedido: dict, valor: float) -> None:
+        """Agrega um pedido já precificado."""
+        self.adicionar_chaves(tuple(pedido.get(d) for d in self.dimensoes), valor)
+
+    def adicionar_chaves(self, chaves: tuple, valor: float) -> None:
+        """Agrega um valor dadas as chaves na ordem de `dimensoes`."""
+        self.geral.adicionar(valor)
+        for grupos, chave in zip(self.grupos.values(), chaves):
+            grupo = grupos.get(chave)
+            if grupo is None:
+                grupo = grupos[chave] = Grupo()
+            grupo.adicionar(valor)
+
+    def consumir(self, resultados: Iterable[Tuple[dict, float]]) -> Iterator[Tuple[dict, float]]:
+        """Agrega os resultados à medida que passam, repassando-os adiante."""
+        for pedido, valor in resultados:
+            self.adicionar(pedido, valor)
+            yield pedido, valor
+
+    def mesclar(self, outro: "Agregador") -> "Agregador":
+        """Incorpora um agregado parcial com as mesmas dimensões."""
+        if outro.dimensoes != self.dimensoes:
+            raise ValueError("agregadores com dimensões diferentes")
+        self.geral.mesclar(outro.geral)
+        for dimensao, grupos in outro.grupos.items():
+            destino = self.grupos[dimensao]
+            for chave, grupo in grupos.items():
+                if chave not in destino:
+                    destino[chave] = Grupo()
+                destino[chave].mesclar(grupo)
+        return self
+
+    @property
+    def total(self) -> float:
+        """Total geral."""
+        return self.geral.total.valor
+
+    @property
+    def quantidade(self) -> int:
+        """Quantidade total de pedidos."""
+        return self.geral.quantidade
+
+    def por(self, dimensao: str) -> Dict[Optional[str], Dict[str, float]]:
+        """Resumo de cada chave de uma dimensão (ex.: `por("produto")`)."""
+        return {chave: grupo.resumo() for chave, grupo in self.grupos[dimensao].items()}
+
+    def resumo(self) -> Dict[str, object]:
+        """Resumo geral e por dimensão."""
+        dados: Dict[str, object] = {"geral": self.geral.resumo()}
+        for dimensao in self.dimensoes:
+            dados[dimensao] = self.por(dimensao)
+        return dados
@@ -0,0 +1,67 @@
+"""
+Module Cache.py
+
+Cache LRU de cotações (produto, qtd, cupom) -> preço final. O cache é
+descartado automaticamente quando `versao_precos()` muda, ou seja, quando
+`BASES`, o registry de estratégias ou a tabela de cupons são alterados.
+A versão também faz parte da chave memoizada: uma cotação calculada
+enquanto os preços mudavam fica guardada sob a versão antiga e nunca é
+servida para quem já consulta a nova.
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict
+
+from src.models.calculadora import versao_precos
+
+
+class CacheCotacoes:
+    """Memoização limitada (LRU) de uma função de cotação."""
+
+    def __init__(self, calcular: Callable[..., float], tamanho: int = 4096) -> None:
+        self.tamanho = tamanho
+
+        def _calcular(versao, *chave):  # pylint: disable=unused-argument
+            return calcular(*chave)
+
+        self._calcular = lru_cache(maxsize=tamanho)(_calcular)
+        self._versao = versao_precos()
+        self._acertos = 0
+        self._falhas = 0
+        self.invalidacoes = 0
+
+    def obter(self, *chave) -> float:
+        """Retorna a cotação em cache ou calcula e armazena."""
+        versao = versao_precos()
+        if versao != self._versao:
+            self.invalidar()
+            self._versao = versao
+        return self._calcular(versao, *chave)
+
+    def invalidar(self) -> None:
+        """Descarta todas as cotações (os contadores são preservados)."""
+        info = self._calcular.cache_info()
+        self._acertos += info.hits
+        self._falhas += info.misses
+        self._calcular.cache_clear()
+        self.invalidacoes += 1
+
+    @property
+    def acertos(self) -> int:
+        """Total de consultas atendidas pelo cache."""
+        return self._acertos + self._calcular.cache_info().hits
+
+    @property
+    def falhas(self) -> int:
+        """Total de consultas que precisaram calcular a cotação."""
+        return self._falhas + self._calcular.cache_info().misses
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Resumo de uso do cache."""
+        return {
+            "tamanho": self.tamanho,
+            "itens": self._calcular.cache_info().currsize,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "invalidacoes": self.invalidacoes,
+        }
@@ -0,0 +1,193 @@
+"""
+Module Colunar.py
+
+Formato binário colunar para lotes de pedidos (`.pbcol`). Cliente,
+produto e cupom são gravados como códigos `int32` de um dicionário e as
+quantidades como `int64`, em colunas contíguas e alinhadas. A leitura
+mapeia o arquivo em memória (`np.memmap`): abrir um lote de dezenas de
+milhões de pedidos só lê o cabeçalho, e as colunas são entregues ao motor
+de preços em blocos, sem cópia nem criação de dicts. O motor recebe os
+próprios códigos (`processar_lote_codigos`) e resolve cada produto e
+cupom do dicionário uma única vez.
+
+Layout: `PBCOL001`, tamanho do cabeçalho (`uint64` little-endian),
+cabeçalho JSON (quantidade de pedidos, dicionários e posição de cada
+coluna) e as colunas, cada uma alinhada em 64 bytes.
+"""
+
+import json
+import struct
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.services.pedido import processar_lote_codigos
+
+MAGICA = b"PBCOL001"
+ALINHAMENTO = 64
+TAMANHO_BLOCO = 1_000_000
+
+# Colunas codificadas por dicionário e a coluna numérica, em ordem de gravação
+CODIFICADAS = ("cliente", "produto", "cupom")
+COLUNAS = (("cliente", "<i4"), ("produto", "<i4"), ("cupom", "<i4"), ("qtd", "<i8"))
+
+
+def _alinhar(posicao: int) -> int:
+    """Próxima posição múltipla de `ALINHAMENTO`."""
+    return -(-posicao // ALINHAMENTO) * ALINHAMENTO
+
+
+class _Dicionario:
+    """Atribui um código sequencial a cada valor distinto."""
+
+    def __init__(self) -> None:
+        self.codigos: Dict[Optional[str], int] = {}
+        self.valores: List[Optional[str]] = []
+
+    def codificar(self, valor: Optional[str]) -> int:
+        codigo = self.codigos.get(valor)
+        if codigo is None:
+            codigo = self.codigos[valor] = len(self.valores)
+            self.valores.append(valor)
+        return codigo
+
+
+def escrever_lote(pedidos: Iterable[dict], path: str) -> int:
+    """Grava os pedidos no formato colunar; retorna a quantidade gravada.
+
+    Os pedidos são consumidos em fluxo e apenas os códigos ficam em
+    memória até a gravação (20 bytes por pedido).
+    """
+    dicionarios = {nome: _Dicionario() for nome in CODIFICADAS}
+    codigos = {nome: array("i") for nome in CODIFICADAS}
+    qtds = array("q")
+    for p in pedidos:
+        for nome in CODIFICADAS:
+            codigos[nome].append(dicionarios[nome].codificar(p.get(nome)))
+        qtds.append(p.get("qtd") or 0)
+
+    dados = {nome: np.frombuffer(codigos[nome], dtype=np.intc) for nome in CODIFICADAS}
+    dados["qtd"] = np.frombuffer(qtds, dtype=np.longlong)
+
+    colunas, posicao = {}, 0
+    for nome, dtype in COLUNAS:
+        colunas[nome] = {"dtype": dtype, "offset": posicao}
+        posicao = _alinhar(posicao + len(qtds) * np.dtype(dtype).itemsize)
+
+    cabecalho = json.dumps({
+        "n": len(qtds),
+        "dicionarios": {nome: dicionarios[nome].valores for nome in CODIFICADAS},
+        "colunas": colunas,
+    }, ensure_ascii=False).encode("utf-8")
+
+    with open(path, "wb") as f:
+        f.write(MAGICA)
+        f.write(struct.pack("<Q", len(cabecalho)))
+        f.write(cabecalho)
+        inicio = _alinhar(f.tell())
+        for nome, dtype in COLUNAS:
+            f.write(b"\0" * (inicio + colunas[nome]["offset"] - f.tell()))
+            f.write(dados[nome].astype(dtype, copy=False).tobytes())
+    return len(qtds)
+
+
+class LoteColunar:
+    """Lote de pedidos `.pbcol` mapeado em memória (somente leitura).
+
+    `produtos`, `cupons` e `clientes` são os códigos de cada pedido e
+    `dicionarios[coluna]` traduz código em valor; `qtds` é a coluna de
+    quantidades. Todos são arrays apoiados no arquivo.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            if f.read(len(MAGICA)) != MAGICA:
+                raise ValueError(f"{path} não é um lote colunar")
+            (tamanho,) = struct.unpack("<Q", f.read(8))
+            cabecalho = json.loads(f.read(tamanho).decode("utf-8"))
+
+        self.path = path
+        self.n: int = cabecalho["n"]
+        self.dicionarios: Dict[str, Tuple[Optional[str], ...]] = {
+            nome: tuple(valores) for nome, valores in cabecalho["dicionarios"].items()
+        }
+        self._textos: Optional[Dict[str, np.ndarray]] = None
+
+        inicio = _alinhar(len(MAGICA) + 8 + tamanho)
+        colunas = {}
+        for nome, dtype in COLUNAS:
+            if self.n == 0:
+                colunas[nome] = np.empty(0, dtype=dtype)
+                continue
+            colunas[nome] = np.memmap(
+                path, dtype=dtype, mode="r",
+                offset=inicio + cabecalho["colunas"][nome]["offset"], shape=(self.n,),
+            )
+        self.clientes = colunas["cliente"]
+        self.produtos = colunas["produto"]
+        self.cupons = colunas["cupom"]
+        self.qtds = colunas["qtd"]
+
+    def __len__(self) -> int:
+        return self.n
+
+    def colunas(self, inicio: int = 0, fim: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(produtos, quantidades, cupons) do intervalo, no formato de `processar_lote`.
+
+        Produtos e cupons são decodificados em arrays de texto; para
+        precificar, `precificar_codigos` evita essa expansão.
+        """
+        return self._decodificar(slice(inicio, fim))
+
+    def selecionar(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Como `colunas`, mas para as linhas em `indices`."""
+        return self._decodificar(indices)
+
+    def precificar_codigos(self, linhas, centavos: bool = False) -> np.ndarray:
+        """Valor final dos pedidos em `linhas` (fatia ou índices), direto dos códigos."""
+        return processar_lote_codigos(
+            self.produtos[linhas], self.dicionarios["produto"], self.qtds[linhas],
+            self.cupons[linhas], self.dicionarios["cupom"], centavos=centavos,
+        )
+
+    def precificar(self, tamanho_bloco: int = TAMANHO_BLOCO, centavos: bool = False) -> Iterator[np.ndarray]:
+        """Valor final de cada pedido, em blocos de `tamanho_bloco` (mesma ordem)."""
+        for inicio in range(0, self.n, tamanho_bloco):
+            yield self.precificar_codigos(slice(inicio, inicio + tamanho_bloco), centavos)
+
+    def _decodificar(self, linhas) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Produtos e cupons das linhas como texto (None vira ""), e as quantidades."""
+        if self._textos is None:
+            self._textos = {
+                nome: np.array(["" if v is None else v for v in valores] or [""], dtype=str)
+                for nome, valores in self.dicionarios.items()
+            }
+        return (
+            self._textos["produto"][self.produtos[linhas]],
+            self.qtds[linhas],
+            self._textos["cupom"][self.cupons[linhas]],
+        )
+
+    def pedidos(self, inicio: int = 0, fim: Optional[int] = None) -> Iterator[dict]:
+        """Reconstrói os pedidos do intervalo como dicts, sob demanda."""
+        clientes, produtos, cupons = (self.dicionarios[nome] for nome in CODIFICADAS)
+        fatia = slice(inicio, fim)
+        colunas = (self.clientes[fatia], self.produtos[fatia], self.qtds[fatia], self.cupons[fatia])
+        for cliente, produto, qtd, cupom in zip(*(c.tolist() for c in colunas)):
+            yield {
+                "cliente": clientes[cliente],
+                "produto": produtos[produto],
+                "qtd": qtd,
+                "cupom": cupons[cupom],
+            }
+
+    def resultados(self, tamanho_bloco: int = TAMANHO_BLOCO) -> Iterator[Tuple[dict, float]]:
+        """(pedido, valor) de cada pedido, como `processar_pedidos`."""
+        for inicio, valores in zip(range(0, self.n, tamanho_bloco), self.precificar(tamanho_bloco)):
+            yield from zip(self.pedidos(inicio, inicio + tamanho_bloco), valores.tolist())
+
+
+def abrir_lote(path: str) -> LoteColunar:
+    """Abre um lote `.pbcol` sem carregar as colunas."""
+    return LoteColunar(path)
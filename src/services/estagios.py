@@ -0,0 +1,226 @@
+"""
+Module Estagios.py
+
+Processamento em estágios (threads): leitura -> precificação -> escrita,
+ligados por filas limitadas. Os pedidos andam em blocos para diluir o
+custo das filas. Quando um estágio fica lento (montagem de rede na
+leitura, rajadas na escrita), a fila antes dele enche e o estágio
+anterior espera: a memória fica limitada por
+`tamanho_fila * tamanho_bloco` pedidos em trânsito.
+
+Cada estágio mede itens processados, tempo trabalhando, tempo esperando
+entrada (ocioso) e tempo bloqueado na fila de saída, além da
+profundidade da fila de saída.
+"""
+
+import queue
+import threading
+import time
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from src.services.pedido import processar_pedido
+
+_FIM = object()
+_ESPERA = 0.05  # intervalo para checar cancelamento enquanto espera uma fila
+
+
+def _precificar_pedido(p) -> Tuple[Any, float]:
+    """(pedido, valor) de um pedido."""
+    return p, processar_pedido(p)
+
+
+class EstatisticasEstagio:
+    """Vazão, tempos e profundidade da fila de saída de um estágio."""
+
+    def __init__(self, nome: str) -> None:
+        self.nome = nome
+        self.itens = 0
+        self.trabalhando = 0.0
+        self.ocioso = 0.0
+        self.bloqueado = 0.0
+        self.fila_max = 0
+        self._soma_fila = 0
+        self._amostras = 0
+
+    def observar_fila(self, profundidade: int) -> None:
+        """Registra a profundidade da fila de saída após um envio."""
+        self.fila_max = max(self.fila_max, profundidade)
+        self._soma_fila += profundidade
+        self._amostras += 1
+
+    def resumo(self, decorrido: float) -> Dict[str, float]:
+        """Itens/s e tempos do estágio em um intervalo de `decorrido` segundos."""
+        return {
+            "itens": self.itens,
+            "itens_por_segundo": self.itens / decorrido if decorrido else 0.0,
+            "trabalhando_s": self.trabalhando,
+            "ocioso_s": self.ocioso,
+            "bloqueado_s": self.bloqueado,
+            "fila_media": self._soma_fila / self._amostras if self._amostras else 0.0,
+            "fila_max": self.fila_max,
+        }
+
+
+class PipelineEstagios:
+    """Leitura, transformação e escrita em threads ligadas por filas limitadas.
+
+    `fonte` é lida pela thread de leitura, `transformar` (padrão:
+    `processar_pedido`, gerando (pedido, valor)) é aplicada a cada item
+    pela thread de precificação e `gravar` recebe um iterável com os
+    resultados, consumido na thread que chama `executar`.
+    """
+
+    def __init__(
+        self,
+        transformar: Callable[[Any], Any] = _precificar_pedido,
+        tamanho_fila: int = 64,
+        tamanho_bloco: int = 256,
+    ) -> None:
+        self.transformar = transformar
+        self.tamanho_fila = tamanho_fila
+        self.tamanho_bloco = tamanho_bloco
+        self.estatisticas = {
+            nome: EstatisticasEstagio(nome) for nome in ("leitura", "precificacao", "escrita")
+        }
+        self.decorrido = 0.0
+        self._cancelar = threading.Event()
+        self._erros: List[BaseException] = []
+
+    def executar(self, fonte: Iterable, gravar: Callable[[Iterable], Any]) -> Any:
+        """Roda os três estágios até o fim da fonte; devolve o retorno de `gravar`.
+
+        Um erro em qualquer estágio cancela os demais e é relançado aqui.
+        """
+        self._cancelar.clear()
+        self._erros = []
+        lidos: queue.Queue = queue.Queue(self.tamanho_fila)
+        precificados: queue.Queue = queue.Queue(self.tamanho_fila)
+        threads = [
+            threading.Thread(target=self._proteger, args=(self._ler, fonte, lidos), name="leitura", daemon=True),
+            threading.Thread(
+                target=self._proteger, args=(self._precificar, lidos, precificados), name="precificacao", daemon=True
+            ),
+        ]
+        inicio = time.perf_counter()
+        for t in threads:
+            t.start()
+        try:
+            resultado = gravar(self._consumir(precificados))
+        except BaseException as erro:
+            self._falhar(erro)
+        finally:
+            self._cancelar.set()
+            for t in threads:
+                t.join()
+            self.decorrido = time.perf_counter() - inicio
+        if self._erros:
+            raise self._erros[0]
+        return resultado
+
+    def resumo(self) -> Dict[str, Dict[str, float]]:
+        """Estatísticas de cada estágio da última execução."""
+        return {nome: e.resumo(self.decorrido) for nome, e in self.estatisticas.items()}
+
+    def _proteger(self, estagio: Callable, *args) -> None:
+        """Executa um estágio, registrando o erro e cancelando os demais."""
+        try:
+            estagio(*args)
+        except BaseException as erro:  # pylint: disable=broad-except
+            self._falhar(erro)
+
+    def _falhar(self, erro: BaseException) -> None:
+        """Guarda o erro e sinaliza o cancelamento."""
+        self._erros.append(erro)
+        self._cancelar.set()
+
+    def _enviar(self, fila: queue.Queue, bloco, estatisticas: EstatisticasEstagio) -> bool:
+        """Coloca o bloco na fila, esperando se estiver cheia (backpressure)."""
+        t0 = time.perf_counter()
+        while not self._cancelar.is_set():
+            try:
+                fila.put(bloco, timeout=_ESPERA)
+            except queue.Full:
+                continue
+            estatisticas.bloqueado += time.perf_counter() - t0
+            estatisticas.observar_fila(fila.qsize())
+            return True
+        return False
+
+    def _receber(self, fila: queue.Queue, estatisticas: EstatisticasEstagio):
+        """Retira um bloco da fila, esperando se estiver vazia."""
+        t0 = time.perf_counter()
+        while not self._cancelar.is_set():
+            try:
+                bloco = fila.get(timeout=_ESPERA)
+            except queue.Empty:
+                continue
+            estatisticas.ocioso += time.perf_counter() - t0
+            return bloco
+        return _FIM
+
+    def _ler(self, fonte: Iterable, saida: queue.Queue) -> None:
+        """Estágio de leitura: agrupa a fonte em blocos."""
+        estatisticas = self.estatisticas["leitura"]
+        fonte = iter(fonte)
+        while True:
+            t0 = time.perf_counter()
+            bloco = list(islice(fonte, self.tamanho_bloco))
+            estatisticas.trabalhando += time.perf_counter() - t0
+            if not bloco:
+                self._enviar(saida, _FIM, estatisticas)
+                return
+            estatisticas.itens += len(bloco)
+            if not self._enviar(saida, bloco, estatisticas):
+                return
+
+    def _precificar(self, entrada: queue.Queue, saida: queue.Queue) -> None:
+        """Estágio de precificação: aplica `transformar` a cada item."""
+        estatisticas = self.estatisticas["precificacao"]
+        transformar = self.transformar
+        while True:
+            bloco = self._receber(entrada, estatisticas)
+            if bloco is _FIM:
+                self._enviar(saida, _FIM, estatisticas)
+                return
+            t0 = time.perf_counter()
+            resultado = [transformar(item) for item in bloco]
+            estatisticas.trabalhando += time.perf_counter() - t0
+            estatisticas.itens += len(resultado)
+            if not self._enviar(saida, resultado, estatisticas):
+                return
+
+    def _consumir(self, entrada: queue.Queue) -> Iterator:
+        """Estágio de escrita: entrega os resultados, um a um, para `gravar`."""
+        estatisticas = self.estatisticas["escrita"]
+        while True:
+            bloco = self._receber(entrada, estatisticas)
+            if bloco is _FIM:
+                if self._erros:
+                    raise self._erros[0]
+                return
+            t0 = time.perf_counter()
+            yield from bloco
+            estatisticas.trabalhando += time.perf_counter() - t0
+            estatisticas.itens += len(bloco)
+
+
+def processar_em_estagios(
+    pedidos: Iterable,
+    gravar: Callable[[Iterable[Tuple[Any, float]]], Any],
+    tamanho_fila: int = 64,
+    tamanho_bloco: int = 256,
+) -> Tuple[Any, PipelineEstagios]:
+    """Precifica `pedidos` em estágios; devolve (retorno de `gravar`, pipeline com estatísticas)."""
+    pipeline = PipelineEstagios(_precificar_pedido, tamanho_fila, tamanho_bloco)
+    return pipeline.executar(pedidos, gravar), pipeline
+
+
+def formatar_estatisticas(resumo: Dict[str, Dict[str, float]]) -> Iterator[str]:
+    """Uma linha legível por estágio."""
+    for nome, e in resumo.items():
+        yield (
+            f"{nome}: {e['itens']} itens, {e['itens_por_segundo']:.0f}/s, "
+            f"trabalhando {e['trabalhando_s']:.3f}s, ocioso {e['ocioso_s']:.3f}s, "
+            f"bloqueado {e['bloqueado_s']:.3f}s, fila média {e['fila_media']:.1f} (máx. {e['fila_max']})"
+        )
@@ -0,0 +1,217 @@
+"""
+Module Fluxo.py
+
+Leitura e escrita incremental de pedidos em arquivos JSONL ou CSV. Os
+pedidos são lidos um a um, precificados com `processar_pedidos` e os
+resultados gravados à medida que saem, com memória constante. Com
+`compacto`, os pedidos são lidos como `Pedido` em vez de dicts. Lotes no
+formato colunar (`.pbcol`, ver `services/colunar.py`) também são aceitos
+como entrada.
+"""
+
+import csv
+import io
+import json
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from src.models.pedido import CAMPOS, Pedido
+from src.services.agregacao import Agregador, Soma
+from src.services.colunar import abrir_lote
+from src.services.estagios import PipelineEstagios
+from src.services.paralelo import TAMANHO_LOTE, em_lotes, mapear_em_ordem, precificar
+from src.services.pedido import processar_pedidos
+
+JSONL = "jsonl"
+CSV = "csv"
+COLUNAR = "colunar"
+
+
+def detectar_formato(path: str) -> str:
+    """Formato pelo nome do arquivo: `.csv`, `.pbcol` ou JSON lines (padrão)."""
+    path = path.lower()
+    if path.endswith(".csv"):
+        return CSV
+    if path.endswith(".pbcol"):
+        return COLUNAR
+    return JSONL
+
+
+def ler_pedidos(arquivo: TextIO, formato: str = JSONL, compacto: bool = False) -> Iterator[Union[dict, Pedido]]:
+    """Lê pedidos de um arquivo aberto, sob demanda.
+
+    Com `compacto`, cada pedido é um `Pedido` (tupla com textos
+    internados) em vez de um dict.
+    """
+    if formato == CSV:
+        if compacto:
+            yield from _ler_csv_compacto(arquivo)
+            return
+        for linha in csv.DictReader(arquivo):
+            yield _pedido_csv(linha)
+        return
+
+    converter = Pedido.de_json if compacto else json.loads
+    for linha in arquivo:
+        linha = linha.strip()
+        if linha:
+            yield converter(linha)
+
+
+def _ler_csv_compacto(arquivo: TextIO) -> Iterator[Pedido]:
+    """Lê CSV posicionalmente, reordenando as colunas do cabeçalho uma única vez."""
+    leitor = csv.reader(arquivo)
+    cabecalho = next(leitor, None)
+    if cabecalho is None:
+        return
+    if tuple(cabecalho) == CAMPOS:
+        for linha in leitor:
+            yield Pedido.de_csv(linha)
+        return
+    posicoes = [cabecalho.index(c) if c in cabecalho else None for c in CAMPOS]
+    for linha in leitor:
+        yield Pedido.de_csv([linha[i] if i is not None and i < len(linha) else "" for i in posicoes])
+
+
+def _pedido_csv(linha: dict) -> dict:
+    """Converte os campos textuais de uma linha CSV."""
+    return {
+        "cliente": linha.get("cliente"),
+        "produto": linha.get("produto"),
+        "qtd": int(linha.get("qtd") or 0),
+        "cupom": linha.get("cupom") or None,
+    }
+
+
+def escrever_resultados(
+    resultados: Iterable[Tuple[dict, float]], arquivo: TextIO, formato: str = JSONL, cabecalho: bool = True
+) -> Tuple[int, float]:
+    """Grava (pedido, valor) incrementalmente; retorna (quantidade, total).
+
+    Sem `cabecalho`, a saída CSV não repete a linha de títulos (usado
+    nos blocos gravados pelos workers).
+    """
+    quantidade, total = 0, Soma()
+
+    if formato == CSV:
+        escritor = csv.writer(arquivo)
+        if cabecalho:
+            escritor.writerow(CAMPOS + ("valor",))
+        for p, valor in resultados:
+            escritor.writerow([p.get(c) if p.get(c) is not None else "" for c in CAMPOS] + [valor])
+            quantidade += 1
+            total.adicionar(valor)
+        return quantidade, total.valor
+
+    for p, valor in resultados:
+        registro = p._asdict() if isinstance(p, Pedido) else p
+        arquivo.write(json.dumps({**registro, "valor": valor}, ensure_ascii=False) + "\n")
+        quantidade += 1
+        total.adicionar(valor)
+    return quantidade, total.valor
+
+
+def _processar_linhas(
+    linhas: List[str],
+    formato_entrada: str,
+    formato_saida: str,
+    compacto: bool,
+    dimensoes: Optional[Tuple[str, ...]],
+) -> Tuple[str, int, float, Optional[Agregador]]:
+    """Lê, precifica e serializa um bloco de linhas cruas (executado no worker).
+
+    Devolve o texto de saída do bloco, a quantidade, o total e, com
+    `dimensoes`, o agregado parcial.
+    """
+    lote = list(ler_pedidos(linhas, formato_entrada, compacto))
+    resultados = zip(lote, precificar(lote))
+    parcial = None
+    if dimensoes is not None:
+        parcial = Agregador(dimensoes)
+        resultados = parcial.consumir(resultados)
+    saida = io.StringIO()
+    quantidade, total = escrever_resultados(resultados, saida, formato_saida, cabecalho=False)
+    return saida.getvalue(), quantidade, total, parcial
+
+
+def _processar_paralelo(
+    fin: TextIO,
+    fout: TextIO,
+    formato_entrada: str,
+    formato_saida: str,
+    workers: int,
+    tamanho_lote: int,
+    agregador: Optional[Agregador],
+    compacto: bool,
+) -> Tuple[int, float]:
+    """Distribui blocos de linhas cruas aos workers e grava os textos em ordem.
+
+    No CSV, a linha de títulos acompanha cada bloco; registros com quebra
+    de linha dentro de aspas não são suportados neste modo.
+    """
+    titulos = [fin.readline()] if formato_entrada == CSV else []
+    blocos = (titulos + bloco for bloco in em_lotes(fin, tamanho_lote))
+    if formato_saida == CSV:
+        csv.writer(fout).writerow(CAMPOS + ("valor",))
+    dimensoes = agregador.dimensoes if agregador is not None else None
+
+    quantidade, total = 0, Soma()
+    resultados = mapear_em_ordem(
+        _processar_linhas, blocos, workers, formato_entrada, formato_saida, compacto, dimensoes
+    )
+    for _, (texto, n, soma, parcial) in resultados:
+        fout.write(texto)
+        quantidade += n
+        total.adicionar(soma)
+        if parcial is not None:
+            agregador.mesclar(parcial)
+    return quantidade, total.valor
+
+
+def processar_arquivo(
+    entrada: str,
+    saida: str,
+    formato_entrada: Optional[str] = None,
+    formato_saida: Optional[str] = None,
+    workers: int = 0,
+    tamanho_lote: int = TAMANHO_LOTE,
+    agregador: Optional[Agregador] = None,
+    compacto: bool = False,
+    estagios: Optional[PipelineEstagios] = None,
+) -> Tuple[int, float]:
+    """Precifica todos os pedidos de `entrada` e grava os valores em `saida`.
+
+    Com `workers`, blocos de `tamanho_lote` linhas cruas vão para um pool
+    de processos (ver `services/paralelo.py`), e cada worker lê,
+    precifica, agrega e serializa o seu bloco; o processo pai só grava os
+    textos na ordem da entrada. Entradas colunares são precificadas em
+    blocos direto do arquivo mapeado. Com
+    `agregador`, os resultados também são agregados à medida que passam;
+    com `compacto`, os pedidos lidos são `Pedido` em vez de dicts. Com
+    `estagios`, leitura, precificação e escrita rodam em threads ligadas
+    por filas limitadas (as estatísticas ficam no próprio pipeline).
+    """
+    formato_entrada = formato_entrada or detectar_formato(entrada)
+    formato_saida = formato_saida or detectar_formato(saida)
+    if formato_entrada == COLUNAR:
+        with open(saida, "w", encoding="utf-8", newline="") as fout:
+            resultados = abrir_lote(entrada).resultados()
+            if agregador is not None:
+                resultados = agregador.consumir(resultados)
+            return escrever_resultados(resultados, fout, formato_saida)
+    with open(entrada, "r", encoding="utf-8", newline="") as fin, \
+            open(saida, "w", encoding="utf-8", newline="") as fout:
+        if estagios is None and workers:
+            return _processar_paralelo(
+                fin, fout, formato_entrada, formato_saida, workers, tamanho_lote, agregador, compacto
+            )
+        pedidos = ler_pedidos(fin, formato_entrada, compacto)
+        if estagios is not None:
+            def gravar(resultados):
+                if agregador is not None:
+                    resultados = agregador.consumir(resultados)
+                return escrever_resultados(resultados, fout, formato_saida)
+            return estagios.executar(pedidos, gravar)
+        resultados = processar_pedidos(pedidos)
+        if agregador is not None:
+            resultados = agregador.consumir(resultados)
+        return escrever_resultados(resultados, fout, formato_saida)
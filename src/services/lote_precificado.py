@@ -0,0 +1,258 @@
+"""
+Module Lote_precificado.py
+
+Lote de pedidos já precificado e gravado em disco, com reprecificação
+incremental. O diretório do lote guarda:
+
+- `pedidos.pbcol`: os pedidos no formato colunar (`services/colunar.py`);
+- `valores.npy`: o valor de cada pedido, alterado no lugar (mmap);
+- `indice.npz`: linhas agrupadas por par (produto, cupom);
+- `estado.json`: preços, estratégias e cupons usados e os totais.
+
+Quando `BASES`, uma estratégia ou um cupom mudam, `reprecificar()`
+compara o estado vigente com o gravado, recalcula só os pares
+(produto, cupom) afetados e ajusta os totais pela diferença, com custo
+proporcional às linhas afetadas e não ao lote inteiro. Assume-se, como em
+`FaixasStrategy`, que o preço de um produto depende apenas do próprio
+preço base.
+
+`estado.json` é o ponto de confirmação. Antes de alterar `valores.npy`, o
+estado é gravado com os pares pendentes e com os totais já sem as linhas
+desses pares. Se o processo cair no meio, a abertura do lote encontra a
+marca e refaz a reprecificação dos pares pendentes.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.models.calculadora import STRATEGY_REGISTRY
+from src.models.cupons import tabela_cupons
+from src.models.tabela_precos import tabela_precos
+from src.services.agregacao import Soma
+from src.services.colunar import TAMANHO_BLOCO, LoteColunar, escrever_lote
+
+PEDIDOS = "pedidos.pbcol"
+VALORES = "valores.npy"
+INDICE = "indice.npz"
+ESTADO = "estado.json"
+
+
+def _estado_produto(produto: Optional[str]) -> list:
+    """Preço base e estratégia vigentes do produto."""
+    cls = STRATEGY_REGISTRY.get(produto)
+    estrategia = f"{cls.__module__}.{cls.__qualname__}" if cls else None
+    return [tabela_precos().get(produto), estrategia]
+
+
+def _estado_cupom(codigo: Optional[str], produto: Optional[str]) -> Optional[list]:
+    """Regra vigente do cupom para o produto (None se não houver)."""
+    cupom = tabela_cupons().buscar(codigo, produto)
+    return [cupom.tipo, cupom.valor] if cupom else None
+
+
+def _somas(valores: List[list]) -> List[Soma]:
+    """Reconstrói somas gravadas como [soma, compensação]."""
+    somas = []
+    for soma, compensacao in valores:
+        s = Soma()
+        s.soma, s.compensacao = soma, compensacao
+        somas.append(s)
+    return somas
+
+
+class LotePrecificado:
+    """Lote precificado em `diretorio` (ver docstring do módulo)."""
+
+    def __init__(self, diretorio: str) -> None:
+        self.diretorio = diretorio
+        self.pedidos = LoteColunar(os.path.join(diretorio, PEDIDOS))
+        self.valores = np.load(os.path.join(diretorio, VALORES), mmap_mode="r+")
+        with np.load(os.path.join(diretorio, INDICE)) as indice:
+            self._ordem = indice["ordem"]
+            self._inicios = indice["inicios"]
+        with open(os.path.join(diretorio, ESTADO), "r", encoding="utf-8") as f:
+            estado = json.load(f)
+        self._precos: List[list] = estado["produtos"]
+        self._cupons: List[List[Optional[list]]] = estado["cupons"]
+        self._geral = _somas([estado["totais"]["geral"]])[0]
+        self._por_produto = _somas(estado["totais"]["produto"])
+        self._por_cupom = _somas(estado["totais"]["cupom"])
+        pendentes = estado.get("pendente")
+        if pendentes:
+            pares = [tuple(par) for par in pendentes]
+            self._concluir(pares, self.linhas(pares))
+
+    @classmethod
+    def criar(cls, pedidos: Iterable[dict], diretorio: str, tamanho_bloco: int = TAMANHO_BLOCO) -> "LotePrecificado":
+        """Grava, precifica e indexa um novo lote em `diretorio`."""
+        os.makedirs(diretorio, exist_ok=True)
+        escrever_lote(pedidos, os.path.join(diretorio, PEDIDOS))
+        lote = LoteColunar(os.path.join(diretorio, PEDIDOS))
+        produtos, cupons = lote.dicionarios["produto"], lote.dicionarios["cupom"]
+
+        valores = np.lib.format.open_memmap(
+            os.path.join(diretorio, VALORES), mode="w+", dtype=np.float64, shape=(lote.n,)
+        )
+        geral, por_produto, por_cupom = Soma(), [Soma() for _ in produtos], [Soma() for _ in cupons]
+        for inicio, bloco in zip(range(0, lote.n, tamanho_bloco), lote.precificar(tamanho_bloco)):
+            fim = inicio + len(bloco)
+            valores[inicio:fim] = bloco
+            geral.adicionar(float(bloco.sum()))
+            _acumular(por_produto, lote.produtos[inicio:fim], bloco)
+            _acumular(por_cupom, lote.cupons[inicio:fim], bloco)
+        valores.flush()
+        del valores
+
+        # Linhas agrupadas por par (produto, cupom): ordem[inicios[k]:inicios[k + 1]]
+        chaves = lote.produtos.astype(np.int64) * len(cupons) + lote.cupons
+        ordem = np.argsort(chaves, kind="stable")
+        inicios = np.searchsorted(chaves[ordem], np.arange(len(produtos) * len(cupons) + 1))
+        np.savez(os.path.join(diretorio, INDICE), ordem=ordem, inicios=inicios)
+
+        _gravar_estado(diretorio, {
+            "produtos": [_estado_produto(p) for p in produtos],
+            "cupons": [[_estado_cupom(c, p) for p in produtos] for c in cupons],
+            "totais": {
+                "geral": [geral.soma, geral.compensacao],
+                "produto": [[s.soma, s.compensacao] for s in por_produto],
+                "cupom": [[s.soma, s.compensacao] for s in por_cupom],
+            },
+        })
+        return cls(diretorio)
+
+    def __len__(self) -> int:
+        return self.pedidos.n
+
+    def pares_afetados(self) -> List[Tuple[int, int]]:
+        """Pares (produto, cupom), em códigos, cujo preço mudou desde o último cálculo.
+
+        Só entram pares que têm pedidos no lote.
+        """
+        produtos = self.pedidos.dicionarios["produto"]
+        cupons = self.pedidos.dicionarios["cupom"]
+        mudaram = {i for i, p in enumerate(produtos) if _estado_produto(p) != self._precos[i]}
+        inicios = self._inicios
+        return [
+            (i, j)
+            for i, p in enumerate(produtos)
+            for j, c in enumerate(cupons)
+            if inicios[i * len(cupons) + j + 1] > inicios[i * len(cupons) + j]
+            and (i in mudaram or _estado_cupom(c, p) != self._cupons[j][i])
+        ]
+
+    def linhas(self, pares: Iterable[Tuple[int, int]]) -> np.ndarray:
+        """Linhas (ordenadas) dos pedidos dos pares informados."""
+        n_cupons = len(self.pedidos.dicionarios["cupom"])
+        partes = [
+            self._ordem[self._inicios[k]:self._inicios[k + 1]]
+            for k in (i * n_cupons + j for i, j in pares)
+        ]
+        if not partes:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(partes))
+
+    def reprecificar(self) -> int:
+        """Recalcula apenas os pedidos afetados por mudanças; retorna quantos."""
+        pares = self.pares_afetados()
+        if not pares:
+            return 0
+        linhas = self.linhas(pares)
+        if len(linhas):
+            self._somar(linhas, -self.valores[linhas])
+        self._salvar_estado(pendente=pares)
+        return self._concluir(pares, linhas)
+
+    @property
+    def total(self) -> float:
+        """Total de todos os pedidos."""
+        return self._geral.valor
+
+    def total_produto(self, produto: str) -> float:
+        """Total dos pedidos de um produto."""
+        return self._total(self._por_produto, "produto", produto)
+
+    def total_cupom(self, cupom: Optional[str]) -> float:
+        """Total dos pedidos com um cupom (`None` para sem cupom)."""
+        return self._total(self._por_cupom, "cupom", cupom)
+
+    def totais(self) -> Dict[str, Dict[Optional[str], float]]:
+        """Totais por produto e por cupom."""
+        return {
+            nome: dict(zip(self.pedidos.dicionarios[nome], (s.valor for s in somas)))
+            for nome, somas in (("produto", self._por_produto), ("cupom", self._por_cupom))
+        }
+
+    def _total(self, somas: List[Soma], coluna: str, chave: Optional[str]) -> float:
+        """Total de uma chave (0.0 se ela não aparece no lote)."""
+        dicionario = self.pedidos.dicionarios[coluna]
+        return somas[dicionario.index(chave)].valor if chave in dicionario else 0.0
+
+    def _concluir(self, pares: List[Tuple[int, int]], linhas: np.ndarray) -> int:
+        """Grava os valores vigentes das `linhas` de `pares` e confirma o estado.
+
+        Os totais já não contam essas linhas; os novos valores são somados
+        a eles e o estado é gravado sem a marca de pendência.
+        """
+        if len(linhas):
+            novos = self.pedidos.precificar_codigos(linhas)
+            self.valores[linhas] = novos
+            self.valores.flush()
+            self._somar(linhas, novos)
+
+        produtos = self.pedidos.dicionarios["produto"]
+        cupons = self.pedidos.dicionarios["cupom"]
+        for i, j in pares:
+            self._precos[i] = _estado_produto(produtos[i])
+            self._cupons[j][i] = _estado_cupom(cupons[j], produtos[i])
+        self._salvar_estado()
+        return len(linhas)
+
+    def _somar(self, linhas: np.ndarray, valores: np.ndarray) -> None:
+        """Soma `valores` (das `linhas`) ao total geral e aos totais por chave."""
+        self._geral.adicionar(float(valores.sum()))
+        _acumular(self._por_produto, self.pedidos.produtos[linhas], valores)
+        _acumular(self._por_cupom, self.pedidos.cupons[linhas], valores)
+
+    def _salvar_estado(self, pendente: Optional[List[Tuple[int, int]]] = None) -> None:
+        """Grava preços, cupons e totais vigentes.
+
+        `pendente` marca os pares cujos valores vão ser regravados.
+        """
+        estado = {
+            "produtos": self._precos,
+            "cupons": self._cupons,
+            "totais": {
+                "geral": [self._geral.soma, self._geral.compensacao],
+                "produto": [[s.soma, s.compensacao] for s in self._por_produto],
+                "cupom": [[s.soma, s.compensacao] for s in self._por_cupom],
+            },
+        }
+        if pendente:
+            estado["pendente"] = [list(par) for par in pendente]
+        _gravar_estado(self.diretorio, estado)
+
+
+def _acumular(somas: List[Soma], codigos: np.ndarray, valores: np.ndarray) -> None:
+    """Soma `valores` às somas de cada código (agrupando com `bincount`)."""
+    parciais = np.bincount(codigos, weights=valores, minlength=len(somas))
+    for codigo in np.flatnonzero(np.bincount(codigos, minlength=len(somas))):
+        somas[codigo].adicionar(float(parciais[codigo]))
+
+
+def _gravar_estado(diretorio: str, estado: dict) -> None:
+    """Grava `estado.json` com troca atômica do arquivo."""
+    path = os.path.join(diretorio, ESTADO)
+    temporario = f"{path}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(estado, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporario, path)
+
+
+def abrir_lote_precificado(diretorio: str) -> LotePrecificado:
+    """Abre um lote precificado existente."""
+    return LotePrecificado(diretorio)
@@ -0,0 +1,131 @@
+"""
+Module Metricas.py
+
+Contadores e histogramas de latência por etapa de `processar_pedido`,
+separados por produto e cupom. A coleta só existe quando ativada em
+`services/pedido.py`; desativada, o custo é uma comparação por pedido.
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Limites superiores dos buckets, em nanossegundos (o último é +Inf)
+BUCKETS_NS = (100, 250, 500, 1_000, 2_500, 5_000, 10_000, 25_000, 100_000, 1_000_000)
+
+Chave = Tuple[str, str, str]
+
+
+class Histograma:
+    """Histograma de latência com buckets fixos."""
+
+    __slots__ = ("buckets", "soma_ns", "total")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(BUCKETS_NS) + 1)
+        self.soma_ns = 0
+        self.total = 0
+
+    def observar(self, duracao_ns: int) -> None:
+        """Registra uma duração."""
+        self.buckets[bisect_left(BUCKETS_NS, duracao_ns)] += 1
+        self.soma_ns += duracao_ns
+        self.total += 1
+
+    def media_ns(self) -> float:
+        """Latência média em nanossegundos."""
+        return self.soma_ns / self.total if self.total else 0.0
+
+
+class MetricasPedido:
+    """Métricas de `processar_pedido` por (etapa, produto, cupom)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pedidos: Dict[Tuple[str, str], int] = {}
+        self._histogramas: Dict[Chave, Histograma] = {}
+
+    def registrar(self, produto, cupom, duracoes: Iterable[Tuple[str, int]]) -> None:
+        """Registra um pedido e a duração (ns) de cada etapa executada."""
+        produto, cupom = str(produto), cupom or ""
+        with self._lock:
+            chave = (produto, cupom)
+            self._pedidos[chave] = self._pedidos.get(chave, 0) + 1
+            for etapa, duracao in duracoes:
+                histograma = self._histogramas.get((etapa, produto, cupom))
+                if histograma is None:
+                    histograma = self._histogramas[(etapa, produto, cupom)] = Histograma()
+                histograma.observar(duracao)
+
+    def pedidos(self, produto: Optional[str] = None, cupom: Optional[str] = None) -> int:
+        """Total de pedidos, opcionalmente filtrado por produto e/ou cupom."""
+        return sum(
+            n for (p, c), n in self._pedidos.items()
+            if (produto is None or p == produto) and (cupom is None or c == cupom)
+        )
+
+    def histograma(self, etapa: str, produto: str, cupom: Optional[str] = None) -> Optional[Histograma]:
+        """Histograma de uma etapa para produto e cupom."""
+        return self._histogramas.get((etapa, produto, cupom or ""))
+
+    def resumo(self) -> List[Dict]:
+        """Uma linha por (etapa, produto, cupom) com contagem e média."""
+        with self._lock:
+            return [
+                {
+                    "etapa": etapa,
+                    "produto": produto,
+                    "cupom": cupom,
+                    "total": h.total,
+                    "media_ns": h.media_ns(),
+                }
+                for (etapa, produto, cupom), h in sorted(self._histogramas.items())
+            ]
+
+    def limpar(self) -> None:
+        """Zera todas as métricas."""
+        with self._lock:
+            self._pedidos.clear()
+            self._histogramas.clear()
+
+    def formatar_prometheus(self) -> str:
+        """Métricas no formato texto de exposição do Prometheus."""
+        linhas = [
+            "# HELP petrobahia_pedidos_total Pedidos processados.",
+            "# TYPE petrobahia_pedidos_total counter",
+        ]
+        with self._lock:
+            for (produto, cupom), n in sorted(self._pedidos.items()):
+                linhas.append(f"petrobahia_pedidos_total{{{_rotulos(produto=produto, cupom=cupom)}}} {n}")
+
+            linhas += [
+                "# HELP petrobahia_pedido_etapa_segundos Latência por etapa de processar_pedido.",
+                "# TYPE petrobahia_pedido_etapa_segundos histogram",
+            ]
+            nome = "petrobahia_pedido_etapa_segundos"
+            for (etapa, produto, cupom), h in sorted(self._histogramas.items()):
+                rotulos = _rotulos(etapa=etapa, produto=produto, cupom=cupom)
+                acumulado = 0
+                for limite, n in zip(BUCKETS_NS + (None,), h.buckets):
+                    acumulado += n
+                    le = "+Inf" if limite is None else repr(limite / 1e9)
+                    linhas.append(f'{nome}_bucket{{{rotulos},le="{le}"}} {acumulado}')
+                linhas.append(f"{nome}_sum{{{rotulos}}} {h.soma_ns / 1e9!r}")
+                linhas.append(f"{nome}_count{{{rotulos}}} {h.total}")
+        return "\n".join(linhas) + "\n"
+
+    def exportar_prometheus(self, path: str) -> None:
+        """Grava as métricas para o textfile collector (troca atômica do arquivo)."""
+        temporario = f"{path}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            f.write(self.formatar_prometheus())
+        os.replace(temporario, path)
+
+
+def _rotulos(**rotulos: str) -> str:
+    """Formata rótulos Prometheus, escapando os valores."""
+    return ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in rotulos.items()
+    )
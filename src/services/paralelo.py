@@ -0,0 +1,140 @@
+"""
+Module Paralelo.py
+
+Precificação em lote usando vários processos. Os pedidos são divididos em
+lotes, cada lote é precificado por `processar_lote` em um processo do
+pool e os resultados são devolvidos na ordem da entrada. Apenas alguns
+lotes ficam em andamento ao mesmo tempo, então a memória continua limitada
+mesmo para arquivos enormes.
+
+O trabalho por pedido (montar as colunas, as chaves de agregação e, em
+`services/fluxo.py`, ler e serializar as linhas) fica nos workers; o
+processo pai só distribui os lotes e junta as respostas. `mapear_em_ordem`
+é o laço comum a esses modos.
+
+`agregar_paralelo` faz o mesmo, mas cada worker devolve apenas o
+agregado parcial do seu lote (ver `services/agregacao.py`), mesclado no
+processo pai.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from src.models.calculadora import BASES, STRATEGY_REGISTRY, register_strategy
+from src.models.cupons import TabelaCupons, ativar_tabela_cupons, tabela_cupons
+from src.services.agregacao import DIMENSOES, Agregador
+from src.services.pedido import processar_lote
+
+TAMANHO_LOTE = 10_000
+
+Colunas = Tuple[List[str], List[int], List[Optional[str]]]
+Bloco = TypeVar("Bloco")
+
+
+def _iniciar_worker(registry: Dict[str, type], precos: Dict[str, float], cupons: TabelaCupons) -> None:
+    """Reproduz no worker as estratégias, preços e cupons do processo pai."""
+    for nome, cls in registry.items():
+        if STRATEGY_REGISTRY.get(nome) is not cls:
+            register_strategy(nome, cls)
+    BASES.substituir(precos)
+    ativar_tabela_cupons(cupons)
+
+
+def precificar(lote: Sequence[Any]) -> List[float]:
+    """Valores de um lote de pedidos (dicts ou `Pedido`), no worker."""
+    produtos, qtds, cupons = _colunas(lote)
+    return processar_lote(produtos, qtds, cupons).tolist()
+
+
+def _colunas(lote: Sequence[Any]) -> Colunas:
+    """Só os campos usados no cálculo."""
+    return (
+        [p.get("produto") or "" for p in lote],
+        [p.get("qtd") for p in lote],
+        [p.get("cupom") for p in lote],
+    )
+
+
+def mapear_em_ordem(
+    funcao: Callable[..., Any],
+    blocos: Iterable[Bloco],
+    workers: Optional[int] = None,
+    *argumentos: Any,
+) -> Iterator[Tuple[Bloco, Any]]:
+    """Aplica `funcao(bloco, *argumentos)` em um pool, devolvendo (bloco, resultado) em ordem.
+
+    `workers` padrão é o número de CPUs. No máximo `2 * workers` blocos
+    ficam em andamento; o próximo só é lido quando o mais antigo sai.
+    Os workers recebem as estratégias, preços e cupons do processo pai.
+    """
+    workers = workers or os.cpu_count() or 1
+    iniciais = (dict(STRATEGY_REGISTRY), dict(BASES), tabela_cupons())
+    blocos = iter(blocos)
+    pendentes = deque()
+
+    with ProcessPoolExecutor(workers, initializer=_iniciar_worker, initargs=iniciais) as pool:
+        while True:
+            while len(pendentes) < 2 * workers:
+                bloco = next(blocos, None)
+                if bloco is None:
+                    break
+                pendentes.append((bloco, pool.submit(funcao, bloco, *argumentos)))
+
+            if not pendentes:
+                return
+
+            bloco, futuro = pendentes.popleft()
+            yield bloco, futuro.result()
+
+
+def em_lotes(itens: Iterable[Bloco], tamanho_lote: int = TAMANHO_LOTE) -> Iterator[List[Bloco]]:
+    """Listas de até `tamanho_lote` itens consecutivos."""
+    itens = iter(itens)
+    while True:
+        lote = list(islice(itens, tamanho_lote))
+        if not lote:
+            return
+        yield lote
+
+
+def processar_paralelo(
+    pedidos: Iterable[dict],
+    workers: Optional[int] = None,
+    tamanho_lote: int = TAMANHO_LOTE,
+) -> Iterator[Tuple[dict, float]]:
+    """Precifica pedidos em `workers` processos, devolvendo (pedido, valor) em ordem.
+
+    Para arquivos, `processar_arquivo(..., workers=...)` é mais rápido:
+    lá os workers recebem as linhas cruas e também fazem a leitura e a
+    serialização.
+    """
+    for lote, valores in mapear_em_ordem(precificar, em_lotes(pedidos, tamanho_lote), workers):
+        yield from zip(lote, valores)
+
+
+def _agregar(lote: Sequence[Any], dimensoes: Tuple[str, ...]) -> Agregador:
+    """Precifica e agrega um lote (executado no worker)."""
+    agregador = Agregador(dimensoes)
+    for pedido, valor in zip(lote, precificar(lote)):
+        agregador.adicionar(pedido, valor)
+    return agregador
+
+
+def agregar_paralelo(
+    pedidos: Iterable[dict],
+    workers: Optional[int] = None,
+    tamanho_lote: int = TAMANHO_LOTE,
+    dimensoes: Sequence[str] = DIMENSOES,
+) -> Agregador:
+    """Totais por `dimensoes` dos pedidos, precificados e agregados em `workers` processos.
+
+    Só os agregados parciais voltam dos workers; a memória do processo
+    pai depende do número de chaves, não de pedidos.
+    """
+    total = Agregador(dimensoes)
+    for _, parcial in mapear_em_ordem(_agregar, em_lotes(pedidos, tamanho_lote), workers, total.dimensoes):
+        total.mesclar(parcial)
+    return total
@@ -1,39 +1,247 @@
 """
 Module Pedido.py
+
+Cada produto registrado é compilado uma vez em uma função
+preço -> limite -> desconto -> arredondamento (`pipeline_pedido`), com o
+arredondamento declarado na própria estratégia; o caminho por pedido é
+uma consulta e uma chamada.
 """
 
-from src.models.calculadora import PrecoCalculadora
+from logging import DEBUG, INFO, WARNING
+from time import perf_counter_ns
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models.calculadora import PrecoCalculadora, definir_alerta_negativo, pipeline_pedido
+from src.models.pedido import Pedido
+from src.services.cache import CacheCotacoes
+from src.services.metricas import MetricasPedido
+from src.services.registro import obter_logger, registrar
+
+from src.services.tabelas_cotacao import TabelasCotacao
+
+_log = obter_logger("pedido")
 
 
 def processar_pedido(p):
-    """Processar_pedido: processa o pedido e calcula o preço a partir de PrecoCalculadora"""
+    """Processar_pedido: processa o pedido (dict ou `Pedido`) e calcula o preço"""
+
+    if type(p) is Pedido:
+        _, prod, qtd, cupom = p
+    else:
+        prod = p.get("produto")
+        qtd = p.get("qtd")
+        cupom = p.get("cupom")
+
+    if qtd == 0:
+        if _log.isEnabledFor(DEBUG):
+            registrar(_log, DEBUG, "qtd zero, retornando 0", cliente=p.get("cliente"), produto=prod)
+        return 0
+
+    if _metricas is not None:
+        return _processar_instrumentado(p, prod, qtd, cupom)
+
+    preco = _tabelas.consultar(prod, qtd, cupom) if _tabelas is not None else None
+
+    if preco is None:
+        if _cache is not None:
+            preco = _cache.obter(prod, qtd, cupom)
+        else:
+            preco = pipeline_pedido(prod)(qtd, cupom)
+
+    if _log.isEnabledFor(INFO):
+        _registrar_pedido(p, prod, qtd, cupom, preco)
+
+    return preco
+
+
+def _registrar_pedido(p, prod, qtd, cupom, preco) -> None:
+    """Evento estruturado de pedido processado."""
+    registrar(
+        _log, INFO, "pedido ok",
+        cliente=p.get("cliente"), produto=prod, qtd=qtd, cupom=cupom, valor=preco,
+    )
+
+
+def processar_pedidos(pedidos: Iterable[dict]) -> Iterator[Tuple[dict, float]]:
+    """Processa um fluxo de pedidos sob demanda, devolvendo (pedido, valor).
+
+    Nada é acumulado: cada pedido é lido, precificado e liberado antes do
+    próximo, então a memória não depende do tamanho da entrada.
+    """
+    for p in pedidos:
+        yield p, processar_pedido(p)
+
+
+def _calcular_preco_final(prod, qtd, cupom):
+    """Preço, desconto e arredondamento de um pedido."""
+    return pipeline_pedido(prod)(qtd, cupom)
+
+
+def _alertar_preco_negativo(prod, qtd) -> None:
+    """Registra pedidos cujo preço calculado ficou negativo."""
+    registrar(_log, WARNING, "algo deu errado, preco negativo", produto=prod, qtd=qtd)
+
+
+definir_alerta_negativo(_alertar_preco_negativo)
+
+
+def processar_pedido_centavos(p) -> int:
+    """Versão exata de `processar_pedido`: devolve o valor em centavos inteiros.
 
+    Preço base, faixas e cupons são aplicados em aritmética inteira; o
+    diesel é arredondado para reais inteiros e os demais já estão em
+    centavos, então somar os resultados não acumula erro.
+    """
     prod = p.get("produto")
     qtd = p.get("qtd")
-    cupom = p.get("cupom")
 
     if qtd == 0:
-        print("qtd zero, retornando 0")
         return 0
 
     calculadora = PrecoCalculadora(prod, qtd)
-    preco = calculadora.calcular_preco()
+    centavos = max(calculadora.calcular_preco_centavos(), 0)
+    centavos = calculadora.calcular_desconto_centavos(p.get("cupom"), centavos)
+    return calculadora.arredondar_centavos(centavos)
 
-    if preco < 0:
-        print("algo deu errado, preco negativo")
-        preco = 0
 
-    preco = calculadora.calcular_desconto(cupom, preco)
+def _processar_instrumentado(p, prod, qtd, cupom):
+    """Mesmo fluxo de `processar_pedido`, medindo cada etapa."""
+    duracoes = []
+    t0 = perf_counter_ns()
 
-    if prod == "diesel":
-        preco = round(preco, 0)
+    preco = _tabelas.consultar(prod, qtd, cupom) if _tabelas is not None else None
+    if _tabelas is not None:
+        t1 = perf_counter_ns()
+        duracoes.append(("tabela", t1 - t0))
+        t0 = t1
 
-    elif prod == "gasolina":
-        preco = round(preco, 2)
+    if preco is None and _cache is not None:
+        preco = _cache.obter(prod, qtd, cupom)
+        t1 = perf_counter_ns()
+        duracoes.append(("cache", t1 - t0))
+        t0 = t1
 
-    else:
-        preco = float(int(preco * 100) / 100.0)
+    if preco is None:
+        calculadora = PrecoCalculadora(prod, qtd)
+        t1 = perf_counter_ns()
+        duracoes.append(("estrategia", t1 - t0))
+
+        preco = calculadora.calcular_preco()
+        t2 = perf_counter_ns()
+        duracoes.append(("preco_base", t2 - t1))
+
+        if preco < 0:
+            registrar(_log, WARNING, "algo deu errado, preco negativo", produto=prod, qtd=qtd)
+            preco = 0
+        t3 = perf_counter_ns()
+        duracoes.append(("limite", t3 - t2))
+
+        preco = calculadora.calcular_desconto(cupom, preco)
+        t4 = perf_counter_ns()
+        duracoes.append(("desconto", t4 - t3))
 
-    print("pedido ok:", p["cliente"], prod, qtd, "=>", preco)
+        preco = calculadora.arredondar(preco)
+        t0 = perf_counter_ns()
+        duracoes.append(("arredondamento", t0 - t4))
 
+    if _log.isEnabledFor(INFO):
+        _registrar_pedido(p, prod, qtd, cupom, preco)
+    duracoes.append(("saida", perf_counter_ns() - t0))
+
+    _metricas.registrar(prod, cupom, duracoes)
     return preco
+
+
+_metricas: Optional[MetricasPedido] = None
+
+
+def ativar_metricas() -> MetricasPedido:
+    """Ativa a coleta de métricas por etapa em `processar_pedido`."""
+    global _metricas
+    _metricas = MetricasPedido()
+    return _metricas
+
+
+def desativar_metricas() -> None:
+    """Desativa a coleta de métricas."""
+    global _metricas
+    _metricas = None
+
+
+_cache: Optional[CacheCotacoes] = None
+
+
+def ativar_cache(tamanho: int = 4096) -> CacheCotacoes:
+    """Ativa o cache LRU de cotações em `processar_pedido`."""
+    global _cache
+    _cache = CacheCotacoes(_calcular_preco_final, tamanho)
+    return _cache
+
+
+def desativar_cache() -> None:
+    """Desativa o cache de cotações."""
+    global _cache
+    _cache = None
+
+
+_tabelas: Optional[TabelasCotacao] = None
+
+
+def ativar_tabelas_cotacao(
+    qtd_min: int = 1, qtd_max: int = 5000, cupons: Optional[Iterable[str]] = None
+) -> TabelasCotacao:
+    """Pré-calcula cotações para a faixa de quantidades e passa a usá-las."""
+    global _tabelas
+    _tabelas = TabelasCotacao(processar_lote_codigos, qtd_min, qtd_max, cupons)
+    return _tabelas
+
+
+def desativar_tabelas_cotacao() -> None:
+    """Desativa as tabelas de cotações pré-calculadas."""
+    global _tabelas
+    _tabelas = None
+
+
+def processar_lote(
+    produtos: Iterable[str],
+    quantidades: Iterable[int],
+    cupons: Optional[Iterable[Optional[str]]] = None,
+    centavos: bool = False,
+) -> np.ndarray:
+    """Processa vários pedidos de uma vez, com a mesma semântica de `processar_pedido`.
+
+    Recebe colunas (produtos, quantidades, cupons) e devolve um array com
+    o valor final de cada pedido, idêntico ao caminho escalar. Com
+    `centavos`, segue `processar_pedido_centavos` e devolve `int64`.
+    """
+    qtds = np.asarray(quantidades, dtype=np.int64)
+    precos = PrecoCalculadora.calcular_lote(
+        produtos, qtds, cupons, limitar_negativos=True, centavos=centavos, arredondar=True
+    )
+    precos[qtds == 0] = 0
+    return precos
+
+
+def processar_lote_codigos(
+    codigos_produtos: np.ndarray,
+    produtos: Sequence[Optional[str]],
+    quantidades: Iterable[int],
+    codigos_cupons: Optional[np.ndarray] = None,
+    cupons: Sequence[Optional[str]] = (None,),
+    centavos: bool = False,
+) -> np.ndarray:
+    """`processar_lote` com produtos e cupons codificados por dicionário.
+
+    Recebe os códigos inteiros de cada pedido e os dicionários (como as
+    colunas de um lote `.pbcol`); cada produto e cupom distinto é resolvido
+    uma única vez.
+    """
+    qtds = np.asarray(quantidades, dtype=np.int64)
+    precos = PrecoCalculadora.calcular_lote_codigos(
+        codigos_produtos, produtos, qtds, codigos_cupons, cupons,
+        limitar_negativos=True, centavos=centavos, arredondar=True,
+    )
+    precos[qtds == 0] = 0
+    return precos
@@ -0,0 +1,109 @@
+"""
+Module Registro.py
+
+Log estruturado (JSON lines) dos serviços, sobre o `logging` da
+biblioteca padrão. Os registros passam por um buffer em memória, podem
+ser amostrados e só são montados quando o nível está habilitado: quem
+registra testa `logger.isEnabledFor(nivel)` antes de montar os campos.
+"""
+
+import json
+import logging
+import random
+import sys
+from logging.handlers import MemoryHandler
+from typing import Optional, TextIO, Union
+
+LOGGER = "petrobahia"
+
+_handler: Optional[MemoryHandler] = None
+
+
+def obter_logger(nome: str) -> logging.Logger:
+    """Logger filho de `petrobahia` (ex.: `petrobahia.pedido`)."""
+    return logging.getLogger(f"{LOGGER}.{nome}")
+
+
+def registrar(logger: logging.Logger, nivel: int, evento: str, **campos) -> None:
+    """Emite um evento estruturado; os campos vão para o JSON."""
+    logger.log(nivel, evento, extra={"campos": campos})
+
+
+class FormatadorJson(logging.Formatter):
+    """Formata cada registro como uma linha JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        dados = {
+            "ts": round(record.created, 6),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "evento": record.getMessage(),
+        }
+        dados.update(getattr(record, "campos", {}))
+        return json.dumps(dados, ensure_ascii=False, default=str)
+
+
+class FiltroAmostragem(logging.Filter):
+    """Deixa passar apenas uma fração dos registros abaixo de WARNING."""
+
+    def __init__(self, taxa: float) -> None:
+        super().__init__()
+        self.taxa = taxa
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or random.random() < self.taxa
+
+
+def configurar_log(
+    nivel: Union[int, str] = logging.INFO,
+    destino: Union[str, TextIO, None] = None,
+    capacidade: int = 1000,
+    amostragem: float = 1.0,
+) -> logging.Logger:
+    """Configura o log estruturado dos serviços.
+
+    `destino` é um caminho de arquivo ou stream (padrão: stderr). Os
+    registros são gravados em lotes de `capacidade` (ou imediatamente a
+    partir de ERROR), e `amostragem` define a fração mantida abaixo de
+    WARNING.
+    """
+    global _handler
+    encerrar_log()
+
+    if isinstance(destino, str):
+        saida: logging.Handler = logging.FileHandler(destino, encoding="utf-8")
+    else:
+        saida = logging.StreamHandler(destino or sys.stderr)
+    saida.setFormatter(FormatadorJson())
+
+    _handler = MemoryHandler(capacidade, flushLevel=logging.ERROR, target=saida)
+    if amostragem < 1.0:
+        _handler.addFilter(FiltroAmostragem(amostragem))
+
+    logger = logging.getLogger(LOGGER)
+    logger.setLevel(nivel)
+    logger.addHandler(_handler)
+    logger.propagate = False
+    return logger
+
+
+def descarregar_log() -> None:
+    """Grava imediatamente os registros em buffer."""
+    if _handler is not None:
+        _handler.flush()
+
+
+def encerrar_log() -> None:
+    """Descarrega o buffer e remove a configuração feita por `configurar_log`."""
+    global _handler
+    if _handler is None:
+        return
+    logger = logging.getLogger(LOGGER)
+    logger.removeHandler(_handler)
+    saida = _handler.target
+    _handler.close()
+    if saida is not None:
+        saida.close()
+    _handler = None
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
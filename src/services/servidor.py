@@ -0,0 +1,271 @@
+"""
+Module Servidor.py
+
+Serviço local (asyncio) de cotação de pedidos com micro-lotes adaptativos.
+
+Protocolo de linhas sobre TCP: o cliente envia um pedido JSON por linha
+(`{"cliente": ..., "produto": ..., "qtd": ..., "cupom": ...}`) e recebe
+uma linha `{"valor": ...}` ou `{"erro": ...}`. A linha
+`{"comando": "estatisticas"}` devolve latência (p50/p99) e lotes/s.
+
+Pedidos concorrentes são agrupados e precificados juntos por
+`processar_lote`. A janela de espera se adapta à carga: cresce enquanto
+os lotes enchem e volta a zero quando chegam pedidos isolados, para não
+adicionar latência com o serviço ocioso.
+
+Uso: python -m src.services.servidor --porta 8765
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from logging import ERROR
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.services.pedido import processar_lote
+from src.services.registro import obter_logger, registrar
+
+_log = obter_logger("servidor")
+
+# Quantidades aceitas: as que cabem no `int64` usado pelo lote
+QTD_MINIMA = -(2**63)
+QTD_MAXIMA = 2**63 - 1
+
+
+class EstatisticasServidor:
+    """Latência por pedido e vazão de lotes."""
+
+    def __init__(self, janela: int = 10_000) -> None:
+        self.inicio = time.monotonic()
+        self.pedidos = 0
+        self.lotes = 0
+        self._latencias = deque(maxlen=janela)
+
+    def registrar_lote(self, tamanho: int) -> None:
+        """Conta um lote processado."""
+        self.lotes += 1
+        self.pedidos += tamanho
+
+    def registrar_latencia(self, segundos: float) -> None:
+        """Registra o tempo entre a chegada e a resposta de um pedido."""
+        self._latencias.append(segundos)
+
+    def percentil(self, p: float) -> float:
+        """Percentil `p` (0-100) das latências recentes, em segundos."""
+        if not self._latencias:
+            return 0.0
+        ordenadas = sorted(self._latencias)
+        return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * p / 100))]
+
+    def resumo(self) -> Dict[str, float]:
+        """Vazão e latência desde o início do serviço."""
+        decorrido = max(time.monotonic() - self.inicio, 1e-9)
+        return {
+            "pedidos": self.pedidos,
+            "lotes": self.lotes,
+            "lotes_por_segundo": self.lotes / decorrido,
+            "pedidos_por_lote": self.pedidos / self.lotes if self.lotes else 0.0,
+            "latencia_p50": self.percentil(50),
+            "latencia_p99": self.percentil(99),
+        }
+
+
+class MicroLote:
+    """Agrupa pedidos concorrentes e os precifica em lote."""
+
+    def __init__(self, tamanho_maximo: int = 512, espera_maxima: float = 0.002) -> None:
+        self.tamanho_maximo = tamanho_maximo
+        self.espera_maxima = espera_maxima
+        self.espera = 0.0
+        self.estatisticas = EstatisticasServidor()
+        self._fila: asyncio.Queue = asyncio.Queue()
+        self._tarefa: Optional[asyncio.Task] = None
+
+    def iniciar(self) -> None:
+        """Inicia o consumidor de lotes no loop corrente."""
+        self._tarefa = asyncio.get_running_loop().create_task(self._consumir())
+
+    async def parar(self) -> None:
+        """Interrompe o consumidor de lotes."""
+        if self._tarefa:
+            self._tarefa.cancel()
+            try:
+                await self._tarefa
+            except asyncio.CancelledError:
+                pass
+
+    async def cotar(self, pedido: dict) -> float:
+        """Enfileira o pedido e aguarda o valor calculado no próximo lote."""
+        futuro = asyncio.get_running_loop().create_future()
+        await self._fila.put((pedido, futuro, time.monotonic()))
+        return await futuro
+
+    async def _coletar(self) -> List[Tuple[dict, asyncio.Future, float]]:
+        """Espera o primeiro pedido e junta os que chegarem dentro da janela."""
+        lote = [await self._fila.get()]
+        limite = time.monotonic() + self.espera
+        while len(lote) < self.tamanho_maximo:
+            if not self._fila.empty():
+                lote.append(self._fila.get_nowait())
+                continue
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                break
+            try:
+                lote.append(await asyncio.wait_for(self._fila.get(), restante))
+            except asyncio.TimeoutError:
+                break
+        return lote
+
+    def _adaptar(self, tamanho: int) -> None:
+        """Aumenta a janela sob carga e a zera com pedidos isolados."""
+        if tamanho >= self.tamanho_maximo:
+            self.espera = min(max(self.espera * 2, self.espera_maxima / 8), self.espera_maxima)
+        elif tamanho == 1:
+            self.espera = self.espera / 2 if self.espera > self.espera_maxima / 8 else 0.0
+
+    async def _consumir(self) -> None:
+        """Laço principal: coleta, precifica e responde cada lote.
+
+        Um erro inesperado em um lote é repassado aos pedidos dele e não
+        interrompe o laço.
+        """
+        while True:
+            lote = await self._coletar()
+            try:
+                self._responder(lote)
+            except Exception as erro:  # pylint: disable=broad-except
+                registrar(_log, ERROR, "falha ao responder lote", tamanho=len(lote), erro=repr(erro))
+                for _, futuro, _ in lote:
+                    if not futuro.done():
+                        futuro.set_exception(erro)
+
+    def _responder(self, lote: List[Tuple[dict, asyncio.Future, float]]) -> None:
+        """Valida, precifica e entrega o resultado de cada pedido do lote.
+
+        Futuros já resolvidos (ex.: chamador cancelado por timeout) são
+        ignorados.
+        """
+        self._adaptar(len(lote))
+        validos = []
+        for pedido, futuro, _ in lote:
+            erro = _validar(pedido)
+            if erro:
+                if not futuro.done():
+                    futuro.set_exception(ValueError(erro))
+            else:
+                validos.append((pedido, futuro))
+
+        if validos:
+            try:
+                valores = _precificar([p for p, _ in validos])
+            except Exception:  # pylint: disable=broad-except
+                # Um pedido ruim não derruba o lote: cada um é refeito sozinho
+                valores = [_precificar_isolado(p) for p, _ in validos]
+            for (_, futuro), valor in zip(validos, valores):
+                if futuro.done():
+                    continue
+                if isinstance(valor, Exception):
+                    futuro.set_exception(valor)
+                else:
+                    futuro.set_result(valor)
+        self.estatisticas.registrar_lote(len(lote))
+        agora = time.monotonic()
+        for _, _, chegada in lote:
+            self.estatisticas.registrar_latencia(agora - chegada)
+
+
+def _precificar(pedidos: List[dict]) -> List[float]:
+    """Valores de pedidos já validados, em uma chamada a `processar_lote`."""
+    return processar_lote(
+        [p["produto"] for p in pedidos],
+        [p["qtd"] for p in pedidos],
+        [p.get("cupom") for p in pedidos],
+    ).tolist()
+
+
+def _precificar_isolado(pedido: dict) -> Union[float, Exception]:
+    """Valor de um pedido sozinho, ou a exceção que ele provocou."""
+    try:
+        return _precificar([pedido])[0]
+    except Exception as erro:  # pylint: disable=broad-except
+        return erro
+
+
+def _validar(pedido) -> Optional[str]:
+    """Mensagem de erro se o pedido não puder ser precificado."""
+    if not isinstance(pedido, dict):
+        return "pedido deve ser um objeto JSON"
+    if not isinstance(pedido.get("produto"), str):
+        return "produto inválido"
+    if type(pedido.get("qtd")) is not int:
+        return "qtd deve ser inteiro"
+    if not QTD_MINIMA <= pedido["qtd"] <= QTD_MAXIMA:
+        return "qtd fora do intervalo suportado"
+    if pedido.get("cupom") is not None and not isinstance(pedido["cupom"], str):
+        return "cupom inválido"
+    return None
+
+
+async def _atender(micro: MicroLote, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Atende uma conexão: uma resposta por linha recebida, na mesma ordem."""
+    try:
+        while True:
+            linha = await reader.readline()
+            if not linha:
+                break
+            try:
+                pedido = json.loads(linha)
+                if isinstance(pedido, dict) and pedido.get("comando") == "estatisticas":
+                    resposta = micro.estatisticas.resumo()
+                else:
+                    resposta = {"valor": await micro.cotar(pedido)}
+            except Exception as erro:  # pylint: disable=broad-except
+                resposta = {"erro": str(erro)}
+            writer.write(json.dumps(resposta).encode() + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def iniciar_servidor(
+    host: str = "127.0.0.1",
+    porta: int = 8765,
+    tamanho_maximo: int = 512,
+    espera_maxima: float = 0.002,
+) -> Tuple[asyncio.AbstractServer, MicroLote]:
+    """Inicia o servidor; `porta=0` escolhe uma porta livre."""
+    micro = MicroLote(tamanho_maximo, espera_maxima)
+    micro.iniciar()
+    servidor = await asyncio.start_server(
+        lambda r, w: _atender(micro, r, w), host, porta
+    )
+    return servidor, micro
+
+
+async def _servir(args) -> None:
+    """Inicia o servidor e atende até ser interrompido."""
+    servidor, _ = await iniciar_servidor(args.host, args.porta, args.tamanho_lote, args.espera)
+    print("servindo em", ", ".join(str(s.getsockname()) for s in servidor.sockets))
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def main(argv=None) -> None:
+    """Linha de comando do serviço."""
+    parser = argparse.ArgumentParser(description="Serviço local de cotação de pedidos")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--tamanho-lote", type=int, default=512, help="pedidos máximos por micro-lote")
+    parser.add_argument("--espera", type=float, default=0.002, help="janela máxima de agrupamento (s)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_servir(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Module Tabelas_cotacao.py
+
+Tabelas densas de cotações pré-calculadas. Para cada produto registrado e
+cupom aplicável, guarda o valor final de todas as quantidades em uma
+faixa configurada; a consulta vira um acesso por índice.
+
+Cada linha é um `array("d")` (8 bytes por valor). Quando `versao_precos()`
+muda, as tabelas são refeitas em uma thread de fundo, uma reconstrução
+por vez, e trocadas por inteiro ao final; enquanto isso, `consultar`
+devolve None e o pedido segue pelo cálculo normal, sem esperar.
+"""
+
+import threading
+from array import array
+from logging import ERROR
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src.models.calculadora import STRATEGY_REGISTRY, versao_precos
+from src.models.cupons import tabela_cupons
+from src.services.registro import obter_logger, registrar
+
+_log = obter_logger("tabelas_cotacao")
+
+
+class _Tabelas(NamedTuple):
+    """Tabelas de uma versão de preços (trocadas de uma vez)."""
+
+    versao: Optional[Tuple[int, int, int]]
+    linhas: Dict[Tuple[str, Optional[str]], array]
+
+
+class TabelasCotacao:
+    """Cotações pré-calculadas para quantidades em [qtd_min, qtd_max].
+
+    `calcular_lote` recebe colunas codificadas por dicionário, como
+    `processar_lote_codigos`.
+    """
+
+    def __init__(
+        self,
+        calcular_lote: Callable[..., np.ndarray],
+        qtd_min: int = 1,
+        qtd_max: int = 5000,
+        cupons: Optional[Iterable[str]] = None,
+    ) -> None:
+        if qtd_min > qtd_max:
+            raise ValueError("qtd_min deve ser menor ou igual a qtd_max")
+        self.qtd_min = qtd_min
+        self.qtd_max = qtd_max
+        self.cupons = tuple(cupons) if cupons is not None else None
+        self._calcular_lote = calcular_lote
+        self._atual = _Tabelas(None, {})
+        self._lock = threading.Lock()
+        self._reconstrucao: Optional[threading.Thread] = None
+        self._versao_com_falha: Optional[Tuple[int, int, int]] = None
+        self.construir()
+
+    def construir(self) -> None:
+        """(Re)calcula todas as tabelas com os preços vigentes e passa a usá-las."""
+        versao = versao_precos()
+        qtds = np.arange(self.qtd_min, self.qtd_max + 1, dtype=np.int64)
+        zeros = np.zeros(len(qtds), dtype=np.intp)
+        linhas = {}
+        for produto in list(STRATEGY_REGISTRY):
+            codigos = self.cupons if self.cupons is not None else tabela_cupons().codigos(produto)
+            for cupom in (None,) + tuple(codigos):
+                valores = self._calcular_lote(zeros, (produto,), qtds, zeros, (cupom,))
+                linhas[(produto, cupom)] = array("d", np.asarray(valores, dtype=np.float64).tobytes())
+        self._atual = _Tabelas(versao, linhas)
+
+    def consultar(self, produto: str, qtd, cupom: Optional[str]) -> Optional[float]:
+        """Valor pré-calculado do pedido, ou None se estiver fora das tabelas.
+
+        Com as tabelas desatualizadas, agenda a reconstrução e devolve None.
+        """
+        atual = self._atual
+        if atual.versao != versao_precos():
+            self._reconstruir_em_fundo()
+            return None
+        if type(qtd) is not int or not self.qtd_min <= qtd <= self.qtd_max:
+            return None
+        linha = atual.linhas.get((produto, cupom or None))
+        if linha is None:
+            return None
+        return linha[qtd - self.qtd_min]
+
+    def aguardar(self, timeout: Optional[float] = None) -> bool:
+        """Espera a reconstrução em andamento; retorna se as tabelas estão em dia."""
+        reconstrucao = self._reconstrucao
+        if reconstrucao is not None:
+            reconstrucao.join(timeout)
+        return self._atual.versao == versao_precos()
+
+    @property
+    def tamanho_bytes(self) -> int:
+        """Memória ocupada pelos valores das tabelas."""
+        return sum(len(linha) * linha.itemsize for linha in self._atual.linhas.values())
+
+    def _reconstruir_em_fundo(self) -> None:
+        """Inicia a reconstrução, se nenhuma estiver em andamento."""
+        with self._lock:
+            if self._reconstrucao is not None and self._reconstrucao.is_alive():
+                return
+            if self._versao_com_falha == versao_precos():
+                return
+            self._reconstrucao = threading.Thread(
+                target=self._reconstruir, name="tabelas-cotacao", daemon=True
+            )
+            self._reconstrucao.start()
+
+    def _reconstruir(self) -> None:
+        """Refaz as tabelas até alcançar a versão de preços vigente.
+
+        Uma falha é registrada e não é repetida para a mesma versão; os
+        pedidos continuam pelo cálculo normal.
+        """
+        versao = versao_precos()
+        try:
+            while self._atual.versao != versao:
+                self.construir()
+                versao = versao_precos()
+        except Exception as erro:  # pylint: disable=broad-except
+            self._versao_com_falha = versao
+            registrar(_log, ERROR, "falha ao reconstruir tabelas de cotação", erro=repr(erro))
@@ -0,0 +1,106 @@
+"""Testes para a agregação em fluxo usando pytest"""
+
+import math
+import os
+import sys
+
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.agregacao import Agregador, Soma
+from src.services.fluxo import processar_arquivo
+from src.services.paralelo import agregar_paralelo
+from src.services.pedido import processar_pedido, processar_pedidos
+
+PEDIDOS = [
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
+    {"cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
+    {"cliente": "EcoFrota", "produto": "etanol", "qtd": 50, "cupom": "NOVO5"},
+    {"cliente": "PetroPark", "produto": "lubrificante", "qtd": 12, "cupom": "LUB2"},
+    {"cliente": "TransLog", "produto": "gasolina", "qtd": 80, "cupom": "MEGA10"},
+]
+
+
+class TestSomaPytest:
+    """Testes para a soma compensada usando pytest"""
+
+    def test_sem_erro_acumulado(self):
+        """Testa que a soma compensada coincide com math.fsum"""
+        valores = [0.1] * 1_000_000 + [1e16, 1.0, -1e16]
+        soma = Soma()
+        for v in valores:
+            soma.adicionar(v)
+        assert soma.valor == math.fsum(valores)
+        assert sum(valores) != math.fsum(valores)
+
+    def test_mesclar_parciais(self):
+        """Testa que parciais mesclados mantêm a precisão da soma compensada"""
+        valores = [0.1, 1e16, 0.3, -1e16, 0.7] * 1000
+        partes = [Soma() for _ in range(3)]
+        for i, v in enumerate(valores):
+            partes[i % 3].adicionar(v)
+        for parte in partes[1:]:
+            partes[0].mesclar(parte)
+        assert partes[0].valor == pytest.approx(math.fsum(valores), rel=1e-12)
+        assert sum(valores) != pytest.approx(math.fsum(valores))
+
+
+class TestAgregadorPytest:
+    """Testes para o agregador por cliente, produto e cupom usando pytest"""
+
+    def test_totais_por_dimensao(self):
+        """Testa totais, contagens e médias por chave"""
+        agregador = Agregador()
+        resultados = list(agregador.consumir(processar_pedidos(PEDIDOS)))
+        valores = [processar_pedido(p) for p in PEDIDOS]
+
+        assert [v for _, v in resultados] == valores
+        assert agregador.quantidade == len(PEDIDOS)
+        assert agregador.total == pytest.approx(sum(valores))
+        translog = agregador.por("cliente")["TransLog"]
+        assert translog["quantidade"] == 2
+        assert translog["total"] == pytest.approx(valores[0] + valores[4])
+        assert translog["media"] == pytest.approx((valores[0] + valores[4]) / 2)
+        assert agregador.por("cupom")[None]["quantidade"] == 1
+        assert agregador.por("produto")["gasolina"]["quantidade"] == 2
+
+    def test_mesclar_igual_a_sequencial(self):
+        """Testa que agregados parciais mesclados equivalem ao sequencial"""
+        sequencial, a, b = Agregador(), Agregador(), Agregador()
+        for i, p in enumerate(PEDIDOS * 10):
+            valor = processar_pedido(p)
+            sequencial.adicionar(p, valor)
+            (a if i % 2 else b).adicionar(p, valor)
+        assert a.mesclar(b).resumo() == sequencial.resumo()
+
+    def test_dimensoes_diferentes(self):
+        """Testa erro ao mesclar agregadores incompatíveis"""
+        with pytest.raises(ValueError):
+            Agregador(["produto"]).mesclar(Agregador())
+
+    def test_agregar_paralelo(self):
+        """Testa parciais calculados em workers"""
+        pedidos = PEDIDOS * 50
+        sequencial = Agregador(["produto", "cupom"])
+        for p in pedidos:
+            sequencial.adicionar(p, processar_pedido(p))
+        paralelo = agregar_paralelo(iter(pedidos), workers=2, tamanho_lote=33, dimensoes=["produto", "cupom"])
+        assert paralelo.quantidade == sequencial.quantidade
+        for dimensao in ("produto", "cupom"):
+            for chave, resumo in sequencial.por(dimensao).items():
+                assert paralelo.por(dimensao)[chave] == pytest.approx(resumo)
+
+    def test_processar_arquivo_com_agregador(self, tmp_path):
+        """Testa a agregação durante o processamento de um arquivo"""
+        entrada, saida = tmp_path / "pedidos.csv", tmp_path / "saida.jsonl"
+        entrada.write_text(
+            "cliente,produto,qtd,cupom\nTransLog,diesel,1200,MEGA10\nMoveMais,gasolina,300,\n",
+            encoding="utf-8",
+        )
+        agregador = Agregador()
+        quantidade, total = processar_arquivo(str(entrada), str(saida), agregador=agregador)
+        assert quantidade == agregador.quantidade == 2
+        assert total == agregador.total
+        assert set(agregador.por("cliente")) == {"TransLog", "MoveMais"}
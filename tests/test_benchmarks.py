@@ -0,0 +1,53 @@
+"""Testes para a suíte de benchmarks usando pytest"""
+
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.run import CASOS, LIMITE, TOLERANCIAS, caminho_origem, comparar, main, medir, tolerancia
+
+
+class TestBenchmarksPytest:
+    """Testes para benchmarks.run usando pytest"""
+
+    def test_comparar_detecta_regressao(self):
+        """Testa que apenas casos acima do limite são regressões"""
+        baseline = {"a": {"1": 100.0, "10": 100.0}}
+        atual = {"a": {"1": 119.0, "10": 121.0}, "b": {"1": 999.0}}
+        assert comparar(baseline, atual, 0.20) == [("a", "10", 100.0, 121.0)]
+
+    def test_tolerancia_por_caso(self):
+        """Testa que casos de E/S têm tolerância própria, nunca menor que o limite"""
+        caso = next(iter(TOLERANCIAS))
+        assert tolerancia(caso) == TOLERANCIAS[caso] > LIMITE
+        assert tolerancia("calculadora.calcular_preco") == LIMITE
+        assert tolerancia(caso, 10.0) == 10.0
+        baseline = {caso: {"1": 100.0}, "a": {"1": 100.0}}
+        atual = {caso: {"1": 100.0 * (1 + TOLERANCIAS[caso]) - 1}, "a": {"1": 121.0}}
+        assert comparar(baseline, atual, 0.20) == [("a", "1", 100.0, 121.0)]
+
+    def test_medir_usa_mediana(self, monkeypatch):
+        """Testa que uma execução isolada lenta não altera a medida"""
+        tempos = iter([0.0, 1.0, 1.0, 2.0, 2.0, 3.0, 3.0, 100.0, 100.0, 104.0])
+        monkeypatch.setattr("benchmarks.run.time", SimpleNamespace(perf_counter=lambda: next(tempos)))
+        monkeypatch.setitem(CASOS, "teste", lambda n, tmp: lambda: None)
+        assert medir("teste", 20_000, rodadas=5) == 1.0 / 20_000 * 1e9
+
+    def test_salvar_e_comparar(self, tmp_path, capsys):
+        """Testa execução completa com baseline temporário"""
+        baseline = str(tmp_path / "baseline.json")
+        casos = ",".join(CASOS)
+
+        assert main(["--tamanhos", "1", "--casos", casos, "--baseline", baseline, "--salvar"]) == 0
+        with open(baseline, encoding="utf-8") as f:
+            assert set(json.load(f)) == set(CASOS)
+        with open(caminho_origem(baseline), encoding="utf-8") as f:
+            origem = json.load(f)
+        assert set(origem) == set(CASOS)
+        assert {"host", "rodadas", "data"} <= set(origem[next(iter(CASOS))]["1"])
+
+        assert main(["--tamanhos", "1", "--casos", casos, "--baseline", baseline, "--limite", "1000"]) == 0
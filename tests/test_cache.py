@@ -0,0 +1,105 @@
+"""Testes para o cache de cotações usando pytest"""
+
+import os
+import sys
+
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.calculadora import BASES, DieselStrategy, register_strategy
+from src.models.cupons import CUPONS_PADRAO, Cupom, TabelaCupons, ativar_tabela_cupons
+from src.services.cache import CacheCotacoes
+from src.services.pedido import processar_pedido, ativar_cache, desativar_cache
+
+
+@pytest.fixture
+def cache():
+    """Ativa o cache durante o teste"""
+    cache = ativar_cache(tamanho=2)
+    yield cache
+    desativar_cache()
+
+
+def pedido(produto="diesel", qtd=100, cupom=None):
+    """Monta um pedido de teste"""
+    return {"cliente": "Frota", "produto": produto, "qtd": qtd, "cupom": cupom}
+
+
+class TestCacheCotacoesPytest:
+    """Testes para CacheCotacoes usando pytest"""
+
+    def test_acertos_e_falhas(self, cache):
+        """Testa contadores de acerto e falha"""
+        assert processar_pedido(pedido()) == round(3.99 * 100, 0)
+        assert processar_pedido(pedido()) == round(3.99 * 100, 0)
+        assert cache.acertos == 1
+        assert cache.falhas == 1
+
+    def test_lru_descarta_mais_antigo(self, cache):
+        """Testa que o tamanho máximo é respeitado"""
+        processar_pedido(pedido(qtd=1))
+        processar_pedido(pedido(qtd=2))
+        processar_pedido(pedido(qtd=3))
+        processar_pedido(pedido(qtd=1))
+        assert cache.falhas == 4
+        assert cache.estatisticas()["itens"] == 2
+
+    def test_invalida_quando_bases_muda(self, cache):
+        """Testa que alterar BASES não serve preço antigo"""
+        original = BASES["diesel"]
+        processar_pedido(pedido())
+        try:
+            BASES["diesel"] = 5.0
+            assert processar_pedido(pedido()) == 500.0
+        finally:
+            BASES["diesel"] = original
+        assert cache.invalidacoes == 1
+        assert processar_pedido(pedido()) == round(3.99 * 100, 0)
+
+    def test_invalida_quando_registry_muda(self, cache):
+        """Testa que register_strategy invalida o cache"""
+        processar_pedido(pedido())
+        register_strategy("diesel", DieselStrategy)
+        processar_pedido(pedido())
+        assert cache.invalidacoes == 1
+        assert cache.acertos == 0
+
+    def test_invalida_quando_cupons_mudam(self, cache):
+        """Testa que trocar a tabela de cupons invalida o cache"""
+        processar_pedido(pedido(cupom="MEGA10"))
+        try:
+            ativar_tabela_cupons(TabelaCupons([Cupom("MEGA10", "percentual", 0.5)]))
+            assert processar_pedido(pedido(cupom="MEGA10")) == round(399.0 * 0.5, 0)
+        finally:
+            ativar_tabela_cupons(TabelaCupons(CUPONS_PADRAO))
+
+    def test_estatisticas(self):
+        """Testa o resumo de uso do cache"""
+        cache = CacheCotacoes(lambda x: x * 2, tamanho=10)
+        assert cache.obter(2) == 4
+        assert cache.estatisticas() == {
+            "tamanho": 10, "itens": 1, "acertos": 0, "falhas": 1, "invalidacoes": 0,
+        }
+
+    def test_preco_alterado_durante_calculo_nao_fica_em_cache(self):
+        """Testa que uma cotação calculada antes da troca de preço não é servida depois"""
+        original = BASES["diesel"]
+        chamadas = []
+
+        def cotar(qtd):
+            preco = BASES["diesel"] * qtd
+            if not chamadas:
+                # Preço muda e outro leitor limpa o cache durante o cálculo
+                chamadas.append(qtd)
+                BASES["diesel"] = 4.99
+                cache.obter(1)
+            return preco
+
+        cache = CacheCotacoes(cotar, tamanho=10)
+        try:
+            assert cache.obter(100) == pytest.approx(original * 100)
+            assert cache.obter(100) == pytest.approx(499.0)
+        finally:
+            BASES["diesel"] = original
@@ -0,0 +1,113 @@
+"""Testes para o cadastro de clientes em lote usando pytest"""
+
+import os
+import sys
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models import clientes as modulo
+from src.models.clientes import (
+    MOTIVO_CNPJ,
+    MOTIVO_EMAIL,
+    MOTIVO_REGISTRO,
+    SUFIXO_INDICE,
+    TAMANHO_CABECALHO_INDICE,
+    ClienteRepositorio,
+    Clientes,
+    EscritorClientes,
+    definir_repositorio,
+)
+from src.models.clientes_sqlite import ClienteRepositorioSQLite
+
+
+def _registro(i, email=None, cnpj=None):
+    return {"nome": f"Cliente {i}", "email": email or f"c{i}@email.com", "cnpj": i if cnpj is None else cnpj}
+
+
+class TestCadastroLotePytest:
+    """Testes para Clientes.cadastrar_lote e ClienteRepositorio.salvar_lote"""
+
+    def test_relatorio_por_registro(self, tmp_path, monkeypatch):
+        """Testa aceitos, recusados e motivos na ordem de entrada"""
+        monkeypatch.chdir(tmp_path)
+        registros = [
+            _registro(1),
+            _registro(2, email="sem-arroba"),
+            Clientes("c3@email.com", "Cliente 3", 3),
+            _registro(4, cnpj=-4),
+            "não é um registro",
+            {"nome": "Sem email", "cnpj": 6},
+            _registro(7, email=None, cnpj="7"),
+        ]
+        relatorio = Clientes.cadastrar_lote(iter(registros))
+
+        assert relatorio.total == 7
+        assert relatorio.aceitos == 3
+        assert relatorio.rejeitados == [
+            (1, MOTIVO_EMAIL), (3, MOTIVO_CNPJ), (4, MOTIVO_REGISTRO), (5, MOTIVO_REGISTRO),
+        ]
+        assert [relatorio.aceito(i) for i in range(8)] == [True, False, True, False, False, False, True, False]
+        assert relatorio.motivo(3) == MOTIVO_CNPJ
+        assert relatorio.motivo(0) is None
+        assert set(ClienteRepositorio.carregar()) == {1, 3, "7"}
+
+    def test_mesmas_regras_de_cadastrar(self, tmp_path, monkeypatch):
+        """Testa que o lote aceita e recusa como cadastrar, um a um"""
+        monkeypatch.chdir(tmp_path)
+        casos = [
+            ("valido@email.com", 1), ("a@b.c", 2), ("teste@", 3), ("x y@email.com", 4),
+            ("ok@email.com", 0), ("ok@email.com", "abc"), ("ok@email.com", "15"),
+        ]
+        relatorio = Clientes.cadastrar_lote(Clientes(e, "n", c) for e, c in casos)
+        individuais = [Clientes(e, "n", c).cadastrar() for e, c in casos]
+        assert [relatorio.aceito(i) for i in range(len(casos))] == individuais
+
+    def test_uma_unica_gravacao(self, tmp_path, monkeypatch):
+        """Testa que o lote inteiro é gravado com uma chamada ao repositório"""
+        monkeypatch.chdir(tmp_path)
+        chamadas = []
+        original = ClienteRepositorio.salvar_lote
+        monkeypatch.setattr(ClienteRepositorio, "salvar_lote", lambda c, path="clientes.txt": chamadas.append(len(c)) or original(c, path))
+        monkeypatch.setattr(ClienteRepositorio, "salvar", lambda c, path="clientes.txt": chamadas.append("salvar"))
+
+        Clientes.cadastrar_lote(_registro(i) for i in range(1, 501))
+        assert chamadas == [500]
+        assert len(ClienteRepositorio.carregar()) == 500
+
+    def test_lote_vazio_ou_todo_recusado(self, tmp_path, monkeypatch):
+        """Testa que nada é gravado sem registros aceitos"""
+        monkeypatch.chdir(tmp_path)
+        assert Clientes.cadastrar_lote([]) == (0, 0, [])
+        assert Clientes.cadastrar_lote([_registro(1, email="ruim")]).aceitos == 0
+        assert not os.path.exists(tmp_path / "clientes.txt")
+
+    def test_salvar_lote_mantem_indice(self, tmp_path):
+        """Testa que a gravação em lote acrescenta ao índice de CNPJs"""
+        path = str(tmp_path / "clientes.txt")
+        ClienteRepositorio.salvar(_registro(1), path)
+        assert ClienteRepositorio.buscar(1, path) == _registro(1)
+        assert ClienteRepositorio.salvar_lote((_registro(i) for i in range(2, 12)), path) == 10
+        assert os.path.getsize(path + SUFIXO_INDICE) == TAMANHO_CABECALHO_INDICE + 11 * 16
+        assert ClienteRepositorio.buscar(11, path) == _registro(11)
+
+    def test_salvar_lote_com_escritor_aberto(self, tmp_path):
+        """Testa que o lote entra no escritor aberto para o arquivo"""
+        path = str(tmp_path / "clientes.txt")
+        with EscritorClientes(path, tamanho_lote=1000, intervalo=None) as escritor:
+            ClienteRepositorio.salvar_lote([_registro(1), _registro(2)], path)
+            assert escritor.pendentes == 2
+        assert set(ClienteRepositorio.carregar(path)) == {1, 2}
+
+    def test_lote_no_sqlite(self, tmp_path):
+        """Testa o cadastro em lote com o repositório SQLite selecionado"""
+        repositorio = ClienteRepositorioSQLite(str(tmp_path / "clientes.db"))
+        definir_repositorio(repositorio)
+        try:
+            relatorio = Clientes.cadastrar_lote([_registro(1), _registro(2, email="x"), _registro(3)])
+            assert relatorio.aceitos == 2
+            assert set(repositorio.carregar()) == {1, 3}
+        finally:
+            definir_repositorio(None)
+            repositorio.fechar()
+        assert modulo._repositorio is None
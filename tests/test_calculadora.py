@@ -1,6 +1,7 @@
 """Testes para o módulo Calculadora usando pytest e unittest"""
 
 import unittest
+import numpy as np
 import pytest
 import sys
 import os
@@ -15,8 +16,9 @@ from src.models.calculadora import (
     EtanolStrategy,
     LubrificanteStrategy,
     register_strategy,
+    unregister_strategy,
     get_strategy,
-    BASES
+    BASES,
 )
 
 
@@ -128,6 +130,125 @@ class TestPrecoCalculadoraPytest:
         assert preco_com_desconto == preco * 0.95
 
 
+class TestRegistryPytest:
+    """Testes para o registry de estratégias usando pytest"""
+
+    def test_get_strategy_retorna_instancia_compartilhada(self):
+        """Testa que a mesma instância é reaproveitada"""
+        assert get_strategy("diesel") is get_strategy("diesel")
+        assert isinstance(get_strategy("diesel"), DieselStrategy)
+
+    def test_get_strategy_tipo_invalido(self):
+        """Testa tipo não registrado"""
+        assert get_strategy("invalido") is None
+
+    def test_estrategia_imutavel(self):
+        """Testa que estratégias compartilhadas não aceitam atributos"""
+        with pytest.raises(AttributeError):
+            get_strategy("diesel").fator = 2
+
+    def test_register_strategy_atualiza_despacho(self):
+        """Testa que registrar uma estratégia reconstrói o despacho"""
+
+        class QueroseneStrategy(DieselStrategy):
+            def calcular_preco(self, quantidade):
+                return 7.0 * quantidade
+
+        register_strategy("querosene", QueroseneStrategy)
+        try:
+            assert PrecoCalculadora("querosene", 10).calcular_preco() == 70.0
+            assert PrecoCalculadora("diesel", 10).calcular_preco() == BASES["diesel"] * 10
+        finally:
+            assert unregister_strategy("querosene") is QueroseneStrategy
+        assert get_strategy("querosene") is None
+        assert PrecoCalculadora("querosene", 10).calcular_preco() == 0.0
+        assert unregister_strategy("querosene") is None
+
+
+class TestCalcularLotePytest:
+    """Testes para PrecoCalculadora.calcular_lote usando pytest"""
+
+    def test_lote_igual_ao_caminho_escalar(self):
+        """Testa que o lote reproduz exatamente calcular_preco + calcular_desconto"""
+        tipos, qtds, cupons = [], [], []
+        for tipo in ["diesel", "gasolina", "etanol", "lubrificante", "invalido"]:
+            for qtd in range(0, 1500, 7):
+                for cupom in [None, "MEGA10", "NOVO5", "LUB2", "XYZ"]:
+                    tipos.append(tipo)
+                    qtds.append(qtd)
+                    cupons.append(cupom)
+
+        precos = PrecoCalculadora.calcular_lote(tipos, qtds, cupons)
+
+        for tipo, qtd, cupom, preco in zip(tipos, qtds, cupons, precos):
+            calc = PrecoCalculadora(tipo, qtd)
+            assert preco == calc.calcular_desconto(cupom, calc.calcular_preco())
+
+    def test_lote_sem_cupons(self):
+        """Testa lote sem informar cupons"""
+        precos = PrecoCalculadora.calcular_lote(["diesel", "etanol"], [100, 100])
+        assert list(precos) == [BASES["diesel"] * 100, BASES["etanol"] * 100 * 0.97]
+
+    def test_lote_limitar_negativos(self):
+        """Testa que preços negativos viram zero antes do desconto"""
+        precos = PrecoCalculadora.calcular_lote(
+            ["lubrificante"], [-10], ["LUB2"], limitar_negativos=True
+        )
+        assert precos[0] == -2
+
+    def test_desconto_escalar_sobrescrito(self):
+        """Testa que um aplicar_desconto só escalar é chamado item a item no lote"""
+
+        class GranelStrategy(DieselStrategy):
+            __slots__ = ()
+
+            def aplicar_desconto(self, preco, cupom):
+                if preco > 1000 and cupom is None:
+                    return preco - 50
+                return super().aplicar_desconto(preco, cupom)
+
+        register_strategy("granel", GranelStrategy)
+        try:
+            tipos = ["granel"] * 6 + ["diesel"]
+            qtds = [10, 400, 800, 10, 800, 0, 800]
+            cupons = [None, None, None, "MEGA10", "MEGA10", None, None]
+            precos = PrecoCalculadora.calcular_lote(tipos, qtds, cupons)
+            esperados = []
+            for tipo, qtd, cupom in zip(tipos, qtds, cupons):
+                calc = PrecoCalculadora(tipo, qtd)
+                esperados.append(calc.calcular_desconto(cupom, calc.calcular_preco()))
+            assert precos.tolist() == esperados
+            assert esperados[2] == BASES["diesel"] * 800 * 0.95 - 50
+
+            codigos = PrecoCalculadora.calcular_lote_codigos(
+                np.array([0] * 6 + [1]), ["granel", "diesel"], qtds,
+                np.array([0, 0, 0, 1, 1, 0, 0]), [None, "MEGA10"],
+            )
+            assert codigos.tolist() == esperados
+        finally:
+            unregister_strategy("granel")
+
+    def test_desconto_vetorizado_declarado(self):
+        """Testa que uma estratégia com desconto_vetorizado recebe o sub-array"""
+        chamadas = []
+
+        class ArrayStrategy(DieselStrategy):
+            __slots__ = ()
+            desconto_vetorizado = True
+
+            def aplicar_desconto(self, preco, cupom):
+                chamadas.append(np.ndim(preco))
+                return preco * 0.5
+
+        register_strategy("array", ArrayStrategy)
+        try:
+            precos = PrecoCalculadora.calcular_lote(["array"] * 3, [10, 20, 30])
+        finally:
+            unregister_strategy("array")
+        assert chamadas == [1]
+        assert precos.tolist() == [BASES["diesel"] * q * 0.5 for q in (10, 20, 30)]
+
+
 # ========== Testes com unittest ==========
 
 class TestDieselStrategyUnittest(unittest.TestCase):
@@ -0,0 +1,157 @@
+"""Testes para o modo exato em centavos usando pytest"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.calculadora import (
+    BASES,
+    PrecoCalculadora,
+    DieselStrategy,
+    GasolinaStrategy,
+    register_strategy,
+    unregister_strategy,
+)
+from src.models.centavos import (
+    arredondar_para,
+    dividir_arredondando,
+    multiplicar,
+    para_centavos,
+    para_reais,
+)
+from src.models.tabela_precos import tabela_precos
+from src.services.pedido import processar_lote, processar_pedido, processar_pedido_centavos
+
+
+class TestAritmeticaCentavosPytest:
+    """Testes para as funções de aritmética em centavos usando pytest"""
+
+    @pytest.mark.parametrize("valor, esperado", [(3.99, 399), (5.19, 519), (0.1, 10), (25.0, 2500)])
+    def test_para_centavos(self, valor, esperado):
+        """Testa conversão de reais para centavos sem erro de ponto flutuante"""
+        assert para_centavos(valor) == esperado
+
+    def test_para_reais(self):
+        """Testa conversão de centavos para reais"""
+        assert para_reais(17052) == 170.52
+
+    @pytest.mark.parametrize("n, d, esperado", [(5, 2, 2), (7, 2, 4), (6, 4, 2), (-5, 2, -2), (11, 10, 1)])
+    def test_dividir_arredondando_metade_para_par(self, n, d, esperado):
+        """Testa divisão com arredondamento bancário"""
+        assert dividir_arredondando(n, d) == esperado
+
+    def test_dividir_arredondando_array(self):
+        """Testa que a divisão funciona com arrays int64"""
+        resultado = dividir_arredondando(np.array([5, 7, 6, -5], dtype=np.int64), 2)
+        assert resultado.tolist() == [2, 4, 3, -2]
+
+    def test_multiplicar(self):
+        """Testa multiplicação por fator decimal exata"""
+        assert multiplicar(39900, 0.95) == 37905
+        assert multiplicar(1, 0.5) == 0
+
+    def test_arredondar_para(self):
+        """Testa arredondamento para reais inteiros"""
+        assert arredondar_para(387850, 100) == 387800
+        assert arredondar_para(387851, 100) == 387900
+
+
+class TestEstrategiasCentavosPytest:
+    """Testes para o cálculo em centavos das estratégias usando pytest"""
+
+    def test_faixa_multiplicador(self):
+        """Testa faixa percentual em centavos"""
+        assert DieselStrategy().calcular_preco_centavos(1200, tabela_precos()) == 430920
+
+    def test_faixa_deducao(self):
+        """Testa faixa de dedução em centavos"""
+        assert GasolinaStrategy().calcular_preco_centavos(300, tabela_precos()) == 145700
+
+    def test_calculadora_centavos(self):
+        """Testa a fachada no modo exato"""
+        calc = PrecoCalculadora("lubrificante", 12)
+        assert calc.calcular_desconto_centavos("LUB2", calc.calcular_preco_centavos()) == 29800
+
+    def test_tipo_invalido(self):
+        """Testa tipo não registrado no modo exato"""
+        calc = PrecoCalculadora("invalido", 10)
+        assert calc.calcular_preco_centavos() == 0
+        assert calc.calcular_desconto_centavos("MEGA10", 100) == 100
+
+
+class TestProcessarPedidoCentavosPytest:
+    """Testes para processar_pedido_centavos usando pytest"""
+
+    @pytest.mark.parametrize("produto, qtd, cupom, esperado", [
+        ("diesel", 1200, "MEGA10", 387800),
+        ("gasolina", 300, None, 145700),
+        ("etanol", 50, "NOVO5", 17052),
+        ("lubrificante", 12, "LUB2", 29800),
+        ("diesel", 0, None, 0),
+    ])
+    def test_pedidos(self, produto, qtd, cupom, esperado):
+        """Testa valores exatos em centavos"""
+        pedido = {"cliente": "X", "produto": produto, "qtd": qtd, "cupom": cupom}
+        assert processar_pedido_centavos(pedido) == esperado
+
+    def test_lote_igual_ao_escalar(self):
+        """Testa que o lote em centavos reproduz o caminho escalar"""
+        produtos, qtds, cupons = [], [], []
+        for produto in ["diesel", "gasolina", "etanol", "lubrificante", "invalido"]:
+            for qtd in range(0, 1500, 11):
+                for cupom in [None, "MEGA10", "NOVO5", "LUB2"]:
+                    produtos.append(produto)
+                    qtds.append(qtd)
+                    cupons.append(cupom)
+
+        lote = processar_lote(produtos, qtds, cupons, centavos=True)
+
+        assert lote.dtype == np.int64
+        for produto, qtd, cupom, valor in zip(produtos, qtds, cupons, lote):
+            pedido = {"cliente": "X", "produto": produto, "qtd": qtd, "cupom": cupom}
+            assert valor == processar_pedido_centavos(pedido)
+
+    @pytest.mark.parametrize("vetorizado", [False, True])
+    def test_desconto_sobrescrito_igual_em_reais_e_centavos(self, vetorizado):
+        """Testa que um aplicar_desconto sobrescrito vale também no modo em centavos"""
+
+        class VipStrategy(DieselStrategy):
+            __slots__ = ()
+            produto = "vip"
+            desconto_vetorizado = vetorizado
+
+            def aplicar_desconto(self, preco, cupom):
+                if cupom == "VIP50":
+                    return preco * 0.5
+                return super().aplicar_desconto(preco, cupom)
+
+        BASES["vip"] = 1.0
+        register_strategy("vip", VipStrategy)
+        try:
+            pedidos = [
+                {"cliente": "X", "produto": "vip", "qtd": qtd, "cupom": cupom}
+                for qtd in (100, 37, 1200) for cupom in ("VIP50", "MEGA10", None)
+            ]
+            reais = [processar_pedido(p) for p in pedidos]
+            centavos = [processar_pedido_centavos(p) for p in pedidos]
+            assert reais[0] == 50.0
+            assert centavos[0] == 5000
+            assert centavos == [para_centavos(v) for v in reais]
+
+            colunas = ([p["produto"] for p in pedidos], [p["qtd"] for p in pedidos], [p["cupom"] for p in pedidos])
+            assert processar_lote(*colunas).tolist() == reais
+            assert processar_lote(*colunas, centavos=True).tolist() == centavos
+            codigos = PrecoCalculadora.calcular_lote_codigos(
+                np.zeros(len(pedidos), dtype=np.intp), ["vip"], colunas[1],
+                np.array([[None, "VIP50", "MEGA10"].index(c) for c in colunas[2]]), [None, "VIP50", "MEGA10"],
+                limitar_negativos=True, centavos=True, arredondar=True,
+            )
+            assert codigos.tolist() == centavos
+        finally:
+            unregister_strategy("vip")
+            del BASES["vip"]
@@ -0,0 +1,109 @@
+"""Testes para o repositório de clientes em SQLite usando pytest"""
+
+import os
+import sqlite3
+import sys
+import threading
+
+import pytest
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.clientes import ClienteRepositorio, Clientes, definir_repositorio
+from src.models.clientes_sqlite import ClienteRepositorioSQLite
+
+
+def _cliente(i, nome=None):
+    return {"nome": nome or f"Cliente {i}", "email": f"c{i}@email.com", "cnpj": i}
+
+
+@pytest.fixture
+def repositorio(tmp_path):
+    repo = ClienteRepositorioSQLite(str(tmp_path / "clientes.db"))
+    yield repo
+    repo.fechar()
+
+
+class TestClienteRepositorioSQLitePytest:
+    """Testes para ClienteRepositorioSQLite usando pytest"""
+
+    def test_salvar_carregar_buscar(self, repositorio):
+        """Testa a mesma interface do repositório em arquivo"""
+        repositorio.salvar(_cliente(1))
+        repositorio.salvar({"nome": "Ação", "email": "a@email.com", "cnpj": 2, "extra": [1, 2]})
+        assert repositorio.carregar() == {
+            1: _cliente(1),
+            2: {"nome": "Ação", "email": "a@email.com", "cnpj": 2, "extra": [1, 2]},
+        }
+        assert repositorio.buscar(1) == _cliente(1)
+        assert repositorio.buscar("2")["nome"] == "Ação"
+        assert repositorio.buscar(3) is None
+
+    def test_cnpj_unico_ultimo_prevalece(self, repositorio):
+        """Testa que regravar um CNPJ substitui o cliente"""
+        repositorio.salvar(_cliente(1, "Antigo"))
+        repositorio.salvar(_cliente(1, "Novo"))
+        assert len(repositorio) == 1
+        assert repositorio.buscar(1)["nome"] == "Novo"
+
+    def test_salvar_lote(self, repositorio):
+        """Testa inserção em lote em uma transação"""
+        assert repositorio.salvar_lote(_cliente(i) for i in range(1, 1001)) == 1000
+        assert len(repositorio) == 1000
+        assert repositorio.buscar(500) == _cliente(500)
+        assert [c["cnpj"] for c in repositorio.clientes()][:3] == [1, 2, 3]
+
+    def test_wal_e_indice_unico(self, repositorio):
+        """Testa o modo WAL e o índice único de CNPJ"""
+        conexao = sqlite3.connect(repositorio.path)
+        try:
+            assert conexao.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            indices = conexao.execute("PRAGMA index_list(clientes)").fetchall()
+            assert any(nome == "clientes_cnpj" and unico for _, nome, unico, *_ in indices)
+        finally:
+            conexao.close()
+
+    def test_persiste_entre_instancias(self, tmp_path):
+        """Testa reabertura do banco"""
+        path = str(tmp_path / "clientes.db")
+        with ClienteRepositorioSQLite(path) as repo:
+            repo.salvar(_cliente(7))
+        with ClienteRepositorioSQLite(path) as repo:
+            assert repo.buscar(7) == _cliente(7)
+
+    def test_threads_compartilham_pool(self, tmp_path):
+        """Testa várias threads gravando com o pool limitado"""
+        repo = ClienteRepositorioSQLite(str(tmp_path / "clientes.db"), tamanho_pool=2)
+        erros = []
+
+        def gravar(inicio):
+            try:
+                for i in range(inicio, inicio + 50):
+                    repo.salvar(_cliente(i))
+                    assert repo.buscar(i) == _cliente(i)
+            except Exception as erro:  # pylint: disable=broad-except
+                erros.append(erro)
+
+        threads = [threading.Thread(target=gravar, args=(k * 100,)) for k in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert erros == []
+        assert len(repo) == 300
+        assert len(repo._abertas) <= 2
+        repo.fechar()
+
+    def test_clientes_usa_repositorio_definido(self, repositorio, tmp_path, monkeypatch):
+        """Testa Clientes.cadastrar e ClienteRepositorio com o SQLite selecionado"""
+        monkeypatch.chdir(tmp_path)
+        definir_repositorio(repositorio)
+        try:
+            assert Clientes("c1@email.com", "Cliente 1", 1).cadastrar() is True
+            assert ClienteRepositorio.buscar(1) == _cliente(1)
+            assert ClienteRepositorio.carregar() == {1: _cliente(1)}
+        finally:
+            definir_repositorio(None)
+        assert not os.path.exists(tmp_path / "clientes.txt")
+        assert ClienteRepositorio.carregar() == {}
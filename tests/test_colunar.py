@@ -0,0 +1,132 @@
+"""Testes para o formato colunar de lotes de pedidos usando pytest"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.colunar import ALINHAMENTO, abrir_lote, escrever_lote
+from src.services.fluxo import processar_arquivo
+from src.services.pedido import processar_lote, processar_lote_codigos, processar_pedido
+
+PEDIDOS = [
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
+    {"cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
+    {"cliente": "EcoFrota", "produto": "etanol", "qtd": 50, "cupom": "NOVO5"},
+    {"cliente": "PetroPark", "produto": "lubrificante", "qtd": 12, "cupom": "LUB2"},
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 0, "cupom": None},
+]
+
+
+class TestLoteColunarPytest:
+    """Testes para escrita e leitura mapeada usando pytest"""
+
+    def test_ida_e_volta(self, tmp_path):
+        """Testa que os pedidos lidos são os gravados"""
+        path = str(tmp_path / "lote.pbcol")
+        assert escrever_lote(iter(PEDIDOS), path) == len(PEDIDOS)
+        lote = abrir_lote(path)
+        assert len(lote) == len(PEDIDOS)
+        assert list(lote.pedidos()) == PEDIDOS
+
+    def test_dicionarios_e_colunas_mapeadas(self, tmp_path):
+        """Testa a codificação por dicionário e colunas alinhadas no arquivo"""
+        path = str(tmp_path / "lote.pbcol")
+        escrever_lote(PEDIDOS * 3, path)
+        lote = abrir_lote(path)
+        assert lote.dicionarios["produto"] == ("diesel", "gasolina", "etanol", "lubrificante")
+        assert lote.dicionarios["cupom"] == ("MEGA10", None, "NOVO5", "LUB2")
+        assert lote.produtos.tolist() == [0, 1, 2, 3, 0] * 3
+        assert isinstance(lote.qtds, np.memmap)
+        assert lote.qtds.offset % ALINHAMENTO == 0
+
+    def test_precificar_igual_ao_escalar(self, tmp_path):
+        """Testa que os blocos precificados seguem processar_pedido"""
+        path = str(tmp_path / "lote.pbcol")
+        escrever_lote(PEDIDOS * 5, path)
+        lote = abrir_lote(path)
+        valores = np.concatenate(list(lote.precificar(tamanho_bloco=7)))
+        assert valores.tolist() == [processar_pedido(p) for p in PEDIDOS * 5]
+
+    def test_colunas_para_processar_lote(self, tmp_path):
+        """Testa as colunas decodificadas de um intervalo"""
+        path = str(tmp_path / "lote.pbcol")
+        escrever_lote(PEDIDOS, path)
+        produtos, qtds, cupons = abrir_lote(path).colunas(1, 3)
+        assert produtos.tolist() == ["gasolina", "etanol"]
+        assert qtds.tolist() == [300, 50]
+        assert cupons.tolist() == ["", "NOVO5"]
+        assert processar_lote(produtos, qtds, cupons).tolist() == [processar_pedido(p) for p in PEDIDOS[1:3]]
+
+    def test_lote_vazio(self, tmp_path):
+        """Testa um lote sem pedidos"""
+        path = str(tmp_path / "vazio.pbcol")
+        assert escrever_lote([], path) == 0
+        lote = abrir_lote(path)
+        assert len(lote) == 0
+        assert list(lote.precificar()) == []
+
+    def test_arquivo_invalido(self, tmp_path):
+        """Testa erro ao abrir um arquivo que não é colunar"""
+        path = tmp_path / "lote.pbcol"
+        path.write_bytes(b"nao colunar")
+        with pytest.raises(ValueError):
+            abrir_lote(str(path))
+
+    def test_processar_arquivo_colunar(self, tmp_path):
+        """Testa processar_arquivo com entrada .pbcol"""
+        entrada, saida = str(tmp_path / "lote.pbcol"), str(tmp_path / "saida.jsonl")
+        escrever_lote(PEDIDOS, entrada)
+        quantidade, total = processar_arquivo(entrada, saida)
+        assert quantidade == len(PEDIDOS)
+        assert total == sum(processar_pedido(p) for p in PEDIDOS)
+        with open(saida, encoding="utf-8") as f:
+            linhas = [json.loads(linha) for linha in f]
+        assert linhas[1] == {**PEDIDOS[1], "valor": processar_pedido(PEDIDOS[1])}
+
+
+class TestPrecificarCodigosPytest:
+    """Testes para a precificação direta pelos códigos do dicionário"""
+
+    @pytest.mark.parametrize("centavos", [False, True])
+    def test_codigos_igual_ao_texto(self, centavos):
+        """Testa que processar_lote_codigos equivale a processar_lote com texto"""
+        rnd = np.random.default_rng(7)
+        produtos = ("diesel", "gasolina", "etanol", "lubrificante", "querosene", None)
+        cupons = (None, "MEGA10", "NOVO5", "LUB2", "INEXISTENTE")
+        n = 5000
+        cod_produtos = rnd.integers(0, len(produtos), n).astype(np.int32)
+        cod_cupons = rnd.integers(0, len(cupons), n).astype(np.int32)
+        qtds = rnd.integers(0, 3000, n)
+
+        esperado = processar_lote(
+            [produtos[i] for i in cod_produtos], qtds, [cupons[i] for i in cod_cupons], centavos=centavos
+        )
+        obtido = processar_lote_codigos(cod_produtos, produtos, qtds, cod_cupons, cupons, centavos=centavos)
+        np.testing.assert_array_equal(obtido, esperado)
+
+    def test_um_so_cupom_e_sem_cupons(self):
+        """Testa os atalhos de um único cupom no grupo e de lote sem cupons"""
+        qtds = np.array([100, 2000, 0])
+        codigos = np.zeros(3, dtype=np.int32)
+        esperado = processar_lote(["diesel"] * 3, qtds, ["MEGA10"] * 3)
+        np.testing.assert_array_equal(
+            processar_lote_codigos(codigos, ("diesel",), qtds, codigos, ("MEGA10",)), esperado
+        )
+        np.testing.assert_array_equal(
+            processar_lote_codigos(codigos, ("diesel",), qtds), processar_lote(["diesel"] * 3, qtds)
+        )
+
+    def test_precificar_nao_decodifica_texto(self, tmp_path):
+        """Testa que precificar o lote não monta arrays de texto por pedido"""
+        path = str(tmp_path / "lote.pbcol")
+        escrever_lote(PEDIDOS * 10, path)
+        lote = abrir_lote(path)
+        valores = np.concatenate(list(lote.precificar(tamanho_bloco=7)))
+        assert lote._textos is None
+        assert valores.tolist() == [processar_pedido(p) for p in PEDIDOS * 10]
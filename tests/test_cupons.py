@@ -0,0 +1,116 @@
+"""Testes para o módulo Cupons usando pytest"""
+
+import json
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.cupons import (
+    Cupom,
+    TabelaCupons,
+    CUPONS_PADRAO,
+    PERCENTUAL,
+    FIXO,
+    ativar_tabela_cupons,
+    buscar_cupom,
+    monitorar_cupons,
+    tabela_cupons,
+)
+from src.models.calculadora import PrecoCalculadora
+
+
+@pytest.fixture
+def tabela_padrao():
+    """Restaura a tabela padrão e desativa o monitor após o teste"""
+    yield
+    monitorar_cupons(None)
+    ativar_tabela_cupons(TabelaCupons(CUPONS_PADRAO))
+
+
+class TestTabelaCuponsPytest:
+    """Testes para TabelaCupons usando pytest"""
+
+    def test_buscar_cupom_global(self):
+        """Testa cupom válido para qualquer produto"""
+        tabela = TabelaCupons(CUPONS_PADRAO)
+        assert tabela.buscar("MEGA10", "diesel").valor == 0.10
+        assert tabela.buscar("MEGA10").valor == 0.10
+
+    def test_buscar_cupom_com_escopo(self):
+        """Testa cupom restrito a um produto"""
+        tabela = TabelaCupons(CUPONS_PADRAO)
+        assert tabela.buscar("LUB2", "lubrificante").tipo == FIXO
+        assert tabela.buscar("LUB2", "diesel") is None
+
+    def test_escopo_tem_precedencia(self):
+        """Testa que a regra do produto vence a regra global"""
+        tabela = TabelaCupons([
+            Cupom("X", PERCENTUAL, 0.10),
+            Cupom("X", FIXO, 5, ("etanol",)),
+        ])
+        assert tabela.buscar("X", "etanol").aplicar(100) == 95
+        assert tabela.buscar("X", "diesel").aplicar(100) == 90
+
+    def test_buscar_sem_cupom(self):
+        """Testa cupom vazio ou desconhecido"""
+        tabela = TabelaCupons(CUPONS_PADRAO)
+        assert tabela.buscar(None) is None
+        assert tabela.buscar("") is None
+        assert tabela.buscar("NAOEXISTE") is None
+
+    def test_tipo_invalido(self):
+        """Testa tipo de cupom desconhecido"""
+        with pytest.raises(ValueError):
+            TabelaCupons([Cupom("X", "brinde", 1)])
+
+    def test_carregar_arquivo(self):
+        """Testa carregar cupons de arquivo JSON"""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            json.dump([{"codigo": "FROTA15", "valor": 0.15, "produtos": ["diesel"]}], f)
+            temp_path = f.name
+
+        try:
+            tabela = TabelaCupons.carregar(temp_path)
+            assert tabela.buscar("FROTA15", "diesel").aplicar(100) == 85
+            assert tabela.buscar("FROTA15", "gasolina") is None
+        finally:
+            os.remove(temp_path)
+
+
+class TestMonitorCuponsPytest:
+    """Testes para recarga a quente de cupons usando pytest"""
+
+    def test_recarrega_quando_arquivo_muda(self, tabela_padrao):
+        """Testa que alterações no arquivo são aplicadas sem reiniciar"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cupons.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump([{"codigo": "A", "valor": 0.5}], f)
+
+            monitorar_cupons(path, intervalo=0)
+            assert PrecoCalculadora("diesel", 100).calcular_desconto("A", 100) == 50
+            assert buscar_cupom("MEGA10") is None
+
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump([{"codigo": "B", "tipo": "fixo", "valor": 1}], f)
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+
+            assert buscar_cupom("A") is None
+            assert buscar_cupom("B").aplicar(10) == 9
+
+    def test_arquivo_invalido_mantem_tabela(self, tabela_padrao):
+        """Testa que um arquivo corrompido não derruba a tabela ativa"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cupons.json")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("[{")
+
+            atual = tabela_cupons()
+            monitorar_cupons(path, intervalo=0)
+            assert tabela_cupons() is atual
+            assert buscar_cupom("MEGA10") is not None
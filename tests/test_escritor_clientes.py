@@ -0,0 +1,118 @@
+"""Testes para o EscritorClientes usando pytest"""
+
+import os
+import sys
+import time
+
+import pytest
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models import clientes as modulo
+from src.models.clientes import (
+    CABECALHO_CLIENTES,
+    FSYNC_LOTE,
+    FSYNC_NUNCA,
+    ClienteRepositorio,
+    Clientes,
+    EscritorClientes,
+)
+
+
+def _linhas(path):
+    """Linhas de clientes gravadas (sem o cabeçalho)."""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [linha for linha in f.read().splitlines() if linha != CABECALHO_CLIENTES.strip()]
+
+
+def _cliente(i):
+    return {"nome": f"Cliente {i}", "email": f"c{i}@email.com", "cnpj": i}
+
+
+class TestEscritorClientesPytest:
+    """Testes para EscritorClientes usando pytest"""
+
+    def test_descarrega_por_tamanho(self, tmp_path):
+        """Testa que o lote é gravado ao atingir tamanho_lote"""
+        path = str(tmp_path / "clientes.txt")
+        with EscritorClientes(path, tamanho_lote=3, intervalo=None) as escritor:
+            escritor.salvar(_cliente(1))
+            escritor.salvar(_cliente(2))
+            assert _linhas(path) == []
+            assert escritor.pendentes == 2
+            escritor.salvar(_cliente(3))
+            assert len(_linhas(path)) == 3
+            assert escritor.lotes == 1
+
+    def test_flush_explicito_e_fechar(self, tmp_path):
+        """Testa flush() e a gravação do restante ao sair do contexto"""
+        path = str(tmp_path / "clientes.txt")
+        with EscritorClientes(path, tamanho_lote=100, intervalo=None) as escritor:
+            escritor.salvar(_cliente(1))
+            escritor.flush()
+            assert len(_linhas(path)) == 1
+            escritor.salvar(_cliente(2))
+        assert len(_linhas(path)) == 2
+        with pytest.raises(ValueError):
+            escritor.salvar(_cliente(3))
+
+    def test_descarrega_por_intervalo(self, tmp_path):
+        """Testa que a thread de fundo grava lotes que esperaram demais"""
+        path = str(tmp_path / "clientes.txt")
+        with EscritorClientes(path, tamanho_lote=100, intervalo=0.05) as escritor:
+            escritor.salvar(_cliente(1))
+            limite = time.monotonic() + 2
+            while not _linhas(path) and time.monotonic() < limite:
+                time.sleep(0.01)
+            assert len(_linhas(path)) == 1
+
+    def test_repositorio_usa_escritor_aberto(self, tmp_path):
+        """Testa que salvar/cadastrar passam pelo escritor do mesmo arquivo"""
+        path = str(tmp_path / "clientes.txt")
+        outro = str(tmp_path / "outro.txt")
+        with EscritorClientes(path, tamanho_lote=100, intervalo=None) as escritor:
+            ClienteRepositorio.salvar(_cliente(1), path)
+            ClienteRepositorio.salvar(_cliente(2), outro)
+            assert escritor.pendentes == 1
+            assert len(_linhas(outro)) == 1
+            # carregar descarrega o lote antes de ler
+            assert set(ClienteRepositorio.carregar(path)) == {1}
+        assert modulo._escritores == {}
+
+    def test_cadastrar_em_massa(self, tmp_path, monkeypatch):
+        """Testa Clientes.cadastrar com o escritor aberto no arquivo padrão"""
+        monkeypatch.chdir(tmp_path)
+        with EscritorClientes(tamanho_lote=10, intervalo=None) as escritor:
+            for i in range(1, 26):
+                assert Clientes(f"c{i}@email.com", f"Cliente {i}", i).cadastrar() is True
+            assert escritor.lotes == 2
+        assert len(ClienteRepositorio.carregar()) == 25
+
+    @pytest.mark.parametrize("politica", [FSYNC_NUNCA, FSYNC_LOTE])
+    def test_politicas_fsync(self, tmp_path, monkeypatch, politica):
+        """Testa quando cada política chama os.fsync"""
+        chamadas = []
+        monkeypatch.setattr(modulo.os, "fsync", chamadas.append)
+        path = str(tmp_path / "clientes.txt")
+        with EscritorClientes(path, tamanho_lote=2, intervalo=None, fsync=politica):
+            for i in range(4):
+                ClienteRepositorio.salvar(_cliente(i), path)
+        assert len(chamadas) == (2 if politica == FSYNC_LOTE else 0)
+
+    def test_fsync_ao_fechar(self, tmp_path, monkeypatch):
+        """Testa a política padrão: um único fsync ao fechar"""
+        chamadas = []
+        monkeypatch.setattr(modulo.os, "fsync", chamadas.append)
+        with EscritorClientes(str(tmp_path / "clientes.txt"), tamanho_lote=1, intervalo=None) as escritor:
+            escritor.salvar(_cliente(1))
+            escritor.salvar(_cliente(2))
+            assert chamadas == []
+        assert len(chamadas) == 1
+
+    def test_politica_invalida(self, tmp_path):
+        """Testa rejeição de política de fsync desconhecida"""
+        with pytest.raises(ValueError):
+            EscritorClientes(str(tmp_path / "clientes.txt"), fsync="sempre")
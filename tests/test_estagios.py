@@ -0,0 +1,91 @@
+"""Testes para o processamento em estágios usando pytest"""
+
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.estagios import PipelineEstagios, formatar_estatisticas, processar_em_estagios
+from src.services.fluxo import processar_arquivo
+from src.services.pedido import processar_pedido
+
+PEDIDOS = [
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
+    {"cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
+    {"cliente": "EcoFrota", "produto": "etanol", "qtd": 50, "cupom": "NOVO5"},
+    {"cliente": "PetroPark", "produto": "lubrificante", "qtd": 12, "cupom": "LUB2"},
+]
+
+
+class TestPipelineEstagiosPytest:
+    """Testes para PipelineEstagios usando pytest"""
+
+    def test_resultados_em_ordem(self):
+        """Testa que os resultados saem na ordem da entrada"""
+        pedidos = PEDIDOS * 100
+        resultados, pipeline = processar_em_estagios(iter(pedidos), list, tamanho_fila=2, tamanho_bloco=7)
+        assert resultados == [(p, processar_pedido(p)) for p in pedidos]
+        resumo = pipeline.resumo()
+        assert [resumo[e]["itens"] for e in ("leitura", "precificacao", "escrita")] == [400] * 3
+        assert len(list(formatar_estatisticas(resumo))) == 3
+
+    def test_backpressure_limita_leitura(self):
+        """Testa que uma escrita lenta segura a leitura (filas limitadas)"""
+        lidos = itertools.count()
+
+        def fonte():
+            for p in itertools.cycle(PEDIDOS):
+                next(lidos)
+                yield p
+
+        def gravar_lento(resultados):
+            for i, _ in enumerate(resultados):
+                if i == 50:
+                    return next(lidos)
+                time.sleep(0.001)
+
+        pipeline = PipelineEstagios(tamanho_fila=2, tamanho_bloco=10)
+        lidos_ate_parar = pipeline.executar(fonte(), gravar_lento)
+        # Além dos 50 já gravados: 2 filas de 2 blocos e 1 bloco em leitura e em precificação
+        assert lidos_ate_parar - 50 <= 10 * (2 * 2 + 2) + 1
+        assert pipeline.estatisticas["leitura"].bloqueado > 0
+        assert pipeline.estatisticas["leitura"].fila_max == 2
+
+    def test_erro_na_transformacao_cancela(self):
+        """Testa que um erro em um estágio chega a quem chamou"""
+        def falhar(p):
+            if p["qtd"] == 12:
+                raise ValueError("pedido ruim")
+            return p
+
+        pipeline = PipelineEstagios(falhar, tamanho_fila=1, tamanho_bloco=1)
+        with pytest.raises(ValueError, match="pedido ruim"):
+            pipeline.executar(itertools.cycle(PEDIDOS), list)
+        assert not [t for t in threading.enumerate() if t.name in ("leitura", "precificacao")]
+
+    def test_erro_na_escrita_cancela(self):
+        """Testa que um erro na escrita encerra leitura e precificação"""
+        def gravar(resultados):
+            next(iter(resultados))
+            raise OSError("disco cheio")
+
+        with pytest.raises(OSError):
+            PipelineEstagios(tamanho_fila=1).executar(itertools.cycle(PEDIDOS), gravar)
+        assert not [t for t in threading.enumerate() if t.name in ("leitura", "precificacao")]
+
+    def test_processar_arquivo_em_estagios(self, tmp_path):
+        """Testa processar_arquivo com o pipeline em estágios"""
+        entrada, saida = tmp_path / "pedidos.jsonl", tmp_path / "saida.jsonl"
+        entrada.write_text("".join(json.dumps(p) + "\n" for p in PEDIDOS * 30), encoding="utf-8")
+        pipeline = PipelineEstagios(tamanho_bloco=16)
+        quantidade, total = processar_arquivo(str(entrada), str(saida), estagios=pipeline)
+        assert quantidade == 120
+        assert total == pytest.approx(30 * sum(processar_pedido(p) for p in PEDIDOS))
+        assert pipeline.resumo()["escrita"]["itens"] == 120
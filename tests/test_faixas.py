@@ -0,0 +1,52 @@
+"""Testes para o módulo Faixas usando pytest"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.faixas import TabelaFaixas, MULTIPLICADOR, DEDUCAO
+
+
+class TestTabelaFaixasPytest:
+    """Testes para TabelaFaixas usando pytest"""
+
+    def test_multiplicador_limites_exclusivos(self):
+        """Testa que a faixa só vale acima do limite"""
+        faixas = TabelaFaixas([(1000, 0.9), (500, 0.95)])
+        assert faixas.aplicar(100.0, 500) == 100.0
+        assert faixas.aplicar(100.0, 501) == 100.0 * 0.95
+        assert faixas.aplicar(100.0, 1000) == 100.0 * 0.95
+        assert faixas.aplicar(100.0, 1001) == 100.0 * 0.9
+
+    def test_deducao(self):
+        """Testa faixa de dedução fixa"""
+        faixas = TabelaFaixas([(200, 100)], tipo=DEDUCAO)
+        assert faixas.aplicar(500.0, 200) == 500.0
+        assert faixas.aplicar(500.0, 201) == 400.0
+
+    def test_sem_faixas(self):
+        """Testa tabela vazia"""
+        faixas = TabelaFaixas()
+        assert faixas.aplicar(10.0, 10**9) == 10.0
+
+    def test_tipo_invalido(self):
+        """Testa tipo de faixa desconhecido"""
+        with pytest.raises(ValueError):
+            TabelaFaixas([(1, 1)], tipo="bonus")
+
+    @pytest.mark.parametrize("tipo", [MULTIPLICADOR, DEDUCAO])
+    def test_lote_igual_ao_escalar(self, tipo):
+        """Testa que o lote reproduz o escalar em uma tabela com muitas faixas"""
+        faixas = TabelaFaixas([(i * 50, 1 - i / 100) for i in range(1, 40)], tipo=tipo)
+        qtds = np.arange(-5, 2500)
+        precos = 3.99 * qtds
+
+        lote = faixas.aplicar_lote(precos, qtds)
+
+        for preco, qtd, valor in zip(precos, qtds, lote):
+            assert valor == faixas.aplicar(float(preco), int(qtd))
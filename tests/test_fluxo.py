@@ -0,0 +1,82 @@
+"""Testes para o processamento de pedidos em fluxo usando pytest"""
+
+import io
+import itertools
+import json
+import os
+import sys
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.fluxo import CSV, JSONL, escrever_resultados, ler_pedidos, processar_arquivo
+from src.services.pedido import processar_pedido, processar_pedidos
+
+PEDIDOS = [
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
+    {"cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
+    {"cliente": "EcoFrota", "produto": "etanol", "qtd": 50, "cupom": "NOVO5"},
+    {"cliente": "PetroPark", "produto": "lubrificante", "qtd": 12, "cupom": "LUB2"},
+]
+
+
+class TestProcessarPedidosPytest:
+    """Testes para processar_pedidos usando pytest"""
+
+    def test_gerador_preguicoso(self):
+        """Testa que pedidos são consumidos sob demanda"""
+        infinitos = itertools.cycle(PEDIDOS)
+        resultados = list(itertools.islice(processar_pedidos(infinitos), 6))
+        assert len(resultados) == 6
+        assert resultados[4] == (PEDIDOS[0], processar_pedido(PEDIDOS[0]))
+
+
+class TestFluxoArquivosPytest:
+    """Testes para leitura e escrita incrementais usando pytest"""
+
+    def test_ler_jsonl_ignora_linhas_vazias(self):
+        """Testa leitura de JSON lines"""
+        texto = json.dumps(PEDIDOS[0]) + "\n\n" + json.dumps(PEDIDOS[1]) + "\n"
+        assert list(ler_pedidos(io.StringIO(texto), JSONL)) == PEDIDOS[:2]
+
+    def test_ler_csv_converte_campos(self):
+        """Testa leitura de CSV com quantidade inteira e cupom vazio"""
+        texto = "cliente,produto,qtd,cupom\nMoveMais,gasolina,300,\n"
+        assert list(ler_pedidos(io.StringIO(texto), CSV)) == [PEDIDOS[1]]
+
+    def test_escrever_csv(self):
+        """Testa escrita de resultados em CSV"""
+        saida = io.StringIO()
+        quantidade, total = escrever_resultados([(PEDIDOS[1], 1457.0)], saida, CSV)
+        assert (quantidade, total) == (1, 1457.0)
+        assert saida.getvalue().splitlines() == [
+            "cliente,produto,qtd,cupom,valor",
+            "MoveMais,gasolina,300,,1457.0",
+        ]
+
+    def test_processar_arquivo_jsonl(self, tmp_path):
+        """Testa o processamento completo de JSONL para JSONL"""
+        entrada, saida = tmp_path / "pedidos.jsonl", tmp_path / "resultados.jsonl"
+        entrada.write_text("".join(json.dumps(p) + "\n" for p in PEDIDOS), encoding="utf-8")
+
+        quantidade, total = processar_arquivo(str(entrada), str(saida))
+
+        esperados = [processar_pedido(p) for p in PEDIDOS]
+        assert quantidade == 4
+        assert total == sum(esperados)
+        linhas = [json.loads(l) for l in saida.read_text(encoding="utf-8").splitlines()]
+        assert [l["valor"] for l in linhas] == esperados
+        assert linhas[0]["cliente"] == "TransLog"
+
+    def test_processar_arquivo_csv_para_jsonl(self, tmp_path):
+        """Testa conversão de formato entre entrada e saída"""
+        entrada, saida = tmp_path / "pedidos.csv", tmp_path / "resultados.jsonl"
+        entrada.write_text(
+            "cliente,produto,qtd,cupom\n" + "".join(
+                f"{p['cliente']},{p['produto']},{p['qtd']},{p['cupom'] or ''}\n" for p in PEDIDOS
+            ),
+            encoding="utf-8",
+        )
+        quantidade, total = processar_arquivo(str(entrada), str(saida))
+        assert quantidade == 4
+        assert total == sum(processar_pedido(p) for p in PEDIDOS)
@@ -0,0 +1,106 @@
+"""Testes para o formato do arquivo de clientes usando pytest"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.clientes import (
+    CABECALHO_CLIENTES,
+    ClienteRepositorio,
+    EscritorClientes,
+    ler_clientes,
+    migrar_clientes,
+)
+
+
+def _cliente(i):
+    return {"nome": f"Cliente {i}", "email": f"c{i}@email.com", "cnpj": i}
+
+
+def _gravar_legado(path, clientes):
+    with open(path, "w", encoding="utf-8") as f:
+        for c in clientes:
+            f.write(str(c) + "\n")
+
+
+class TestFormatoClientesPytest:
+    """Testes para leitura, gravação e migração do arquivo de clientes"""
+
+    def test_salvar_grava_cabecalho_e_json(self, tmp_path):
+        """Testa que um arquivo novo começa com o cabeçalho versionado"""
+        path = str(tmp_path / "clientes.txt")
+        ClienteRepositorio.salvar(_cliente(1), path)
+        ClienteRepositorio.salvar({"nome": "Ação", "email": "a@email.com", "cnpj": 2}, path)
+        with open(path, encoding="utf-8") as f:
+            linhas = f.read().splitlines()
+        assert linhas[0] + "\n" == CABECALHO_CLIENTES
+        assert json.loads(linhas[1]) == _cliente(1)
+        assert json.loads(linhas[2])["nome"] == "Ação"
+        assert len(linhas) == 3
+
+    def test_ler_em_blocos(self, tmp_path):
+        """Testa a leitura em fluxo com blocos menores que o arquivo"""
+        path = str(tmp_path / "clientes.txt")
+        with EscritorClientes(path, intervalo=None) as escritor:
+            for i in range(25):
+                escritor.salvar(_cliente(i))
+        assert list(ler_clientes(path, tamanho_bloco=7)) == [_cliente(i) for i in range(25)]
+
+    def test_ler_arquivo_vazio(self, tmp_path):
+        """Testa que um arquivo vazio não tem clientes"""
+        path = tmp_path / "clientes.txt"
+        path.write_text("")
+        assert list(ler_clientes(str(path))) == []
+
+    def test_ler_legado_sem_migrar(self, tmp_path):
+        """Testa a leitura direta do formato antigo"""
+        path = str(tmp_path / "clientes.txt")
+        _gravar_legado(path, [_cliente(1), _cliente(2)])
+        assert list(ler_clientes(path)) == [_cliente(1), _cliente(2)]
+        with open(path, encoding="utf-8") as f:
+            assert f.readline() != CABECALHO_CLIENTES
+
+    def test_migrar_legado(self, tmp_path):
+        """Testa a migração única do formato antigo"""
+        path = str(tmp_path / "clientes.txt")
+        _gravar_legado(path, [_cliente(1), _cliente(2)])
+        # Linha JSON acrescentada antes da migração também é preservada
+        ClienteRepositorio.salvar(_cliente(3), path)
+
+        assert migrar_clientes(path) is True
+        assert migrar_clientes(path) is False
+        with open(path, encoding="utf-8") as f:
+            assert f.readline() == CABECALHO_CLIENTES
+        assert list(ler_clientes(path)) == [_cliente(1), _cliente(2), _cliente(3)]
+
+    def test_carregar_migra_legado(self, tmp_path):
+        """Testa que carregar converte o arquivo antigo na primeira leitura"""
+        path = str(tmp_path / "clientes.txt")
+        _gravar_legado(path, [_cliente(5)])
+        assert ClienteRepositorio.carregar(path) == {5: _cliente(5)}
+        with open(path, encoding="utf-8") as f:
+            assert f.readline() == CABECALHO_CLIENTES
+
+    def test_escritor_migra_legado(self, tmp_path):
+        """Testa que o escritor converte o arquivo antigo antes de acrescentar"""
+        path = str(tmp_path / "clientes.txt")
+        _gravar_legado(path, [_cliente(1)])
+        with EscritorClientes(path, intervalo=None) as escritor:
+            escritor.salvar(_cliente(2))
+        assert set(ClienteRepositorio.carregar(path)) == {1, 2}
+
+    def test_migrar_inexistente(self, tmp_path):
+        """Testa migração de arquivo que não existe"""
+        assert migrar_clientes(str(tmp_path / "nada.txt")) is False
+
+    def test_versao_nao_suportada(self, tmp_path):
+        """Testa rejeição de arquivo de versão futura"""
+        path = tmp_path / "clientes.txt"
+        path.write_text('{"formato":"clientes","versao":99}\n', encoding="utf-8")
+        with pytest.raises(ValueError):
+            list(ler_clientes(str(path)))
@@ -0,0 +1,169 @@
+"""Testes para o índice de CNPJs do arquivo de clientes usando pytest"""
+
+import os
+import struct
+import sys
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models import clientes as modulo
+from src.models.clientes import (
+    CABECALHO_INDICE,
+    MAGICA_INDICE,
+    SUFIXO_INDICE,
+    TAMANHO_CABECALHO_INDICE,
+    ClienteRepositorio,
+    EscritorClientes,
+    migrar_clientes,
+    reindexar_clientes,
+)
+
+
+def _cliente(i, nome=None):
+    return {"nome": nome or f"Cliente {i}", "email": f"c{i}@email.com", "cnpj": i}
+
+
+def _salvar(path, inicio, fim):
+    for i in range(inicio, fim):
+        ClienteRepositorio.salvar(_cliente(i), path)
+
+
+class TestIndiceClientesPytest:
+    """Testes para ClienteRepositorio.buscar e o índice em disco"""
+
+    def test_buscar_cria_e_usa_indice(self, tmp_path):
+        """Testa a busca e a criação do índice na primeira consulta"""
+        path = str(tmp_path / "clientes.txt")
+        _salvar(path, 1, 51)
+        assert not os.path.exists(path + SUFIXO_INDICE)
+
+        assert ClienteRepositorio.buscar(37, path) == _cliente(37)
+        assert ClienteRepositorio.buscar("12", path) == _cliente(12)
+        assert ClienteRepositorio.buscar(999, path) is None
+        assert os.path.getsize(path + SUFIXO_INDICE) == TAMANHO_CABECALHO_INDICE + 50 * 16
+
+    def test_salvar_mantem_indice(self, tmp_path):
+        """Testa que salvar acrescenta ao índice existente"""
+        path = str(tmp_path / "clientes.txt")
+        _salvar(path, 1, 4)
+        assert ClienteRepositorio.buscar(1, path) == _cliente(1)
+        tamanho = os.path.getsize(path + SUFIXO_INDICE)
+
+        ClienteRepositorio.salvar(_cliente(7), path)
+        assert os.path.getsize(path + SUFIXO_INDICE) == tamanho + 16
+        assert ClienteRepositorio.buscar(7, path) == _cliente(7)
+
+    def test_ultimo_registro_prevalece(self, tmp_path):
+        """Testa que um CNPJ regravado devolve o registro mais recente, como carregar"""
+        path = str(tmp_path / "clientes.txt")
+        ClienteRepositorio.salvar(_cliente(1, "Antigo"), path)
+        ClienteRepositorio.buscar(1, path)
+        ClienteRepositorio.salvar(_cliente(1, "Novo"), path)
+        assert ClienteRepositorio.buscar(1, path)["nome"] == "Novo"
+        assert ClienteRepositorio.carregar(path)[1]["nome"] == "Novo"
+
+    def test_escritor_mantem_indice(self, tmp_path):
+        """Testa busca com escritor aberto (o lote é descarregado antes)"""
+        path = str(tmp_path / "clientes.txt")
+        _salvar(path, 1, 3)
+        ClienteRepositorio.buscar(1, path)
+        with EscritorClientes(path, tamanho_lote=100, intervalo=None) as escritor:
+            for i in range(3, 10):
+                escritor.salvar(_cliente(i))
+            assert ClienteRepositorio.buscar(8, path) == _cliente(8)
+        assert os.path.getsize(path + SUFIXO_INDICE) == TAMANHO_CABECALHO_INDICE + 9 * 16
+
+    def test_linhas_gravadas_sem_indice(self, tmp_path):
+        """Testa que linhas acrescentadas por fora do repositório são indexadas"""
+        path = str(tmp_path / "clientes.txt")
+        _salvar(path, 1, 3)
+        ClienteRepositorio.buscar(1, path)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"nome":"Externo","email":"e@email.com","cnpj":50}\n')
+            f.write('{"nome":"Incompleto"')
+        assert ClienteRepositorio.buscar(50, path)["nome"] == "Externo"
+
+    def test_indice_inconsistente_e_refeito(self, tmp_path):
+        """Testa que um índice que não bate com os dados é reconstruído"""
+        path = str(tmp_path / "clientes.txt")
+        _salvar(path, 1, 6)
+        with open(path + SUFIXO_INDICE, "wb") as f:
+            f.write(CABECALHO_INDICE.pack(MAGICA_INDICE, 2, 0) + struct.pack("<4q", 3, 5, 4, 7))
+        assert ClienteRepositorio.buscar(3, path) == _cliente(3)
+        assert ClienteRepositorio.buscar(4, path) == _cliente(4)
+
+    def test_arquivo_recriado_substitui_indice(self, tmp_path):
+        """Testa que um arquivo de dados novo não herda o índice antigo"""
+        path = str(tmp_path / "clientes.txt")
+        _salvar(path, 1, 6)
+        ClienteRepositorio.buscar(1, path)
+        os.remove(path)
+        ClienteRepositorio.salvar(_cliente(9), path)
+        assert os.path.getsize(path + SUFIXO_INDICE) == TAMANHO_CABECALHO_INDICE + 16
+        assert ClienteRepositorio.buscar(1, path) is None
+        assert ClienteRepositorio.buscar(9, path) == _cliente(9)
+
+    def test_migracao_descarta_indice(self, tmp_path):
+        """Testa busca no formato antigo e o descarte do índice na migração"""
+        path = str(tmp_path / "clientes.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(1, 4):
+                f.write(str(_cliente(i)) + "\n")
+        assert ClienteRepositorio.buscar(2, path) == _cliente(2)
+        assert migrar_clientes(path) is True
+        assert not os.path.exists(path + SUFIXO_INDICE)
+        assert ClienteRepositorio.buscar(2, path) == _cliente(2)
+
+    def test_reindexar(self, tmp_path):
+        """Testa a reconstrução explícita do índice"""
+        path = str(tmp_path / "clientes.txt")
+        _salvar(path, 1, 11)
+        assert reindexar_clientes(path) == 10
+        assert ClienteRepositorio.buscar(10, path) == _cliente(10)
+
+    def test_buscar_arquivo_inexistente(self, tmp_path):
+        """Testa busca sem arquivo de dados"""
+        assert ClienteRepositorio.buscar(1, str(tmp_path / "nada.txt")) is None
+
+    def test_indice_ordenado_nao_e_carregado(self, tmp_path):
+        """Testa que uma nova instância busca na parte ordenada sem carregar os pares"""
+        path = str(tmp_path / "clientes.txt")
+        for i in (5, 3, 9, 1, 3):
+            ClienteRepositorio.salvar(_cliente(i, f"Cliente {i} v{i}"), path)
+        ClienteRepositorio.salvar(_cliente(3, "Último"), path)
+        assert reindexar_clientes(path) == 4
+
+        indice = modulo.IndiceClientes(path)
+        assert indice.buscar(3)["nome"] == "Último"
+        assert indice.buscar(9) == _cliente(9, "Cliente 9 v9")
+        assert indice.buscar(4) is None
+        assert indice.recentes == {}
+        indice.fechar()
+
+    def test_compacta_recentes(self, tmp_path, monkeypatch):
+        """Testa que os pares acrescentados viram parte ordenada ao passar do limite"""
+        monkeypatch.setattr(modulo, "LIMITE_RECENTES", 4)
+        path = str(tmp_path / "clientes.txt")
+        _salvar(path, 1, 3)
+        ClienteRepositorio.buscar(1, path)
+        _salvar(path, 3, 6)
+        assert ClienteRepositorio.buscar(4, path) == _cliente(4)
+        assert len(modulo._indices[os.path.abspath(path)].recentes) == 3
+
+        _salvar(path, 6, 8)
+        assert ClienteRepositorio.buscar(7, path) == _cliente(7)
+        with open(path + SUFIXO_INDICE, "rb") as f:
+            assert CABECALHO_INDICE.unpack(f.read(TAMANHO_CABECALHO_INDICE))[1] == 7
+        assert os.path.getsize(path + SUFIXO_INDICE) == TAMANHO_CABECALHO_INDICE + 7 * 16
+        assert [ClienteRepositorio.buscar(i, path) for i in range(1, 8)] == [_cliente(i) for i in range(1, 8)]
+
+    def test_indice_versao_anterior_e_refeito(self, tmp_path):
+        """Testa que um índice no formato anterior (pares sem ordem) é reconstruído"""
+        path = str(tmp_path / "clientes.txt")
+        _salvar(path, 1, 4)
+        with open(path + SUFIXO_INDICE, "wb") as f:
+            f.write(b"CLIDX001" + struct.pack("<2q", 2, 999))
+        assert ClienteRepositorio.buscar(2, path) == _cliente(2)
+        with open(path + SUFIXO_INDICE, "rb") as f:
+            assert f.read(len(MAGICA_INDICE)) == MAGICA_INDICE
@@ -0,0 +1,115 @@
+"""Testes para a reprecificação incremental de lotes usando pytest"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.calculadora import BASES
+from src.models.cupons import CUPONS_PADRAO, FIXO, Cupom, TabelaCupons, ativar_tabela_cupons, tabela_cupons
+from src.services import lote_precificado
+from src.services.lote_precificado import LotePrecificado, abrir_lote_precificado
+from src.services.pedido import processar_pedido
+
+PEDIDOS = [
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
+    {"cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
+    {"cliente": "EcoFrota", "produto": "etanol", "qtd": 50, "cupom": "NOVO5"},
+    {"cliente": "PetroPark", "produto": "lubrificante", "qtd": 12, "cupom": "LUB2"},
+    {"cliente": "TransLog", "produto": "gasolina", "qtd": 80, "cupom": "MEGA10"},
+] * 20
+
+
+@pytest.fixture
+def precos_restaurados():
+    """Restaura preços e cupons alterados pelo teste"""
+    precos, cupons = dict(BASES), tabela_cupons()
+    yield
+    BASES.substituir(precos)
+    ativar_tabela_cupons(cupons)
+
+
+def esperado():
+    """Valores recalculados do zero"""
+    return [processar_pedido(p) for p in PEDIDOS]
+
+
+class TestLotePrecificadoPytest:
+    """Testes para LotePrecificado usando pytest"""
+
+    def test_criar(self, tmp_path):
+        """Testa valores e totais do lote recém-criado"""
+        lote = LotePrecificado.criar(PEDIDOS, str(tmp_path / "lote"), tamanho_bloco=7)
+        assert len(lote) == len(PEDIDOS)
+        assert lote.valores.tolist() == esperado()
+        assert lote.total == pytest.approx(sum(esperado()))
+        assert lote.total_produto("gasolina") == pytest.approx(
+            sum(v for p, v in zip(PEDIDOS, esperado()) if p["produto"] == "gasolina")
+        )
+        assert lote.reprecificar() == 0
+
+    def test_mudanca_de_preco_afeta_so_o_produto(self, tmp_path, precos_restaurados):
+        """Testa que só os pedidos do produto alterado são recalculados"""
+        lote = LotePrecificado.criar(PEDIDOS, str(tmp_path / "lote"))
+        etanol_antes = lote.total_produto("etanol")
+        BASES["diesel"] = 4.25
+        assert lote.pares_afetados() == [(0, 0)]
+        assert lote.reprecificar() == 20
+        assert lote.valores.tolist() == esperado()
+        assert lote.total == pytest.approx(sum(esperado()))
+        assert lote.total_produto("etanol") == etanol_antes
+        assert lote.reprecificar() == 0
+
+    def test_mudanca_de_cupom(self, tmp_path, precos_restaurados):
+        """Testa que só os pedidos com o cupom alterado são recalculados"""
+        lote = LotePrecificado.criar(PEDIDOS, str(tmp_path / "lote"))
+        outros = [c for c in CUPONS_PADRAO if c.codigo != "LUB2"]
+        ativar_tabela_cupons(TabelaCupons(outros + [Cupom("LUB2", FIXO, 5, ("lubrificante",))]))
+        assert lote.reprecificar() == 20
+        assert lote.valores.tolist() == esperado()
+        assert lote.total_cupom("LUB2") == pytest.approx(20 * processar_pedido(PEDIDOS[3]))
+
+    def test_estado_persistido(self, tmp_path, precos_restaurados):
+        """Testa que valores, índice e totais sobrevivem à reabertura"""
+        diretorio = str(tmp_path / "lote")
+        LotePrecificado.criar(PEDIDOS, diretorio)
+        BASES["gasolina"] = 6.05
+        lote = abrir_lote_precificado(diretorio)
+        assert lote.reprecificar() == 40
+        del lote
+
+        reaberto = abrir_lote_precificado(diretorio)
+        assert reaberto.reprecificar() == 0
+        assert np.asarray(reaberto.valores).tolist() == esperado()
+        assert reaberto.total == pytest.approx(sum(esperado()))
+        assert reaberto.totais()["cupom"][None] == pytest.approx(processar_pedido(PEDIDOS[1]) * 20)
+
+    @pytest.mark.parametrize("falha_na_gravacao, refeitos", [(1, 20), (2, 0)], ids=["antes", "depois"])
+    def test_queda_durante_reprecificacao(self, tmp_path, monkeypatch, precos_restaurados, falha_na_gravacao, refeitos):
+        """Testa que uma queda antes ou depois de gravar os valores não deixa totais errados"""
+        diretorio = str(tmp_path / "lote")
+        LotePrecificado.criar(PEDIDOS, diretorio)
+        gravar = lote_precificado._gravar_estado
+        gravacoes = []
+
+        def gravar_e_cair(*args):
+            gravacoes.append(args)
+            if len(gravacoes) == falha_na_gravacao:
+                raise OSError("queda simulada")
+            gravar(*args)
+
+        monkeypatch.setattr(lote_precificado, "_gravar_estado", gravar_e_cair)
+        BASES["diesel"] = 4.25
+        with pytest.raises(OSError):
+            abrir_lote_precificado(diretorio).reprecificar()
+        monkeypatch.setattr(lote_precificado, "_gravar_estado", gravar)
+
+        reaberto = abrir_lote_precificado(diretorio)
+        assert reaberto.reprecificar() == refeitos
+        assert np.asarray(reaberto.valores).tolist() == esperado()
+        assert reaberto.total == pytest.approx(sum(esperado()))
+        assert reaberto.total_produto("diesel") == pytest.approx(20 * processar_pedido(PEDIDOS[0]))
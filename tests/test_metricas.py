@@ -0,0 +1,100 @@
+"""Testes para as métricas de processar_pedido usando pytest"""
+
+import os
+import sys
+
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.metricas import MetricasPedido
+from src.services.pedido import (
+    ativar_cache,
+    ativar_metricas,
+    desativar_cache,
+    desativar_metricas,
+    processar_pedido,
+)
+
+
+@pytest.fixture
+def metricas():
+    """Ativa as métricas durante o teste"""
+    metricas = ativar_metricas()
+    yield metricas
+    desativar_metricas()
+
+
+def pedido(produto="diesel", qtd=100, cupom=None):
+    """Monta um pedido de teste"""
+    return {"cliente": "Frota", "produto": produto, "qtd": qtd, "cupom": cupom}
+
+
+class TestMetricasPedidoPytest:
+    """Testes para MetricasPedido usando pytest"""
+
+    def test_resultado_igual_com_metricas(self, metricas):
+        """Testa que a instrumentação não altera o valor"""
+        assert processar_pedido(pedido(cupom="MEGA10")) == round(3.99 * 100 * 0.9, 0)
+        assert processar_pedido(pedido("etanol", 100)) == float(int(3.59 * 100 * 0.97 * 100) / 100.0)
+
+    def test_contagem_por_produto_e_cupom(self, metricas):
+        """Testa contadores por produto e cupom"""
+        processar_pedido(pedido(cupom="MEGA10"))
+        processar_pedido(pedido(cupom="MEGA10"))
+        processar_pedido(pedido("gasolina"))
+        assert metricas.pedidos() == 3
+        assert metricas.pedidos(produto="diesel", cupom="MEGA10") == 2
+        assert metricas.pedidos(cupom="") == 1
+
+    def test_etapas_registradas(self, metricas):
+        """Testa que todas as etapas do cálculo são medidas"""
+        processar_pedido(pedido())
+        etapas = {linha["etapa"] for linha in metricas.resumo()}
+        assert etapas == {"estrategia", "preco_base", "limite", "desconto", "arredondamento", "saida"}
+        assert metricas.histograma("preco_base", "diesel").total == 1
+
+    def test_etapa_de_cache(self, metricas):
+        """Testa que o cache aparece como etapa própria"""
+        ativar_cache()
+        try:
+            processar_pedido(pedido())
+        finally:
+            desativar_cache()
+        assert metricas.histograma("cache", "diesel").total == 1
+        assert metricas.histograma("preco_base", "diesel") is None
+
+    def test_desativadas_nao_coletam(self):
+        """Testa que nada é coletado com as métricas desativadas"""
+        metricas = ativar_metricas()
+        desativar_metricas()
+        processar_pedido(pedido())
+        assert metricas.pedidos() == 0
+
+
+class TestExportadorPrometheusPytest:
+    """Testes para o exportador Prometheus usando pytest"""
+
+    def test_formato_texto(self):
+        """Testa contadores, buckets cumulativos e escape de rótulos"""
+        metricas = MetricasPedido()
+        metricas.registrar("diesel", 'X"1', [("desconto", 300), ("desconto", 2_000_000)])
+        texto = metricas.formatar_prometheus()
+
+        assert 'petrobahia_pedidos_total{produto="diesel",cupom="X\\"1"} 1' in texto
+        rotulos = 'etapa="desconto",produto="diesel",cupom="X\\"1"'
+        assert f'petrobahia_pedido_etapa_segundos_bucket{{{rotulos},le="2.5e-07"}} 0' in texto
+        assert f'petrobahia_pedido_etapa_segundos_bucket{{{rotulos},le="5e-07"}} 1' in texto
+        assert f'petrobahia_pedido_etapa_segundos_bucket{{{rotulos},le="+Inf"}} 2' in texto
+        assert f'petrobahia_pedido_etapa_segundos_count{{{rotulos}}} 2' in texto
+
+    def test_exportar_arquivo(self, tmp_path):
+        """Testa gravação do arquivo para o textfile collector"""
+        metricas = MetricasPedido()
+        metricas.registrar("etanol", None, [("saida", 10)])
+        path = str(tmp_path / "pedidos.prom")
+        metricas.exportar_prometheus(path)
+        with open(path, encoding="utf-8") as f:
+            assert f.read() == metricas.formatar_prometheus()
+        assert os.listdir(tmp_path) == ["pedidos.prom"]
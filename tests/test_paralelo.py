@@ -0,0 +1,105 @@
+"""Testes para a precificação com pool de processos usando pytest"""
+
+import json
+import os
+import random
+import sys
+
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.calculadora import BASES
+from src.services.agregacao import Agregador
+from src.services.fluxo import processar_arquivo
+from src.services.paralelo import processar_paralelo
+from src.services.pedido import processar_pedido
+
+
+def gerar_pedidos(n):
+    """Pedidos aleatórios determinísticos"""
+    rnd = random.Random(7)
+    return [
+        {
+            "cliente": f"C{i}",
+            "produto": rnd.choice(["diesel", "gasolina", "etanol", "lubrificante", "invalido"]),
+            "qtd": rnd.randint(0, 2000),
+            "cupom": rnd.choice([None, "MEGA10", "NOVO5", "LUB2"]),
+        }
+        for i in range(n)
+    ]
+
+
+class TestProcessarParaleloPytest:
+    """Testes para processar_paralelo usando pytest"""
+
+    def test_resultados_em_ordem_e_iguais_ao_escalar(self):
+        """Testa ordem da entrada e valores iguais a processar_pedido"""
+        pedidos = gerar_pedidos(1000)
+        resultados = list(processar_paralelo(iter(pedidos), workers=2, tamanho_lote=37))
+        assert [p for p, _ in resultados] == pedidos
+        assert [v for _, v in resultados] == [processar_pedido(p) for p in pedidos]
+
+    def test_workers_usam_precos_do_pai(self):
+        """Testa que os workers recebem os preços vigentes do processo pai"""
+        original = BASES["etanol"]
+        try:
+            BASES["etanol"] = 10.0
+            pedido = {"cliente": "X", "produto": "etanol", "qtd": 10, "cupom": None}
+            [(_, valor)] = processar_paralelo([pedido], workers=1)
+        finally:
+            BASES["etanol"] = original
+        assert valor == 100.0
+
+    def test_entrada_vazia(self):
+        """Testa entrada sem pedidos"""
+        assert list(processar_paralelo([], workers=1)) == []
+
+    def test_processar_arquivo_com_workers(self, tmp_path):
+        """Testa o modo paralelo do processamento de arquivos"""
+        pedidos = gerar_pedidos(200)
+        entrada, saida = tmp_path / "pedidos.jsonl", tmp_path / "resultados.jsonl"
+        entrada.write_text("".join(json.dumps(p) + "\n" for p in pedidos), encoding="utf-8")
+
+        quantidade, _ = processar_arquivo(str(entrada), str(saida), workers=2, tamanho_lote=50)
+
+        assert quantidade == 200
+        linhas = [json.loads(l) for l in saida.read_text(encoding="utf-8").splitlines()]
+        assert [l["valor"] for l in linhas] == [processar_pedido(p) for p in pedidos]
+
+    def test_processar_arquivo_csv_com_workers_e_agregador(self, tmp_path):
+        """Testa blocos CSV lidos, agregados e serializados nos workers"""
+        pedidos = gerar_pedidos(300)
+        entrada = tmp_path / "pedidos.csv"
+        entrada.write_text(
+            "cupom,produto,qtd,cliente\n"
+            + "".join(f"{p['cupom'] or ''},{p['produto']},{p['qtd']},{p['cliente']}\n" for p in pedidos),
+            encoding="utf-8",
+        )
+        sequencial, paralelo = Agregador(["produto"]), Agregador(["produto"])
+        esperado = processar_arquivo(str(entrada), str(tmp_path / "seq.csv"), agregador=sequencial)
+        obtido = processar_arquivo(
+            str(entrada), str(tmp_path / "par.csv"), workers=2, tamanho_lote=41, agregador=paralelo
+        )
+
+        assert obtido[0] == esperado[0] == 300
+        assert obtido[1] == pytest.approx(esperado[1])
+        seq, par = [(tmp_path / n).read_text(encoding="utf-8").splitlines() for n in ("seq.csv", "par.csv")]
+        assert [l.rsplit(",", 1)[0] for l in par] == [l.rsplit(",", 1)[0] for l in seq]
+        assert [float(l.rsplit(",", 1)[1]) for l in par[1:]] == [float(l.rsplit(",", 1)[1]) for l in seq[1:]]
+        assert paralelo.quantidade == sequencial.quantidade
+        for chave, resumo in sequencial.por("produto").items():
+            assert paralelo.por("produto")[chave] == pytest.approx(resumo)
+
+    def test_processar_arquivo_compacto_com_workers(self, tmp_path):
+        """Testa workers lendo pedidos compactos das linhas cruas"""
+        pedidos = gerar_pedidos(120)
+        entrada, saida = tmp_path / "pedidos.jsonl", tmp_path / "resultados.jsonl"
+        entrada.write_text("".join(json.dumps(p) + "\n" for p in pedidos), encoding="utf-8")
+
+        processar_arquivo(str(entrada), str(saida), workers=2, tamanho_lote=25, compacto=True)
+
+        linhas = [json.loads(l) for l in saida.read_text(encoding="utf-8").splitlines()]
+        assert [{k: l[k] for k in pedidos[0]} for l in linhas] == pedidos
+        assert [l["valor"] for l in linhas] == [processar_pedido(p) for p in pedidos]
@@ -8,7 +8,9 @@ import os
 # Adiciona o diretório src ao path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.services.pedido import processar_pedido
+from src.models.arredondamento import REAIS
+from src.models.calculadora import BASES, FaixasStrategy, pipeline_pedido, register_strategy, unregister_strategy
+from src.services.pedido import processar_pedido, processar_pedido_centavos, processar_lote
 
 
 # ========== Testes com pytest ==========
@@ -124,6 +126,84 @@ class TestProcessarPedidoPytest:
         assert preco == preco_esperado
 
 
+class TestProcessarLotePytest:
+    """Testes para processar_lote usando pytest"""
+
+    def test_lote_igual_ao_caminho_escalar(self):
+        """Testa que o lote reproduz exatamente processar_pedido"""
+        produtos, qtds, cupons = [], [], []
+        for produto in ["diesel", "gasolina", "etanol", "lubrificante", "invalido"]:
+            for qtd in range(0, 2000, 3):
+                for cupom in [None, "MEGA10", "NOVO5", "LUB2"]:
+                    produtos.append(produto)
+                    qtds.append(qtd)
+                    cupons.append(cupom)
+
+        precos = processar_lote(produtos, qtds, cupons)
+
+        for produto, qtd, cupom, preco in zip(produtos, qtds, cupons, precos):
+            pedido = {"cliente": "X", "produto": produto, "qtd": qtd, "cupom": cupom}
+            assert preco == processar_pedido(pedido)
+
+    def test_lote_vazio(self):
+        """Testa lote sem pedidos"""
+        assert len(processar_lote([], [], [])) == 0
+
+
+class QueroseneStrategy(FaixasStrategy):
+    """Produto novo que só declara o próprio arredondamento"""
+
+    __slots__ = ()
+    produto = "querosene"
+    arredondamento = REAIS
+
+
+class NegativoStrategy(FaixasStrategy):
+    """Estratégia que sempre calcula preço negativo"""
+
+    __slots__ = ()
+
+    def calcular_preco(self, quantidade):
+        return -1.0 * quantidade
+
+
+class TestPipelinePedidoPytest:
+    """Testes para os pedidos compilados por produto usando pytest"""
+
+    @pytest.fixture
+    def querosene(self):
+        """Registra querosene durante o teste"""
+        BASES["querosene"] = 4.37
+        register_strategy("querosene", QueroseneStrategy)
+        yield
+        unregister_strategy("querosene")
+        del BASES["querosene"]
+
+    def test_arredondamento_declarado_na_estrategia(self, querosene):
+        """Testa que um produto novo é arredondado sem alterar pedido.py"""
+        pedido = {"cliente": "X", "produto": "querosene", "qtd": 3, "cupom": None}
+        assert processar_pedido(pedido) == round(4.37 * 3, 0) == 13.0
+        assert processar_lote(["querosene"], [3]).tolist() == [13.0]
+        assert processar_pedido_centavos(pedido) == 1300
+
+    def test_pipeline_igual_a_processar_pedido(self):
+        """Testa o pedido compilado de cada produto"""
+        for produto in ["diesel", "gasolina", "etanol", "lubrificante", "invalido"]:
+            for qtd in (1, 90, 250, 700, 1500):
+                pedido = {"cliente": "X", "produto": produto, "qtd": qtd, "cupom": "MEGA10"}
+                assert pipeline_pedido(produto)(qtd, "MEGA10") == processar_pedido(pedido)
+
+    def test_preco_negativo_limitado_e_registrado(self, caplog):
+        """Testa o limite em zero e o alerta de preço negativo"""
+        register_strategy("negativo", NegativoStrategy)
+        try:
+            with caplog.at_level("WARNING", logger="petrobahia"):
+                assert processar_pedido({"cliente": "X", "produto": "negativo", "qtd": 5, "cupom": None}) == 0
+            assert "preco negativo" in caplog.text
+        finally:
+            unregister_strategy("negativo")
+
+
 # ========== Testes com unittest ==========
 
 class TestProcessarPedidoUnittest(unittest.TestCase):
@@ -0,0 +1,97 @@
+"""Testes para o registro compacto Pedido usando pytest"""
+
+import io
+import json
+import os
+import sys
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.pedido import Pedido
+from src.services.agregacao import Agregador
+from src.services.fluxo import CSV, JSONL, escrever_resultados, ler_pedidos, processar_arquivo
+from src.services.pedido import processar_pedido, processar_pedido_centavos, processar_pedidos
+
+PEDIDOS = [
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
+    {"cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
+    {"cliente": "EcoFrota", "produto": "etanol", "qtd": 50, "cupom": "NOVO5"},
+    {"cliente": "PetroPark", "produto": "lubrificante", "qtd": 12, "cupom": "LUB2"},
+]
+
+
+class TestPedidoPytest:
+    """Testes para o tipo Pedido usando pytest"""
+
+    def test_sem_dict_por_instancia(self):
+        """Testa que o registro é uma tupla, menor que o dict equivalente"""
+        pedido = Pedido.de_dict(PEDIDOS[0])
+        assert not hasattr(pedido, "__dict__")
+        assert sys.getsizeof(pedido) < sys.getsizeof(PEDIDOS[0])
+
+    def test_textos_internados(self):
+        """Testa que produto e cupom de pedidos diferentes são o mesmo objeto"""
+        a = Pedido.de_json(json.dumps(PEDIDOS[0]))
+        b = Pedido.de_csv(["Outro", "dies" + "el", "5", "MEGA" + "10"])
+        assert a.produto is b.produto
+        assert a.cupom is b.cupom
+
+    def test_construtores(self):
+        """Testa a conversão de CSV, JSON e dict"""
+        esperado = Pedido("MoveMais", "gasolina", 300, None)
+        assert Pedido.de_csv(["MoveMais", "gasolina", "300", ""]) == esperado
+        assert Pedido.de_json(json.dumps(PEDIDOS[1])) == esperado
+        assert Pedido.de_dict(PEDIDOS[1]) == esperado
+        assert Pedido.de_csv(["X", "diesel", "", ""]).qtd == 0
+
+    def test_get_como_dict(self):
+        """Testa a leitura por nome de campo"""
+        pedido = Pedido.de_dict(PEDIDOS[0])
+        assert pedido.get("produto") == "diesel"
+        assert pedido.get("valor", 0) == 0
+
+    def test_processar_pedido_aceita_pedido(self):
+        """Testa que Pedido e dict dão o mesmo valor"""
+        for dados in PEDIDOS + [{"cliente": "X", "produto": "diesel", "qtd": 0, "cupom": None}]:
+            pedido = Pedido.de_dict(dados)
+            assert processar_pedido(pedido) == processar_pedido(dados)
+            assert processar_pedido_centavos(pedido) == processar_pedido_centavos(dados)
+
+    def test_agregador_aceita_pedido(self):
+        """Testa agregação de resultados com Pedido"""
+        agregador = Agregador()
+        list(agregador.consumir(processar_pedidos(Pedido.de_dict(p) for p in PEDIDOS)))
+        assert set(agregador.por("produto")) == {"diesel", "gasolina", "etanol", "lubrificante"}
+
+
+class TestFluxoCompactoPytest:
+    """Testes para a leitura compacta de arquivos usando pytest"""
+
+    def test_ler_csv_compacto(self):
+        """Testa CSV com colunas fora de ordem"""
+        texto = "produto,qtd,cliente,cupom\ndiesel,1200,TransLog,MEGA10\ngasolina,300,MoveMais,\n"
+        pedidos = list(ler_pedidos(io.StringIO(texto), CSV, compacto=True))
+        assert pedidos == [Pedido.de_dict(PEDIDOS[0]), Pedido.de_dict(PEDIDOS[1])]
+
+    def test_ler_jsonl_compacto(self):
+        """Testa JSON lines lidas como Pedido"""
+        texto = "".join(json.dumps(p) + "\n" for p in PEDIDOS)
+        pedidos = list(ler_pedidos(io.StringIO(texto), JSONL, compacto=True))
+        assert all(type(p) is Pedido for p in pedidos)
+        assert [p._asdict() for p in pedidos] == PEDIDOS
+
+    def test_escrever_resultados_com_pedido(self):
+        """Testa que a saída JSON de Pedido é igual à de dict"""
+        saida_dict, saida_pedido = io.StringIO(), io.StringIO()
+        escrever_resultados(processar_pedidos(PEDIDOS), saida_dict, JSONL)
+        escrever_resultados(processar_pedidos(Pedido.de_dict(p) for p in PEDIDOS), saida_pedido, JSONL)
+        assert saida_pedido.getvalue() == saida_dict.getvalue()
+
+    def test_processar_arquivo_compacto(self, tmp_path):
+        """Testa o processamento de arquivo com registros compactos"""
+        entrada, saida = tmp_path / "pedidos.jsonl", tmp_path / "saida.csv"
+        entrada.write_text("".join(json.dumps(p) + "\n" for p in PEDIDOS), encoding="utf-8")
+        quantidade, total = processar_arquivo(str(entrada), str(saida), compacto=True)
+        assert quantidade == len(PEDIDOS)
+        assert total == sum(processar_pedido(p) for p in PEDIDOS)
@@ -0,0 +1,88 @@
+"""Testes para o log estruturado usando pytest"""
+
+import io
+import json
+import logging
+import os
+import sys
+
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services import pedido as pedido_service
+from src.services.pedido import processar_pedido
+from src.services.registro import configurar_log, descarregar_log, encerrar_log
+
+PEDIDO = {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"}
+
+
+@pytest.fixture
+def saida():
+    """Stream de destino do log, desconfigurado ao final"""
+    stream = io.StringIO()
+    yield stream
+    encerrar_log()
+
+
+def eventos(stream):
+    """Eventos JSON gravados no stream"""
+    return [json.loads(linha) for linha in stream.getvalue().splitlines()]
+
+
+class TestRegistroPytest:
+    """Testes para o log estruturado de pedidos usando pytest"""
+
+    def test_sem_configuracao_nao_imprime(self, capsys):
+        """Testa que processar_pedido não escreve no stdout"""
+        processar_pedido(PEDIDO)
+        assert capsys.readouterr().out == ""
+
+    def test_evento_json(self, saida):
+        """Testa o formato JSON lines do evento de pedido"""
+        configurar_log("INFO", saida)
+        valor = processar_pedido(PEDIDO)
+        descarregar_log()
+
+        [evento] = eventos(saida)
+        assert evento["evento"] == "pedido ok"
+        assert evento["nivel"] == "INFO"
+        assert evento["logger"] == "petrobahia.pedido"
+        assert evento["valor"] == valor
+        assert evento["cupom"] == "MEGA10"
+
+    def test_buffer_ate_capacidade(self, saida):
+        """Testa que os eventos só são gravados ao encher o buffer"""
+        configurar_log("INFO", saida, capacidade=3)
+        processar_pedido(PEDIDO)
+        processar_pedido(PEDIDO)
+        assert saida.getvalue() == ""
+        processar_pedido(PEDIDO)
+        assert len(eventos(saida)) == 3
+
+    def test_nivel_desabilitado_nao_formata(self, saida, monkeypatch):
+        """Testa que nenhum evento é montado abaixo do nível configurado"""
+        configurar_log("WARNING", saida)
+        chamadas = []
+        monkeypatch.setattr(pedido_service, "registrar", lambda *a, **k: chamadas.append(a))
+        processar_pedido(PEDIDO)
+        processar_pedido({**PEDIDO, "qtd": 0})
+        assert chamadas == []
+
+    def test_amostragem_mantem_avisos(self, saida):
+        """Testa que a amostragem descarta INFO mas mantém WARNING"""
+        configurar_log("DEBUG", saida, amostragem=0.0)
+        processar_pedido(PEDIDO)
+        processar_pedido({"cliente": "X", "produto": "lubrificante", "qtd": -1, "cupom": None})
+        descarregar_log()
+        assert [e["evento"] for e in eventos(saida)] == ["algo deu errado, preco negativo"]
+
+    def test_arquivo(self, tmp_path):
+        """Testa log gravado em arquivo ao encerrar"""
+        path = str(tmp_path / "pedidos.log")
+        configurar_log(logging.INFO, path)
+        processar_pedido(PEDIDO)
+        encerrar_log()
+        with open(path, encoding="utf-8") as f:
+            assert json.loads(f.readline())["cliente"] == "TransLog"
@@ -0,0 +1,190 @@
+"""Testes para o serviço de cotação asyncio usando pytest"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.pedido import processar_pedido
+from src.services import servidor
+from src.services.servidor import MicroLote, iniciar_servidor
+
+PEDIDOS = [
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
+    {"cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
+    {"cliente": "EcoFrota", "produto": "etanol", "qtd": 50, "cupom": "NOVO5"},
+    {"cliente": "PetroPark", "produto": "lubrificante", "qtd": 12, "cupom": "LUB2"},
+]
+
+
+async def conversar(porta, linhas):
+    """Envia linhas ao servidor e devolve as respostas"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+    respostas = []
+    for linha in linhas:
+        writer.write(linha.encode() + b"\n")
+        await writer.drain()
+        respostas.append(json.loads(await reader.readline()))
+    writer.close()
+    await writer.wait_closed()
+    return respostas
+
+
+async def com_servidor(funcao, **opcoes):
+    """Executa `funcao(porta, micro)` com um servidor em porta livre"""
+    servidor, micro = await iniciar_servidor(porta=0, **opcoes)
+    porta = servidor.sockets[0].getsockname()[1]
+    try:
+        return await funcao(porta, micro)
+    finally:
+        servidor.close()
+        await servidor.wait_closed()
+        await micro.parar()
+
+
+class TestServidorPytest:
+    """Testes para o servidor de linhas usando pytest"""
+
+    def test_respostas_por_pedido(self):
+        """Testa uma resposta por linha, igual a processar_pedido"""
+        async def cenario(porta, micro):
+            return await conversar(porta, [json.dumps(p) for p in PEDIDOS])
+
+        respostas = asyncio.run(com_servidor(cenario))
+        assert [r["valor"] for r in respostas] == [processar_pedido(p) for p in PEDIDOS]
+
+    def test_pedido_invalido(self):
+        """Testa erros de JSON e de validação sem derrubar a conexão"""
+        async def cenario(porta, micro):
+            return await conversar(porta, [
+                "nao é json",
+                json.dumps({"produto": "diesel", "qtd": "10"}),
+                json.dumps(PEDIDOS[0]),
+            ])
+
+        respostas = asyncio.run(com_servidor(cenario))
+        assert "erro" in respostas[0]
+        assert respostas[1] == {"erro": "qtd deve ser inteiro"}
+        assert respostas[2] == {"valor": processar_pedido(PEDIDOS[0])}
+
+    def test_concorrentes_em_micro_lotes(self):
+        """Testa que conexões concorrentes são agrupadas e observáveis"""
+        async def cenario(porta, micro):
+            await asyncio.gather(*[
+                conversar(porta, [json.dumps(p) for p in PEDIDOS]) for _ in range(20)
+            ])
+            [estatisticas] = await conversar(porta, [json.dumps({"comando": "estatisticas"})])
+            return estatisticas
+
+        estatisticas = asyncio.run(com_servidor(cenario, espera_maxima=0.01))
+        assert estatisticas["pedidos"] == 80
+        assert estatisticas["lotes"] < 80
+        assert estatisticas["latencia_p99"] >= estatisticas["latencia_p50"] > 0
+        assert estatisticas["lotes_por_segundo"] > 0
+
+
+class TestMicroLotePytest:
+    """Testes para a janela adaptativa usando pytest"""
+
+    def test_janela_adaptativa(self):
+        """Testa que a janela cresce com lotes cheios e zera com pedidos isolados"""
+        async def cenario():
+            micro = MicroLote(tamanho_maximo=4, espera_maxima=0.008)
+            micro._adaptar(4)
+            assert micro.espera == 0.001
+            micro._adaptar(4)
+            micro._adaptar(4)
+            micro._adaptar(4)
+            assert micro.espera == 0.008
+            for _ in range(4):
+                micro._adaptar(1)
+            assert micro.espera == 0.0
+
+        asyncio.run(cenario())
+
+    def test_pedido_invalido_cancelado_nao_derruba_consumidor(self):
+        """Testa que um pedido inválido cujo chamador desistiu não interrompe os lotes"""
+        async def cenario():
+            micro = MicroLote(tamanho_maximo=4, espera_maxima=0.001)
+            micro.iniciar()
+            try:
+                # Chamador desistiu (ex.: timeout de wait_for) antes do lote sair
+                futuro = asyncio.get_running_loop().create_future()
+                futuro.cancel()
+                await micro._fila.put(({"produto": "diesel", "qtd": "x"}, futuro, time.monotonic()))
+                assert await asyncio.wait_for(micro.cotar({"produto": "diesel", "qtd": 100}), 1) == 399.0
+            finally:
+                await micro.parar()
+
+        asyncio.run(cenario())
+
+    def test_falha_em_lote_nao_derruba_consumidor(self):
+        """Testa que um erro inesperado vai para os pedidos do lote e o laço continua"""
+        async def cenario():
+            micro = MicroLote(tamanho_maximo=4, espera_maxima=0.001)
+            original = micro.estatisticas.registrar_lote
+            falhas = [RuntimeError("falha")]
+
+            def registrar_lote(tamanho):
+                if falhas:
+                    raise falhas.pop()
+                original(tamanho)
+
+            micro.estatisticas.registrar_lote = registrar_lote
+            micro.iniciar()
+            try:
+                primeiro = await asyncio.wait_for(micro.cotar({"produto": "diesel", "qtd": 100}), 1)
+                assert primeiro == 399.0  # já respondido antes da falha
+                assert await asyncio.wait_for(micro.cotar({"produto": "diesel", "qtd": 200}), 1) == 798.0
+            finally:
+                await micro.parar()
+
+        asyncio.run(cenario())
+
+    def test_lote_misto_isola_pedido_ruim(self, monkeypatch):
+        """Testa que só o pedido que falha recebe o erro; os demais do lote são precificados"""
+        original = servidor.processar_lote
+
+        def processar_lote(produtos, qtds, cupons):
+            if "quebra" in produtos:
+                raise OverflowError("falha no lote")
+            return original(produtos, qtds, cupons)
+
+        monkeypatch.setattr(servidor, "processar_lote", processar_lote)
+
+        async def cenario():
+            micro = MicroLote(tamanho_maximo=8, espera_maxima=0.001)
+            laco = asyncio.get_running_loop()
+            pedidos = [
+                PEDIDOS[0],
+                {"produto": "diesel", "qtd": 10**30},
+                {"produto": "quebra", "qtd": 1},
+                PEDIDOS[1],
+            ]
+            lote = [(p, laco.create_future(), time.monotonic()) for p in pedidos]
+            micro._responder(lote)
+            futuros = [f for _, f, _ in lote]
+            assert futuros[0].result() == processar_pedido(PEDIDOS[0])
+            assert "intervalo" in str(futuros[1].exception())
+            assert isinstance(futuros[2].exception(), OverflowError)
+            assert futuros[3].result() == processar_pedido(PEDIDOS[1])
+
+        asyncio.run(cenario())
+
+    def test_qtd_fora_do_int64_pelo_servidor(self):
+        """Testa pedidos concorrentes em que um tem qtd enorme"""
+        async def cenario(porta, micro):
+            return await asyncio.gather(
+                conversar(porta, [json.dumps(PEDIDOS[0])]),
+                conversar(porta, ['{"produto": "diesel", "qtd": ' + str(10**30) + "}"]),
+                conversar(porta, [json.dumps(PEDIDOS[2])]),
+            )
+
+        respostas = asyncio.run(com_servidor(cenario, tamanho_maximo=8, espera_maxima=0.01))
+        assert respostas[0] == [{"valor": processar_pedido(PEDIDOS[0])}]
+        assert "erro" in respostas[1][0]
+        assert respostas[2] == [{"valor": processar_pedido(PEDIDOS[2])}]
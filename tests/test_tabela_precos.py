@@ -0,0 +1,108 @@
+"""Testes para o módulo Tabela de Preços usando pytest"""
+
+import os
+import pickle
+import sys
+
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.calculadora import BASES, PrecoCalculadora
+from src.models.tabela_precos import TabelaBases, TabelaPrecos, tabela_precos
+
+
+@pytest.fixture
+def bases_originais():
+    """Restaura BASES após o teste"""
+    originais = dict(BASES)
+    yield
+    BASES.substituir(originais)
+
+
+class TestTabelaPrecosPytest:
+    """Testes para TabelaPrecos usando pytest"""
+
+    def test_snapshot_imutavel(self):
+        """Testa que o snapshot não aceita escrita"""
+        tabela = tabela_precos()
+        with pytest.raises(TypeError):
+            tabela["diesel"] = 1.0
+        with pytest.raises(TypeError):
+            tabela.update({"diesel": 1.0})
+        with pytest.raises(TypeError):
+            tabela |= {"diesel": 99.0}
+        assert tabela_precos()["diesel"] == 3.99
+        assert tabela_precos().centavos["diesel"] == 399
+
+    def test_snapshot_serializavel(self):
+        """Testa que o snapshot sobrevive a pickle (uso em processos)"""
+        tabela = pickle.loads(pickle.dumps(tabela_precos()))
+        assert isinstance(tabela, TabelaPrecos)
+        assert tabela == tabela_precos()
+        assert tabela.versao == tabela_precos().versao
+
+    def test_escrita_em_bases_publica_versao(self, bases_originais):
+        """Testa que alterar BASES publica uma nova versão"""
+        anterior = tabela_precos()
+        BASES["diesel"] = 4.5
+        atual = tabela_precos()
+        assert atual.versao == anterior.versao + 1
+        assert atual["diesel"] == 4.5
+        assert anterior["diesel"] == 3.99
+
+    def test_update_publica_uma_versao(self, bases_originais):
+        """Testa que update aplica várias alterações em uma versão"""
+        versao = tabela_precos().versao
+        BASES.update({"diesel": 4.0, "gasolina": 6.0})
+        assert tabela_precos().versao == versao + 1
+
+    def test_substituir(self, bases_originais):
+        """Testa troca completa dos preços"""
+        tabela = BASES.substituir({"diesel": 1.0})
+        assert tabela is tabela_precos()
+        assert dict(tabela) == {"diesel": 1.0}
+        assert dict(BASES) == {"diesel": 1.0}
+
+
+    def test_ior_publica_versao(self, bases_originais):
+        """Testa que BASES |= {...} publica uma nova versão usada no cálculo"""
+        versao = tabela_precos().versao
+        bases = BASES
+        bases |= {"diesel": 4.99}
+        assert bases is BASES
+        assert tabela_precos().versao == versao + 1
+        assert tabela_precos()["diesel"] == 4.99
+        assert PrecoCalculadora("diesel", 100).calcular_preco() == pytest.approx(499.0)
+
+    def test_outra_tabela_bases_nao_publica(self):
+        """Testa que criar ou alterar outra TabelaBases não troca os preços vigentes"""
+        ativa = tabela_precos()
+        outra = TabelaBases({"foo": 1.0})
+        outra["bar"] = 2.0
+        outra |= {"baz": 3.0}
+        assert outra.substituir({"foo": 5.0}) == {"foo": 5.0}
+        assert tabela_precos() is ativa
+        assert pickle.loads(pickle.dumps(BASES)) == BASES
+        assert tabela_precos() is ativa
+
+
+class TestCalculadoraFixaTabelaPytest:
+    """Testes para a fixação da tabela em PrecoCalculadora usando pytest"""
+
+    def test_calculadora_fixa_versao(self, bases_originais):
+        """Testa que a calculadora usa a tabela vigente na construção"""
+        calc = PrecoCalculadora("diesel", 100)
+        versao = calc.versao
+        BASES["diesel"] = 10.0
+        assert calc.calcular_preco() == 3.99 * 100
+        assert calc.versao == versao
+        assert PrecoCalculadora("diesel", 100).calcular_preco() == 1000.0
+
+    def test_lote_com_tabela_fixada(self, bases_originais):
+        """Testa cálculo em lote com uma tabela informada"""
+        tabela = tabela_precos()
+        BASES["etanol"] = 10.0
+        precos = PrecoCalculadora.calcular_lote(["etanol"], [10], tabela=tabela)
+        assert precos[0] == 3.59 * 10
@@ -0,0 +1,141 @@
+"""Testes para as tabelas de cotações pré-calculadas usando pytest"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.calculadora import BASES, DieselStrategy, pipeline_pedido, register_strategy, unregister_strategy
+from src.services.pedido import (
+    ativar_tabelas_cotacao,
+    desativar_tabelas_cotacao,
+    processar_pedido,
+)
+
+
+@pytest.fixture
+def tabelas():
+    """Ativa tabelas pequenas durante o teste"""
+    tabelas = ativar_tabelas_cotacao(qtd_min=1, qtd_max=1200)
+    yield tabelas
+    desativar_tabelas_cotacao()
+
+
+class TestTabelasCotacaoPytest:
+    """Testes para TabelasCotacao usando pytest"""
+
+    def test_tabelas_iguais_ao_calculo(self, tabelas):
+        """Testa que toda a faixa reproduz o cálculo normal"""
+        for produto in ["diesel", "gasolina", "etanol", "lubrificante"]:
+            for cupom in [None, "MEGA10", "NOVO5", "LUB2"]:
+                for qtd in range(1, 1201, 13):
+                    valor = tabelas.consultar(produto, qtd, cupom)
+                    if produto != "lubrificante" and cupom == "LUB2":
+                        assert valor is None
+                    else:
+                        assert valor == pipeline_pedido(produto)(qtd, cupom)
+
+    def test_fora_da_faixa(self, tabelas):
+        """Testa que quantidades fora da faixa não são atendidas"""
+        assert tabelas.consultar("diesel", 1201, None) is None
+        assert tabelas.consultar("diesel", 10.5, None) is None
+        assert tabelas.consultar("invalido", 10, None) is None
+
+    def test_processar_pedido_usa_tabela_e_fallback(self, tabelas):
+        """Testa processar_pedido dentro e fora da faixa"""
+        pedido = {"cliente": "X", "produto": "diesel", "qtd": 1100, "cupom": "MEGA10"}
+        assert processar_pedido(pedido) == round(3.99 * 1100 * 0.9 * 0.9, 0)
+        pedido["qtd"] = 5000
+        assert processar_pedido(pedido) == round(3.99 * 5000 * 0.9 * 0.9, 0)
+
+    def test_reconstroi_quando_precos_mudam(self, tabelas):
+        """Testa reconstrução em fundo após alteração em BASES"""
+        original = BASES["etanol"]
+        try:
+            BASES["etanol"] = 4.0
+            # Desatualizadas: o pedido segue pelo cálculo normal até a troca
+            assert processar_pedido({"cliente": "X", "produto": "etanol", "qtd": 10, "cupom": None}) == 40.0
+            assert tabelas.aguardar(30)
+            assert tabelas.consultar("etanol", 10, None) == 40.0
+        finally:
+            BASES["etanol"] = original
+        assert tabelas.consultar("etanol", 10, None) is None
+        assert tabelas.aguardar(30)
+        assert tabelas.consultar("etanol", 10, None) == float(int(3.59 * 10 * 100) / 100.0)
+
+    def test_reconstrucao_com_muitos_cupons(self):
+        """Testa o custo da reconstrução após alterar um preço, com 300 cupons"""
+        cupons = [f"C{i}" for i in range(300)]
+        inicio = time.perf_counter()
+        tabelas = ativar_tabelas_cotacao(qtd_min=1, qtd_max=5000, cupons=cupons)
+        construcao = time.perf_counter() - inicio
+        original = BASES["diesel"]
+        try:
+            assert tabelas.tamanho_bytes == 4 * 301 * 5000 * 8
+            BASES["diesel"] = 4.0
+            pedido = {"cliente": "X", "produto": "diesel", "qtd": 100, "cupom": "C7"}
+            inicio = time.perf_counter()
+            assert processar_pedido(pedido) == 400.0
+            primeiro = time.perf_counter() - inicio
+            assert tabelas.aguardar(60)
+            assert tabelas.consultar("diesel", 100, "C7") == 400.0
+        finally:
+            BASES["diesel"] = original
+            tabelas.aguardar(60)
+            desativar_tabelas_cotacao()
+        # Antes: ~15 s para o primeiro pedido, que reconstruía tudo sozinho
+        assert primeiro < 0.1 * max(construcao, 1.0)
+
+    def test_uma_reconstrucao_por_vez(self, tabelas, monkeypatch):
+        """Testa que chamadores concorrentes não disparam reconstruções paralelas"""
+        construcoes = []
+        original_construir = tabelas.construir
+
+        def construir():
+            construcoes.append(threading.get_ident())
+            time.sleep(0.05)
+            original_construir()
+
+        monkeypatch.setattr(tabelas, "construir", construir)
+        original = BASES["gasolina"]
+        try:
+            BASES["gasolina"] = 6.0
+            threads = [threading.Thread(target=tabelas.consultar, args=("gasolina", 10, None)) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert tabelas.aguardar(30)
+        finally:
+            BASES["gasolina"] = original
+            tabelas.aguardar(30)
+        assert len(construcoes) == 1
+
+    def test_estrategia_com_desconto_escalar(self):
+        """Testa tabelas com uma estratégia que sobrescreve aplicar_desconto de forma escalar"""
+
+        class GranelStrategy(DieselStrategy):
+            __slots__ = ()
+
+            def aplicar_desconto(self, preco, cupom):
+                return preco - 50 if preco > 1000 else preco
+
+        register_strategy("granel", GranelStrategy)
+        try:
+            tabelas = ativar_tabelas_cotacao(qtd_min=1, qtd_max=600)
+            for qtd in (10, 300, 600):
+                assert tabelas.consultar("granel", qtd, None) == pipeline_pedido("granel")(qtd, None)
+                assert tabelas.consultar("diesel", qtd, "MEGA10") == pipeline_pedido("diesel")(qtd, "MEGA10")
+        finally:
+            desativar_tabelas_cotacao()
+            unregister_strategy("granel")
+
+    def test_faixa_invalida(self):
+        """Testa faixa de quantidades invertida"""
+        with pytest.raises(ValueError):
+            ativar_tabelas_cotacao(qtd_min=10, qtd_max=1)